@@ -0,0 +1,25 @@
+"""add_runs_items_ref
+
+Revision ID: 3b9d0e6a7f14
+Revises: e7a3f19c5d42
+Create Date: 2026-10-19 13:21:44.086513
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = '3b9d0e6a7f14'
+down_revision: str | None = 'e7a3f19c5d42'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('runs', sa.Column('items_ref', sa.String(length=80), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('runs', 'items_ref')
@@ -0,0 +1,23 @@
+"""add_schedules_updated_at_index
+
+Revision ID: 5b7c1d9e4a20
+Revises: 0e3e21310e66
+Create Date: 2026-10-19 09:12:41.208316
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = '5b7c1d9e4a20'
+down_revision: str | None = '0e3e21310e66'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_schedules_updated_at', 'schedules', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_schedules_updated_at', table_name='schedules')
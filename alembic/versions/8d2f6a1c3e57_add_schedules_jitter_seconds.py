@@ -0,0 +1,25 @@
+"""add_schedules_jitter_seconds
+
+Revision ID: 8d2f6a1c3e57
+Revises: 5b7c1d9e4a20
+Create Date: 2026-10-19 10:04:17.553902
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = '8d2f6a1c3e57'
+down_revision: str | None = '5b7c1d9e4a20'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('schedules', sa.Column('jitter_seconds', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('schedules', 'jitter_seconds')
@@ -0,0 +1,25 @@
+"""add_runs_profile_ref
+
+Revision ID: 9c41e2d7b05a
+Revises: 3b9d0e6a7f14
+Create Date: 2026-10-19 16:02:11.482907
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = '9c41e2d7b05a'
+down_revision: str | None = '3b9d0e6a7f14'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('runs', sa.Column('profile_ref', sa.String(length=80), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('runs', 'profile_ref')
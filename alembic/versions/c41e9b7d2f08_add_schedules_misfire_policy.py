@@ -0,0 +1,35 @@
+"""add_schedules_misfire_policy
+
+Revision ID: c41e9b7d2f08
+Revises: 8d2f6a1c3e57
+Create Date: 2026-10-19 10:52:03.117845
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = 'c41e9b7d2f08'
+down_revision: str | None = '8d2f6a1c3e57'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'schedules',
+        sa.Column(
+            'misfire_policy',
+            sa.String(length=20),
+            server_default='skip',
+            nullable=False,
+        ),
+    )
+    op.add_column('schedules', sa.Column('last_fired_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('schedules', 'last_fired_at')
+    op.drop_column('schedules', 'misfire_policy')
@@ -0,0 +1,25 @@
+"""add_runs_summary_ref
+
+Revision ID: e7a3f19c5d42
+Revises: c41e9b7d2f08
+Create Date: 2026-10-19 12:48:27.530211
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = 'e7a3f19c5d42'
+down_revision: str | None = 'c41e9b7d2f08'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('runs', sa.Column('summary_ref', sa.String(length=80), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('runs', 'summary_ref')
@@ -0,0 +1,79 @@
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any
+
+from prodapi.services.process_pool import ExecutorPool
+
+
+def cpu_work(iterations: int) -> int:
+    # Stand-in for report rendering or large JSON diffs: pure Python, holds the GIL.
+    total = 0
+    for i in range(iterations):
+        total += i * i % 7
+    return total
+
+
+async def _probe(lags: list[float], interval: float, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(loop.time() - expected, 0.0) * 1000)
+
+
+async def _measure(mode: str, jobs: int, iterations: int, pool: ExecutorPool) -> dict[str, Any]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, 0.005, stop))
+
+    started = time.perf_counter()
+    if mode == "inline":
+        for _ in range(jobs):
+            cpu_work(iterations)
+            await asyncio.sleep(0)
+    else:
+        await asyncio.gather(*(pool.run(cpu_work, iterations) for _ in range(jobs)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+    lags.sort()
+
+    return {
+        "mode": mode,
+        "jobs": jobs,
+        "wall_s": round(elapsed, 3),
+        "lag_samples": len(lags),
+        "lag_mean_ms": round(statistics.mean(lags), 3) if lags else None,
+        "lag_p99_ms": round(lags[int(len(lags) * 0.99) - 1], 3) if lags else None,
+        "lag_max_ms": round(lags[-1], 3) if lags else None,
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    pool = ExecutorPool(args.workers)
+    # Warm the workers so spawn time is not counted as loop lag.
+    await asyncio.gather(*(pool.run(cpu_work, 1) for _ in range(args.workers)))
+
+    try:
+        for mode in ("inline", "process_pool"):
+            print(json.dumps(await _measure(mode, args.jobs, args.iterations, pool)))
+    finally:
+        pool.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Event loop lag: inline vs process pool")
+    parser.add_argument("--jobs", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import argparse
+import json
+import random
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from apscheduler.triggers.cron import CronTrigger
+
+from benchmarks.scheduler_backends import COMMON_CRONS, TIMEZONES
+from prodapi.services.cron import compile_cron, next_fire_times
+
+
+def generate_pairs(count: int, seed: int) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        if rng.random() < 0.8:
+            cron = rng.choice(COMMON_CRONS)
+        else:
+            cron = f"{rng.randrange(60)} {rng.randrange(24)} * * *"
+        pairs.append((cron, rng.choice(TIMEZONES)))
+    return pairs
+
+
+def bench_parse(pairs: list[tuple[str, str]]) -> dict[str, Any]:
+    started = time.perf_counter()
+    for cron, timezone in pairs:
+        CronTrigger.from_crontab(cron, timezone=timezone)
+    uncached = time.perf_counter() - started
+
+    compile_cron.cache_clear()
+    started = time.perf_counter()
+    for cron, timezone in pairs:
+        compile_cron(cron, timezone)
+    cached = time.perf_counter() - started
+    info = compile_cron.cache_info()
+
+    return {
+        "case": "parse",
+        "parses": len(pairs),
+        "uncached_us_per_op": round(uncached / len(pairs) * 1e6, 3),
+        "cached_us_per_op": round(cached / len(pairs) * 1e6, 3),
+        "cache_hits": info.hits,
+        "cache_misses": info.misses,
+    }
+
+
+def bench_next_fire(pairs: list[tuple[str, str]], count: int) -> dict[str, Any]:
+    start = datetime.now(UTC)
+    started = time.perf_counter()
+    for cron, timezone in pairs:
+        next_fire_times(compile_cron(cron, timezone), start, count)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "case": "next_fire",
+        "schedules": len(pairs),
+        "fire_times_per_schedule": count,
+        "ms_per_schedule": round(elapsed / len(pairs) * 1000, 3),
+        "us_per_fire_time": round(elapsed / (len(pairs) * count) * 1e6, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cron parsing and next-fire microbenchmark")
+    parser.add_argument("--parses", type=int, default=100_000)
+    parser.add_argument("--previews", type=int, default=1_000)
+    parser.add_argument("--n", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    pairs = generate_pairs(args.parses, args.seed)
+    print(json.dumps(bench_parse(pairs)))
+    print(json.dumps(bench_next_fire(pairs[: args.previews], args.n)))
+
+
+if __name__ == "__main__":
+    main()
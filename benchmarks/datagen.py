@@ -0,0 +1,249 @@
+import argparse
+import asyncio
+import bisect
+import itertools
+import json
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import JSON, Table, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from prodapi.models import AutomationType, Base
+from tests.factories import (
+    build_api_key_row,
+    build_automation_row,
+    build_run_row,
+    build_schedule_row,
+)
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    seed: int = 42
+    api_keys: int = 100
+    automations: int = 5_000
+    runs: int = 1_000_000
+    days: int = 30
+    max_items: int = 500
+    # Timestamps are relative to the anchor, so seed + anchor fully determine the rows.
+    anchor: datetime = field(
+        default_factory=lambda: datetime.now(UTC).replace(
+            hour=0, minute=0, second=0, microsecond=0, tzinfo=None
+        )
+    )
+
+
+@dataclass
+class LoadReport:
+    table: str
+    rows: int
+    seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "table": self.table,
+            "rows": self.rows,
+            "seconds": round(self.seconds, 3),
+            "rows_per_s": round(self.rows / self.seconds, 1) if self.seconds else None,
+        }
+
+
+class DatasetGenerator:
+    def __init__(self, spec: DatasetSpec) -> None:
+        self.spec = spec
+        self.raw_keys: list[str] = []
+
+    def _rng(self, stream: str) -> random.Random:
+        # One stream per table, so changing --runs does not reshuffle automations.
+        return random.Random(f"{self.spec.seed}:{stream}")
+
+    def api_keys(self) -> list[dict[str, Any]]:
+        rng = self._rng("api_keys")
+        rows = []
+        self.raw_keys = []
+        for index in range(self.spec.api_keys):
+            row, raw_key = build_api_key_row(rng, index, self.spec.anchor)
+            rows.append(row)
+            self.raw_keys.append(raw_key)
+        return rows
+
+    def automations(self, owner_ids: list[UUID]) -> list[dict[str, Any]]:
+        rng = self._rng("automations")
+        # A few keys own most automations.
+        owner_weights = list(itertools.accumulate(1 / (i + 1) for i in range(len(owner_ids))))
+        owners = rng.choices(owner_ids, cum_weights=owner_weights, k=self.spec.automations)
+        return [
+            build_automation_row(rng, owner_id, index, self.spec.anchor)
+            for index, owner_id in enumerate(owners)
+        ]
+
+    def schedules(self, automations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        rng = self._rng("schedules")
+        return [
+            build_schedule_row(rng, automation["id"], self.spec.anchor)
+            for automation in automations
+            if automation["type"] == AutomationType.GITHUB_MONITOR or rng.random() < 0.5
+        ]
+
+    def runs(
+        self, automations: list[dict[str, Any]], chunk_size: int
+    ) -> Iterator[list[dict[str, Any]]]:
+        rng = self._rng("runs")
+        spec = self.spec
+        # Zipf-like: hot automations (frequent crons) own most of the history.
+        hot_first = list(automations)
+        rng.shuffle(hot_first)
+        cumulative = list(itertools.accumulate(1 / (i + 1) ** 0.8 for i in range(len(hot_first))))
+        total = cumulative[-1]
+
+        remaining = spec.runs
+        while remaining > 0:
+            size = min(chunk_size, remaining)
+            chunk = []
+            for _ in range(size):
+                index = bisect.bisect_left(cumulative, rng.random() * total)
+                automation = hot_first[min(index, len(hot_first) - 1)]
+                chunk.append(
+                    build_run_row(
+                        rng,
+                        automation["id"],
+                        automation["type"],
+                        spec.anchor,
+                        spec.days,
+                        spec.max_items,
+                    )
+                )
+            remaining -= size
+            yield chunk
+
+
+async def _copy_rows(conn: AsyncConnection, table: Table, rows: list[dict[str, Any]]) -> None:
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    assert driver is not None
+    columns = list(rows[0])
+    json_columns = {c.name for c in table.columns if isinstance(c.type, JSON)}
+    records = [
+        tuple(
+            json.dumps(row[c]) if c in json_columns and row[c] is not None else row[c]
+            for c in columns
+        )
+        for row in rows
+    ]
+    await driver.copy_records_to_table(table.name, records=records, columns=columns)
+
+
+async def write_rows(engine: AsyncEngine, table: Table, rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+    if engine.dialect.name == "postgresql" and engine.dialect.driver == "asyncpg":
+        async with engine.connect() as conn:
+            await _copy_rows(conn, table, rows)
+        return
+    async with engine.begin() as conn:
+        await conn.execute(table.insert(), rows)
+
+
+async def load_dataset(
+    engine: AsyncEngine, spec: DatasetSpec, chunk_size: int = 10_000
+) -> tuple[DatasetGenerator, list[LoadReport]]:
+    generator = DatasetGenerator(spec)
+    reports = []
+
+    async def timed(table: Table, batches: Iterator[list[dict[str, Any]]]) -> None:
+        started = time.perf_counter()
+        rows = 0
+        for batch in batches:
+            await write_rows(engine, table, batch)
+            rows += len(batch)
+        reports.append(LoadReport(table.name, rows, time.perf_counter() - started))
+
+    tables = Base.metadata.tables
+    api_keys = generator.api_keys()
+    await timed(tables["api_keys"], iter([api_keys]))
+    automations = generator.automations([row["id"] for row in api_keys])
+    await timed(tables["automations"], _chunks(automations, chunk_size))
+    await timed(tables["schedules"], _chunks(generator.schedules(automations), chunk_size))
+    await timed(tables["runs"], generator.runs(automations, chunk_size))
+
+    if engine.dialect.name == "postgresql":
+        async with engine.begin() as conn:
+            await conn.execute(text("ANALYZE api_keys, automations, schedules, runs"))
+
+    return generator, reports
+
+
+def _chunks(rows: list[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def parse_anchor(value: str) -> datetime:
+    anchor = datetime.fromisoformat(value)
+    if anchor.tzinfo is not None:
+        anchor = anchor.astimezone(UTC).replace(tzinfo=None)
+    return anchor
+
+
+async def run(args: argparse.Namespace) -> None:
+    from prodapi.config import Settings
+    from prodapi.database import build_engine
+
+    spec = DatasetSpec(
+        seed=args.seed,
+        api_keys=args.api_keys,
+        automations=args.automations,
+        runs=args.runs,
+        days=args.days,
+        max_items=args.max_items,
+        **({"anchor": parse_anchor(args.anchor)} if args.anchor else {}),
+    )
+    engine = build_engine(args.url, Settings(environment="benchmark"))
+
+    if args.create_tables:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    try:
+        generator, reports = await load_dataset(engine, spec, args.chunk_size)
+    finally:
+        await engine.dispose()
+
+    for report in reports:
+        print(json.dumps(report.to_dict()))
+    print(
+        json.dumps(
+            {
+                "seed": spec.seed,
+                "anchor": spec.anchor.isoformat(),
+                "api_key": generator.raw_keys[0] if generator.raw_keys else None,
+            }
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-load a deterministic synthetic dataset")
+    parser.add_argument("--url", required=True, help="target database URL")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--api-keys", type=int, default=100)
+    parser.add_argument("--automations", type=int, default=5_000)
+    parser.add_argument("--runs", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=30, help="history window of finished runs")
+    parser.add_argument("--max-items", type=int, default=500, help="cap on items per summary")
+    parser.add_argument("--anchor", help="ISO timestamp (UTC) the history ends at")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--create-tables", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from prodapi.config import Settings
+from prodapi.database import build_engine
+from prodapi.models import ApiKey, Automation, Base, Run, RunStatus, TriggerType
+
+
+async def _prepare(engine: AsyncEngine) -> Any:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        api_key = ApiKey(label="bench", key_hash="0" * 64)
+        session.add(api_key)
+        await session.flush()
+        automation = Automation(
+            owner_key_id=api_key.id,
+            name="bench",
+            type="daily_digest",
+            config_json={"webhook_url": "https://example.com/hook"},
+        )
+        session.add(automation)
+        await session.commit()
+        return automation.id
+
+
+async def _writer(engine: AsyncEngine, automation_id: Any, runs: int) -> tuple[int, int]:
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    ok = locked = 0
+
+    for _ in range(runs):
+        try:
+            async with session_factory() as session:
+                run = Run(
+                    automation_id=automation_id,
+                    status=RunStatus.QUEUED,
+                    triggered_by=TriggerType.MANUAL,
+                    trigger_meta={},
+                )
+                session.add(run)
+                await session.commit()
+
+                # Same lifecycle writes execute_run performs.
+                for status in (RunStatus.RUNNING, RunStatus.SUCCESS):
+                    await session.execute(
+                        update(Run).where(Run.id == run.id).values(status=status)
+                    )
+                    await session.commit()
+            ok += 1
+        except OperationalError:
+            locked += 1
+
+    return ok, locked
+
+
+async def bench_profile(
+    name: str, engine: AsyncEngine, writers: int, runs: int
+) -> dict[str, Any]:
+    automation_id = await _prepare(engine)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(_writer(engine, automation_id, runs) for _ in range(writers))
+    )
+    elapsed = time.perf_counter() - started
+    await engine.dispose()
+
+    ok = sum(r[0] for r in results)
+    locked = sum(r[1] for r in results)
+    return {
+        "profile": name,
+        "backend": engine.dialect.name,
+        "writers": writers,
+        "runs_ok": ok,
+        "runs_locked": locked,
+        "elapsed_s": round(elapsed, 3),
+        "runs_per_s": round(ok / elapsed, 1),
+    }
+
+
+async def run(url: str | None, writers: int, runs: int) -> list[dict[str, Any]]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("default", "tuned"):
+            target = url or f"sqlite+aiosqlite:///{Path(tmp) / f'{name}.db'}"
+            profile = Settings(environment="benchmark")
+            if name == "default":
+                engine = create_async_engine(target)
+            else:
+                engine = build_engine(target, profile)
+            results.append(await bench_profile(name, engine, writers, runs))
+            if url:
+                async with create_async_engine(url).begin() as conn:
+                    await conn.run_sync(Base.metadata.drop_all)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run writer throughput per engine profile")
+    parser.add_argument("--url", help="database URL (default: temporary SQLite files)")
+    parser.add_argument("--writers", type=int, default=32)
+    parser.add_argument("--runs", type=int, default=50, help="runs per writer")
+    args = parser.parse_args()
+
+    for result in asyncio.run(run(args.url, args.writers, args.runs)):
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
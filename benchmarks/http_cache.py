@@ -0,0 +1,112 @@
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+async def _seed(automations: int, items: int) -> tuple[str, Any]:
+    from prodapi.database import AsyncSessionLocal, engine
+    from prodapi.models import Automation, Base, Run, RunStatus, TriggerType
+    from prodapi.services.auth import create_api_key
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        api_key, raw_key = await create_api_key(session, "bench")
+        rows = [
+            Automation(
+                owner_key_id=api_key.id,
+                name=f"automation-{i}",
+                type="github_monitor",
+                config_json={"repos": [f"octo/repo-{i}"], "github_token": None},
+            )
+            for i in range(automations)
+        ]
+        session.add_all(rows)
+        await session.flush()
+
+        run = Run(
+            automation_id=rows[0].id,
+            status=RunStatus.SUCCESS,
+            triggered_by=TriggerType.MANUAL,
+            trigger_meta={},
+            summary_json={
+                "new_items_count": items,
+                "new_items": [
+                    {"repo": "octo/repo", "number": n, "title": f"Issue {n} title"}
+                    for n in range(items)
+                ],
+            },
+        )
+        session.add(run)
+        await session.commit()
+        return raw_key, run.id
+
+
+async def _measure(
+    client: Any, path: str, headers: dict[str, str], rounds: int
+) -> dict[str, Any]:
+    latencies = []
+    downloaded = status = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        response = await client.get(path, headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        downloaded = response.num_bytes_downloaded
+        status = response.status_code
+
+    return {
+        "status": status,
+        "bytes": downloaded,
+        "mean_ms": round(statistics.mean(latencies), 3),
+        "p95_ms": round(sorted(latencies)[int(len(latencies) * 0.95) - 1], 3),
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    from httpx import ASGITransport, AsyncClient
+
+    from prodapi.app import app
+    from prodapi.services.compression import ENCODERS
+
+    raw_key, run_id = await _seed(args.automations, args.items)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for path in ("/automations", f"/runs/{run_id}"):
+            auth = {"X-API-Key": raw_key}
+            first = await client.get(path, headers={**auth, "Accept-Encoding": "identity"})
+            etag = first.headers["ETag"]
+
+            cases: dict[str, dict[str, str]] = {"identity": {"Accept-Encoding": "identity"}}
+            for encoding in ENCODERS:
+                cases[encoding] = {"Accept-Encoding": encoding}
+            cases["if_none_match"] = {"Accept-Encoding": "identity", "If-None-Match": etag}
+
+            for case, headers in cases.items():
+                result = await _measure(client, path, {**auth, **headers}, args.rounds)
+                endpoint = path if path == "/automations" else "/runs/{id}"
+                print(json.dumps({"endpoint": endpoint, "case": case, **result}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compression and conditional GET benchmark")
+    parser.add_argument("--automations", type=int, default=200)
+    parser.add_argument("--items", type=int, default=2_000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Settings are read at import time, so the app is imported after this.
+        os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        os.environ.setdefault("ENVIRONMENT", "production")
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import json
+import time
+from typing import Any
+
+from prodapi.observability.metrics import Counter, Histogram, MetricsRegistry
+
+
+def bench_hot_path(operations: int) -> dict[str, Any]:
+    registry = MetricsRegistry()
+    histogram = registry.register(
+        Histogram("bench_latency_seconds", "Bench", labels=("method", "route", "status"))
+    )
+    counter = registry.register(Counter("bench_total", "Bench", ("type", "status")))
+
+    started = time.perf_counter()
+    for i in range(operations):
+        histogram.observe(0.001 * (i % 500), "GET", "/runs/{run_id}", "200")
+    observe = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(operations):
+        counter.inc("github_monitor", "success")
+    inc = time.perf_counter() - started
+
+    return {
+        "case": "hot_path",
+        "operations": operations,
+        "histogram_observe_ns": round(observe / operations * 1e9, 1),
+        "counter_inc_ns": round(inc / operations * 1e9, 1),
+    }
+
+
+def bench_scrape(series: int, rounds: int) -> dict[str, Any]:
+    registry = MetricsRegistry()
+    histogram = registry.register(
+        Histogram("bench_latency_seconds", "Bench", labels=("method", "route", "status"))
+    )
+    for i in range(series):
+        histogram.observe(0.01, "GET", f"/route/{i}", "200")
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        text = registry.render()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "case": "scrape",
+        "series": series,
+        "bytes": len(text),
+        "render_ms": round(elapsed / rounds * 1000, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Metrics instrumentation overhead")
+    parser.add_argument("--operations", type=int, default=1_000_000)
+    parser.add_argument("--series", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    print(json.dumps(bench_hot_path(args.operations)))
+    print(json.dumps(bench_scrape(args.series, args.rounds)))
+
+
+if __name__ == "__main__":
+    main()
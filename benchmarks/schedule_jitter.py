@@ -0,0 +1,45 @@
+import argparse
+import json
+import random
+import statistics
+from collections import Counter
+from typing import Any
+from uuid import UUID
+
+from prodapi.services.cron import jitter_offset
+
+
+def fire_histogram(schedule_ids: list[UUID], window_seconds: int) -> list[int]:
+    counts = Counter(jitter_offset(schedule_id, window_seconds) for schedule_id in schedule_ids)
+    return [counts.get(second, 0) for second in range(max(window_seconds, 1))]
+
+
+def summarize(histogram: list[int], window_seconds: int) -> dict[str, Any]:
+    return {
+        "window_seconds": window_seconds,
+        "seconds_used": sum(1 for count in histogram if count),
+        "max_per_second": max(histogram),
+        "mean_per_second": round(statistics.fmean(histogram), 2),
+        "stdev_per_second": round(statistics.pstdev(histogram), 2),
+        "histogram": histogram,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-second fire histogram for spread schedules")
+    parser.add_argument("--schedules", type=int, default=5000)
+    parser.add_argument("--windows", type=int, nargs="+", default=[0, 60, 300])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    schedule_ids = [UUID(int=rng.getrandbits(128), version=4) for _ in range(args.schedules)]
+
+    for window in args.windows:
+        result = summarize(fire_histogram(schedule_ids, window), window)
+        result["schedules"] = args.schedules
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from prodapi.services.scheduler_backends import APSchedulerBackend, HeapSchedulerBackend
+
+COMMON_CRONS = [
+    "0 * * * *",
+    "*/5 * * * *",
+    "*/15 * * * *",
+    "0 9 * * *",
+    "0 0 * * *",
+    "30 8 * * 1-5",
+    "0 */6 * * *",
+]
+TIMEZONES = ["UTC", "America/Sao_Paulo", "Europe/Berlin"]
+
+
+async def _noop(automation_ids: list[UUID]) -> None:
+    return None
+
+
+def generate_schedules(count: int, seed: int) -> list[tuple[UUID, UUID, str, str]]:
+    rng = random.Random(seed)
+    schedules = []
+    for _ in range(count):
+        if rng.random() < 0.8:
+            cron = rng.choice(COMMON_CRONS)
+        else:
+            cron = f"{rng.randrange(60)} {rng.randrange(24)} * * *"
+        schedules.append((uuid4(), uuid4(), cron, rng.choice(TIMEZONES)))
+    return schedules
+
+
+def measure_memory(build: Callable[[], Any]) -> tuple[Any, int]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    backend = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return backend, after - before
+
+
+def _apscheduler_tick(scheduler: AsyncIOScheduler, now: datetime) -> int:
+    # Mirrors AsyncIOScheduler._process_jobs without submitting to the executor.
+    jobstore = scheduler._jobstores["default"]
+    due_jobs = jobstore.get_due_jobs(now)
+    for job in due_jobs:
+        run_times = job._get_run_times(now)
+        next_run = job.trigger.get_next_fire_time(run_times[-1], now)
+        job._modify(next_run_time=next_run)
+        jobstore.update_job(job)
+    return len(due_jobs)
+
+
+async def bench_apscheduler(
+    schedules: list[tuple[UUID, UUID, str, str]], ticks: int
+) -> dict[str, Any]:
+    scheduler = AsyncIOScheduler()
+    scheduler.start(paused=True)
+
+    def build() -> APSchedulerBackend:
+        backend = APSchedulerBackend(scheduler, _noop)
+        for schedule_id, automation_id, cron, timezone in schedules:
+            backend.add(schedule_id, automation_id, cron, timezone)
+        return backend
+
+    started = time.perf_counter()
+    backend, memory = measure_memory(build)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    latencies, fired = _run_ticks(lambda now: _apscheduler_tick(scheduler, now), ticks)
+    scheduler.shutdown(wait=False)
+
+    return _result("apscheduler", backend.job_count(), memory, build_ms, latencies, fired)
+
+
+async def bench_heap(schedules: list[tuple[UUID, UUID, str, str]], ticks: int) -> dict[str, Any]:
+    def build() -> HeapSchedulerBackend:
+        backend = HeapSchedulerBackend(_noop)
+        for schedule_id, automation_id, cron, timezone in schedules:
+            backend.add(schedule_id, automation_id, cron, timezone)
+        return backend
+
+    started = time.perf_counter()
+    backend, memory = measure_memory(build)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    def tick(now: datetime) -> int:
+        return sum(len(batch) for batch in backend.pop_due(now))
+
+    latencies, fired = _run_ticks(tick, ticks)
+    result = _result("heap", backend.job_count(), memory, build_ms, latencies, fired)
+    result["groups"] = backend.group_count()
+    return result
+
+
+def _run_ticks(tick: Callable[[datetime], int], ticks: int) -> tuple[list[float], int]:
+    now = datetime.now(UTC).replace(second=0, microsecond=0)
+    latencies: list[float] = []
+    fired = 0
+    for _ in range(ticks):
+        now += timedelta(minutes=1)
+        started = time.perf_counter()
+        fired += tick(now)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies, fired
+
+
+def _result(
+    backend: str,
+    jobs: int,
+    memory: int,
+    build_ms: float,
+    latencies: list[float],
+    fired: int,
+) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    return {
+        "backend": backend,
+        "schedules": jobs,
+        "memory_bytes": memory,
+        "build_ms": round(build_ms, 2),
+        "ticks": len(latencies),
+        "fired": fired,
+        "tick_ms_mean": round(statistics.fmean(latencies), 3),
+        "tick_ms_p99": round(ordered[int(len(ordered) * 0.99) - 1], 3),
+        "tick_ms_max": round(ordered[-1], 3),
+    }
+
+
+async def run(count: int, ticks: int, seed: int) -> list[dict[str, Any]]:
+    schedules = generate_schedules(count, seed)
+    return [
+        await bench_apscheduler(schedules, ticks),
+        await bench_heap(schedules, ticks),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare APScheduler and heap cron backends")
+    parser.add_argument("--schedules", type=int, default=100_000)
+    parser.add_argument("--ticks", type=int, default=120, help="simulated minutes")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for result in asyncio.run(run(args.schedules, args.ticks, args.seed)):
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import argparse
+import json
+import time
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from prodapi.routers.runs import RUN_COLUMNS
+from prodapi.schemas.run import RunListAdapter, RunResponse
+
+
+def make_rows(count: int, items_per_run: int) -> list[SimpleNamespace]:
+    now = datetime.now(UTC)
+    rows = []
+    for i in range(count):
+        new_items = [
+            {
+                "repo": "octo/repo",
+                "type": "issue",
+                "number": n,
+                "title": f"Issue {n} opened against the main branch",
+                "url": f"https://github.com/octo/repo/issues/{n}",
+                "created_at": now.isoformat(),
+            }
+            for n in range(items_per_run)
+        ]
+        rows.append(
+            SimpleNamespace(
+                id=uuid4(),
+                automation_id=uuid4(),
+                status="success",
+                queued_at=now,
+                started_at=now,
+                ended_at=now,
+                duration_ms=120 + i,
+                summary_json={"new_items_count": items_per_run, "new_items": new_items},
+                error_text=None,
+                idempotency_key=None,
+                triggered_by="schedule",
+                trigger_meta={"scheduled": True},
+            )
+        )
+    return rows
+
+
+def model_path(rows: list[SimpleNamespace]) -> bytes:
+    # Per-row model_validate, then FastAPI's response_model validation and encoding.
+    models = [RunResponse.model_validate(r) for r in rows]
+    validated = RunListAdapter.validate_python(models)
+    return json.dumps(jsonable_encoder(validated)).encode()
+
+
+def adapter_path(rows: list[SimpleNamespace]) -> bytes:
+    runs = RunListAdapter.validate_python(rows, from_attributes=True)
+    return RunListAdapter.dump_json(runs)
+
+
+def bench(name: str, fn: Any, rows: list[SimpleNamespace], rounds: int) -> dict[str, Any]:
+    size = len(fn(rows))
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn(rows)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "case": name,
+        "rows": len(rows),
+        "columns": len(RUN_COLUMNS),
+        "bytes": size,
+        "ms_per_page": round(elapsed / rounds * 1000, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run listing serialization benchmark")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.items)
+    print(json.dumps(bench("model_validate", model_path, rows, args.rounds)))
+    print(json.dumps(bench("type_adapter", adapter_path, rows, args.rounds)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import argparse
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+GITHUB_EVENTS = ("issues", "pulls", "releases", "commits")
+REASONS = {200: "OK", 404: "Not Found", 500: "Internal Server Error"}
+
+
+@dataclass
+class StubStats:
+    github_requests: int = 0
+    webhook_deliveries: int = 0
+    webhook_failures: int = 0
+    webhook_bytes: int = 0
+    by_path: dict[str, int] = field(default_factory=dict)
+    # run_id -> time.perf_counter() of the first delivery, for end-to-end latency.
+    delivered_at: dict[str, float] = field(default_factory=dict)
+
+
+# Minimal keep-alive HTTP/1.1 server standing in for the GitHub API and webhook
+# receivers. It runs its own loop in a thread so it does not compete with the
+# event loop being measured.
+class StubServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        github_items: int = 20,
+        latency_ms: float = 0.0,
+        webhook_failure_every: int = 0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.github_items = github_items
+        self.latency = latency_ms / 1000
+        self.webhook_failure_every = webhook_failure_every
+        self.stats = StubStats()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.Server | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._bodies = {event: self._github_body(event) for event in GITHUB_EVENTS}
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def webhook_url(self, name: str = "bench") -> str:
+        return f"{self.url}/hooks/{name}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._serve, name="stub-server", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self) -> None:
+        if self._loop is not None and self._server is not None:
+            self._loop.call_soon_threadsafe(self._server.close)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def _serve(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, self.host, self.port, backlog=1024)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                method, target, _ = request_line.split(" ", 2)
+                headers = {
+                    name.strip().lower(): value.strip()
+                    for name, _, value in (line.partition(":") for line in header_lines if line)
+                }
+                body = await reader.readexactly(int(headers.get("content-length", "0")))
+
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+
+                status, payload = self._route(method, target.split("?", 1)[0], body)
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(payload)}\r\n"
+                    "X-RateLimit-Remaining: 5000\r\n"
+                    "\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _route(self, method: str, path: str, body: bytes) -> tuple[int, bytes]:
+        stats = self.stats
+        stats.by_path[path] = stats.by_path.get(path, 0) + 1
+
+        if method == "POST" and path.startswith("/hooks/"):
+            stats.webhook_deliveries += 1
+            stats.webhook_bytes += len(body)
+            run_id = json.loads(body or b"{}").get("run_id")
+            if run_id:
+                stats.delivered_at.setdefault(run_id, time.perf_counter())
+            every = self.webhook_failure_every
+            if every and stats.webhook_deliveries % every == 0:
+                stats.webhook_failures += 1
+                return 500, b'{"error": "stub failure"}'
+            return 200, b"{}"
+
+        if method == "GET" and path.startswith("/repos/"):
+            stats.github_requests += 1
+            event = path.rsplit("/", 1)[-1]
+            return 200, self._bodies.get(event, b"[]")
+
+        return 404, b'{"message": "Not Found"}'
+
+    def _github_body(self, event: str) -> bytes:
+        now = datetime.now(UTC)
+        items: list[dict[str, Any]] = []
+        for n in range(self.github_items):
+            created_at = (now - timedelta(minutes=n)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            item: dict[str, Any] = {
+                "html_url": f"https://github.com/octo/repo/{event}/{n}",
+                "user": {"login": f"user-{n % 7}"},
+            }
+            if event == "releases":
+                item.update(name=f"v1.{n}.0", published_at=created_at)
+            elif event == "commits":
+                item.update(sha=f"{n:040x}", created_at=created_at)
+            else:
+                item.update(title=f"{event} #{n}", number=n, created_at=created_at)
+            items.append(item)
+        return json.dumps(items).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Stub GitHub API and webhook receiver")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--github-items", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--webhook-failure-every", type=int, default=0)
+    args = parser.parse_args()
+
+    with StubServer(
+        port=args.port,
+        github_items=args.github_items,
+        latency_ms=args.latency_ms,
+        webhook_failure_every=args.webhook_failure_every,
+    ) as stub:
+        print(json.dumps({"stub": stub.url, "github_api_url": stub.url}))
+        try:
+            while True:
+                time.sleep(60)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
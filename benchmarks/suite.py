@@ -0,0 +1,528 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, TextIO
+from uuid import UUID, uuid4
+
+from benchmarks.stub_server import StubServer
+
+SCENARIOS = ("api", "run_latency", "webhook_fanout", "scheduler_burst", "digest")
+INSERT_CHUNK = 5_000
+
+
+@dataclass
+class Context:
+    args: argparse.Namespace
+    stub: StubServer
+    meta: dict[str, Any]
+    out: TextIO | None
+    raw_key: str = ""
+    owner_id: UUID | None = None
+    automation_id: UUID | None = None
+    run_id: UUID | None = None
+
+    def emit(self, benchmark: str, **result: Any) -> None:
+        line = json.dumps({"benchmark": benchmark, **result, **self.meta})
+        print(line, flush=True)
+        if self.out is not None:
+            self.out.write(line + "\n")
+            self.out.flush()
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(int(len(ordered) * q), len(ordered) - 1)], 3)
+
+
+def latency_summary(latencies_ms: list[float]) -> dict[str, Any]:
+    return {
+        "samples": len(latencies_ms),
+        "p50_ms": percentile(latencies_ms, 0.50),
+        "p95_ms": percentile(latencies_ms, 0.95),
+        "p99_ms": percentile(latencies_ms, 0.99),
+        "max_ms": round(max(latencies_ms), 3) if latencies_ms else None,
+    }
+
+
+@asynccontextmanager
+async def loop_lag(interval: float = 0.005) -> AsyncIterator[list[float]]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+
+    async def probe() -> None:
+        loop = asyncio.get_running_loop()
+        while not stop.is_set():
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            lags.append(max(loop.time() - expected, 0.0) * 1000)
+
+    task = asyncio.create_task(probe())
+    try:
+        yield lags
+    finally:
+        stop.set()
+        await task
+
+
+async def drain(timeout: float = 300.0) -> bool:
+    from prodapi.observability.metrics import RUN_QUEUE_DEPTH
+
+    deadline = time.perf_counter() + timeout
+    while RUN_QUEUE_DEPTH.value() > 0:
+        if time.perf_counter() > deadline:
+            return False
+        await asyncio.sleep(0.02)
+    return True
+
+
+async def wait_for(condition: Callable[[], bool], timeout: float) -> bool:
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+def monitor_config(ctx: Context) -> dict[str, Any]:
+    return {
+        "repo": "octo/repo",
+        "events": ["issues"],
+        "webhook_url": ctx.stub.webhook_url(),
+    }
+
+
+async def setup(ctx: Context) -> None:
+    from benchmarks.datagen import write_rows
+    from prodapi.database import AsyncSessionLocal, engine
+    from prodapi.models import Automation, Base
+    from prodapi.services.auth import create_api_key
+    from tests.factories import build_run_row
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as session:
+        api_key, ctx.raw_key = await create_api_key(session, "bench")
+        automations = [
+            Automation(
+                owner_key_id=api_key.id,
+                name=f"bench-{i}",
+                type="github_monitor",
+                config_json=monitor_config(ctx),
+            )
+            for i in range(ctx.args.automations)
+        ]
+        session.add_all(automations)
+        await session.commit()
+        ctx.owner_id = api_key.id
+        ctx.automation_id = automations[0].id
+
+    rng = random.Random(ctx.args.seed)
+    anchor = datetime.now(UTC).replace(tzinfo=None)
+    runs = [
+        build_run_row(rng, ctx.automation_id, "github_monitor", anchor, days=7, max_items=50)
+        for _ in range(200)
+    ]
+    await write_rows(engine, Base.metadata.tables["runs"], runs)
+    ctx.run_id = runs[0]["id"]
+
+
+async def teardown(ctx: Context) -> None:
+    from sqlalchemy import make_url
+
+    from prodapi.database import engine
+    from prodapi.models import Base
+
+    await drain(timeout=30)
+    try:
+        if ctx.args.url:
+            # Never drop tables of a database the suite was not pointed at.
+            if engine.url != make_url(ctx.args.url):
+                raise RuntimeError(
+                    f"refusing to drop tables: engine uses {engine.url!r}, "
+                    f"not --url {ctx.args.url!r}"
+                )
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+    finally:
+        await engine.dispose()
+
+
+async def bench_api(ctx: Context) -> None:
+    from httpx import ASGITransport, AsyncClient
+
+    from prodapi.app import app
+
+    args = ctx.args
+    endpoints = [
+        ("GET", "/automations", "/automations"),
+        ("GET", "/automations/{id}", f"/automations/{ctx.automation_id}"),
+        ("GET", "/runs", f"/runs?automation_id={ctx.automation_id}&limit=50"),
+        ("GET", "/runs/{id}", f"/runs/{ctx.run_id}"),
+        ("POST", "/automations/{id}/run", f"/automations/{ctx.automation_id}/run"),
+    ]
+
+    if args.base_url:
+        client = AsyncClient(base_url=args.base_url)
+    else:
+        client = AsyncClient(transport=ASGITransport(app=app), base_url="http://bench")
+
+    headers = {"X-API-Key": ctx.raw_key}
+    async with client:
+        for method, route, path in endpoints:
+            started = time.perf_counter()
+            latencies, errors = await load_endpoint(
+                client, method, path, headers, args.concurrency, args.duration
+            )
+            elapsed = time.perf_counter() - started
+            drained = await drain()
+
+            ctx.emit(
+                "api_throughput",
+                endpoint=f"{method} {route}",
+                concurrency=args.concurrency,
+                requests=len(latencies),
+                errors=errors,
+                requests_per_s=round(len(latencies) / elapsed, 1),
+                drained=drained,
+                **latency_summary(latencies),
+            )
+
+
+async def load_endpoint(
+    client: Any,
+    method: str,
+    path: str,
+    headers: dict[str, str],
+    concurrency: int,
+    duration: float,
+) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    body: dict[str, Any] | None = {} if method == "POST" else None
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = await client.request(method, path, headers=headers, json=body)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+async def bench_run_latency(ctx: Context) -> None:
+    for concurrency in ctx.args.run_concurrency:
+        await run_latency_level(ctx, concurrency)
+
+
+async def run_latency_level(ctx: Context, concurrency: int) -> None:
+    from prodapi.database import AsyncSessionLocal
+    from prodapi.models import TriggerType
+    from prodapi.services.runner import enqueue_run
+
+    args = ctx.args
+    assert ctx.automation_id is not None
+    automation_id = ctx.automation_id
+    delivered_at = ctx.stub.stats.delivered_at
+    gate = asyncio.Semaphore(concurrency)
+    enqueue_ms: list[float] = []
+    end_to_end_ms: list[float] = []
+    timeouts = 0
+
+    async def one() -> None:
+        nonlocal timeouts
+        async with gate:
+            started = time.perf_counter()
+            async with AsyncSessionLocal() as session:
+                run = await enqueue_run(
+                    session=session,
+                    automation_id=automation_id,
+                    triggered_by=TriggerType.MANUAL,
+                )
+            enqueue_ms.append((time.perf_counter() - started) * 1000)
+
+            # Completion is when the stub receives the run's webhook.
+            run_id = str(run.id)
+            if await wait_for(lambda: run_id in delivered_at, timeout=60):
+                end_to_end_ms.append((delivered_at[run_id] - started) * 1000)
+            else:
+                timeouts += 1
+
+    started = time.perf_counter()
+    async with loop_lag() as lags:
+        await asyncio.gather(*(one() for _ in range(args.runs)))
+    elapsed = time.perf_counter() - started
+
+    ctx.emit(
+        "run_latency",
+        concurrency=concurrency,
+        runs=args.runs,
+        timeouts=timeouts,
+        runs_per_s=round(args.runs / elapsed, 1),
+        enqueue_p50_ms=percentile(enqueue_ms, 0.50),
+        enqueue_p99_ms=percentile(enqueue_ms, 0.99),
+        loop_lag_max_ms=round(max(lags), 3) if lags else None,
+        **latency_summary(end_to_end_ms),
+    )
+
+
+async def bench_webhook_fanout(ctx: Context) -> None:
+    from prodapi.services.webhook import deliver_webhook
+
+    args = ctx.args
+    stats = ctx.stub.stats
+    delivered_before = stats.webhook_deliveries
+    latencies: list[float] = []
+    summary = {"new_items_count": 20, "new_items": [{"title": f"item {n}"} for n in range(20)]}
+
+    async def one() -> None:
+        started = time.perf_counter()
+        await deliver_webhook(
+            webhook_url=ctx.stub.webhook_url("fanout"),
+            automation_id=uuid4(),
+            run_id=uuid4(),
+            status="success",
+            automation_type="github_monitor",
+            summary=summary,
+            error=None,
+        )
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    async with loop_lag() as lags:
+        await asyncio.gather(*(one() for _ in range(args.webhooks)))
+    elapsed = time.perf_counter() - started
+
+    ctx.emit(
+        "webhook_fanout",
+        webhooks=args.webhooks,
+        attempts=stats.webhook_deliveries - delivered_before,
+        deliveries_per_s=round(args.webhooks / elapsed, 1),
+        wall_s=round(elapsed, 3),
+        loop_lag_max_ms=round(max(lags), 3) if lags else None,
+        **latency_summary(latencies),
+    )
+
+
+async def bench_scheduler_burst(ctx: Context) -> None:
+    from sqlalchemy import func, insert, select
+
+    from prodapi.database import AsyncSessionLocal
+    from prodapi.models import Automation, Run, RunStatus, Schedule
+    from prodapi.services.scheduler import SchedulerService
+    from prodapi.services.scheduler_backends import HeapSchedulerBackend
+
+    args = ctx.args
+    automation_ids = [uuid4() for _ in range(args.schedules)]
+
+    async with AsyncSessionLocal() as session:
+        for offset in range(0, args.schedules, INSERT_CHUNK):
+            chunk = automation_ids[offset : offset + INSERT_CHUNK]
+            await session.execute(
+                insert(Automation),
+                [
+                    {
+                        "id": automation_id,
+                        "owner_key_id": ctx.owner_id,
+                        "name": f"burst-{automation_id}",
+                        "type": "github_monitor",
+                        "config_json": monitor_config(ctx),
+                    }
+                    for automation_id in chunk
+                ],
+            )
+            await session.execute(
+                insert(Schedule),
+                [{"automation_id": automation_id, "cron": "0 * * * *"} for automation_id in chunk],
+            )
+        await session.commit()
+
+    service = SchedulerService("heap")
+    assert isinstance(service.backend, HeapSchedulerBackend)
+
+    async with AsyncSessionLocal() as session:
+        report = await service.restore_schedules(session)
+
+    delivered_before = ctx.stub.stats.webhook_deliveries
+    fire_time = datetime.now(UTC) + timedelta(hours=1, minutes=1)
+
+    started = time.perf_counter()
+    async with loop_lag() as lags:
+        batches = service.backend.pop_due(fire_time)
+        popped = time.perf_counter()
+        for batch in batches:
+            service.batcher.submit(batch)
+        service.batcher.flush_pending()
+
+        first_delivery = await wait_for(
+            lambda: ctx.stub.stats.webhook_deliveries > delivered_before, timeout=args.timeout
+        )
+        first_delivery_at = time.perf_counter()
+        # Every run has finished once the queue is empty, successfully or not.
+        completed = await drain(timeout=args.timeout)
+    finished = time.perf_counter()
+
+    async with AsyncSessionLocal() as session:
+        stmt = (
+            select(Run.status, func.count())
+            .where(Run.automation_id.in_(select(Schedule.automation_id)))
+            .group_by(Run.status)
+        )
+        by_status = dict((await session.execute(stmt)).tuples().all())
+    runs = sum(by_status.values())
+
+    ctx.emit(
+        "scheduler_burst",
+        schedules=args.schedules,
+        restore_ms=round(report.elapsed_ms, 1),
+        pop_due_ms=round((popped - started) * 1000, 3),
+        first_delivery_s=round(first_delivery_at - started, 3) if first_delivery else None,
+        complete_s=round(finished - started, 3) if completed else None,
+        runs=runs,
+        runs_success=by_status.get(RunStatus.SUCCESS, 0),
+        runs_failed=by_status.get(RunStatus.FAILED, 0),
+        runs_stuck=runs - by_status.get(RunStatus.SUCCESS, 0) - by_status.get(RunStatus.FAILED, 0),
+        webhooks_delivered=ctx.stub.stats.webhook_deliveries - delivered_before,
+        runs_per_s=round(runs / (finished - started), 1),
+        loop_lag_max_ms=round(max(lags), 3) if lags else None,
+        loop_lag_p99_ms=percentile(lags, 0.99),
+    )
+    service.shutdown()
+
+
+async def bench_digest(ctx: Context) -> None:
+    from benchmarks.datagen import DatasetSpec, load_dataset
+    from prodapi.automations.daily_digest import DailyDigestExecutor
+    from prodapi.database import engine
+
+    args = ctx.args
+    spec = DatasetSpec(
+        seed=args.seed,
+        api_keys=10,
+        automations=100,
+        runs=args.digest_runs,
+        days=7,
+        anchor=datetime.now(UTC).replace(tzinfo=None),
+    )
+    _, reports = await load_dataset(engine, spec)
+    seed_s = sum(report.seconds for report in reports)
+
+    for only_failures in (False, True):
+        config = {
+            "webhook_url": ctx.stub.webhook_url("digest"),
+            "only_failures": only_failures,
+            "max_items": 50,
+        }
+        latencies: list[float] = []
+        for _ in range(args.rounds):
+            started = time.perf_counter()
+            await DailyDigestExecutor.execute(config)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        ctx.emit(
+            "digest_query",
+            runs=args.digest_runs,
+            only_failures=only_failures,
+            seed_s=round(seed_s, 3),
+            **latency_summary(latencies),
+        )
+
+
+BENCHMARKS = {
+    "api": bench_api,
+    "run_latency": bench_run_latency,
+    "webhook_fanout": bench_webhook_fanout,
+    "scheduler_burst": bench_scheduler_burst,
+    "digest": bench_digest,
+}
+
+
+def git_revision() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+async def run(args: argparse.Namespace, stub: StubServer, out: TextIO | None) -> None:
+    from prodapi.database import engine
+
+    meta = {
+        "suite_started_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "database": engine.dialect.name,
+        "python": platform.python_version(),
+    }
+    ctx = Context(args=args, stub=stub, meta=meta, out=out)
+
+    await setup(ctx)
+    try:
+        for name in args.scenarios:
+            await BENCHMARKS[name](ctx)
+    finally:
+        await teardown(ctx)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end benchmark suite with a stub GitHub")
+    parser.add_argument("--url", help="scratch database URL, tables are dropped afterwards")
+    parser.add_argument(
+        "--base-url",
+        help="send api requests to a running server (use --url with the server's database)",
+    )
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--output", type=Path, help="append JSON lines to this file")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--automations", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=32, help="api clients")
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds per endpoint")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--run-concurrency", type=int, nargs="+", default=[1, 32])
+    parser.add_argument("--webhooks", type=int, default=1_000)
+    parser.add_argument("--schedules", type=int, default=10_000)
+    parser.add_argument("--digest-runs", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, StubServer(latency_ms=args.stub_latency_ms) as stub:
+        # Settings are read at import time, so nothing that imports prodapi (including
+        # benchmarks.datagen and tests.factories) may be imported at module level.
+        os.environ["DATABASE_URL"] = args.url or f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        os.environ["GITHUB_API_URL"] = stub.url
+        os.environ["BLOB_STORE_PATH"] = str(Path(tmp) / "blobs")
+        os.environ.setdefault("ENVIRONMENT", "production")
+
+        out = args.output.open("a", encoding="utf-8") if args.output else None
+        try:
+            asyncio.run(run(args, stub, out))
+        finally:
+            if out is not None:
+                out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -3,21 +3,42 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from prodapi.config import settings
 from prodapi.database import AsyncSessionLocal
-from prodapi.routers import api_keys, automations, health, runs, schedules
+from prodapi.middleware import (
+    ActivityMiddleware,
+    CompressionMiddleware,
+    MetricsMiddleware,
+    ReadAfterWriteMiddleware,
+    StatementBudgetMiddleware,
+    TracingMiddleware,
+)
+from prodapi.observability.loop_monitor import loop_monitor
+from prodapi.observability.tracing import tracer
+from prodapi.routers import admin, api_keys, automations, health, metrics, runs, schedules
+from prodapi.services.process_pool import executor_pool
 from prodapi.services.scheduler import scheduler_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    if settings.loop_monitor_enabled:
+        loop_monitor.start()
+    tracer.start()
+
     scheduler_service.start()
 
     async with AsyncSessionLocal() as session:
         await scheduler_service.restore_schedules(session)
 
+    scheduler_service.start_sync_loop(settings.schedule_sync_interval_seconds)
+
     yield
 
     scheduler_service.shutdown()
+    executor_pool.shutdown()
+    loop_monitor.stop()
+    await tracer.shutdown()
 
 
 app = FastAPI(
@@ -27,9 +48,41 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+if settings.loop_monitor_enabled:
+    app.add_middleware(ActivityMiddleware)
+
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
+if settings.sql_budget_enabled:
+    app.add_middleware(
+        StatementBudgetMiddleware,
+        limit=settings.sql_request_statement_budget,
+        repeat_threshold=settings.sql_repeated_statement_threshold,
+    )
+
+if settings.tracing_enabled:
+    app.add_middleware(TracingMiddleware)
+
+if settings.database_read_url and settings.read_after_write_window_seconds > 0:
+    app.add_middleware(
+        ReadAfterWriteMiddleware,
+        window_seconds=settings.read_after_write_window_seconds,
+    )
+
+if settings.response_compression_enabled:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.response_compression_min_bytes,
+    )
+
 app.include_router(health.router)
 app.include_router(api_keys.router)
 app.include_router(automations.router)
 app.include_router(runs.runs_router)
 app.include_router(runs.router)
 app.include_router(schedules.router)
+app.include_router(admin.router)
+
+if settings.metrics_enabled:
+    app.include_router(metrics.router)
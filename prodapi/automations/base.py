@@ -1,11 +1,25 @@
-from typing import Any, Protocol
+from dataclasses import dataclass
+from typing import Any, Literal, Protocol
 
 from pydantic import BaseModel
 
+ExecutionHint = Literal["io", "cpu"]
+
+
+@dataclass(frozen=True)
+class OutputBudget:
+    items_key: str
+    max_items: int
+    max_bytes: int
+
 
 class AutomationExecutor(Protocol):
+    # "cpu" executors run in the process pool instead of on the event loop.
+    execution_hint: ExecutionHint
+    output_budget: OutputBudget
+
     @staticmethod
     def validate_config(config: dict[str, Any]) -> BaseModel: ...
 
     @staticmethod
-    async def execute(config: dict[str, Any]) -> dict[str, Any]: ...
+    async def execute(config: dict[str, Any] | BaseModel) -> dict[str, Any]: ...
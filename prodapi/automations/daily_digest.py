@@ -2,6 +2,9 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field, HttpUrl
 
+from prodapi.automations.base import ExecutionHint, OutputBudget
+from prodapi.config import settings
+
 
 class DailyDigestConfig(BaseModel):
     webhook_url: HttpUrl
@@ -14,25 +17,35 @@ class DailyDigestConfig(BaseModel):
 
 
 class DailyDigestExecutor:
+    execution_hint: ExecutionHint = "io"
+    output_budget = OutputBudget(
+        items_key="failures",
+        max_items=settings.daily_digest_max_output_items,
+        max_bytes=settings.run_output_max_bytes,
+    )
+
     @staticmethod
     def validate_config(config: dict[str, Any]) -> DailyDigestConfig:
         return DailyDigestConfig.model_validate(config)
 
     @staticmethod
-    async def execute(config: dict[str, Any]) -> dict[str, Any]:
+    async def execute(config: dict[str, Any] | BaseModel) -> dict[str, Any]:
         from datetime import UTC, datetime, timedelta
 
         from sqlalchemy import select
 
-        from prodapi.database import AsyncSessionLocal
+        from prodapi.database import AsyncReadSessionLocal
         from prodapi.models import Automation, Run, RunStatus
 
-        validated = DailyDigestConfig.model_validate(config)
+        if isinstance(config, DailyDigestConfig):
+            validated = config
+        else:
+            validated = DailyDigestConfig.model_validate(config)
 
         now = datetime.now(UTC)
         window_start = now - timedelta(hours=validated.runs_window_hours)
 
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             stmt = (
                 select(Run)
                 .join(Automation)
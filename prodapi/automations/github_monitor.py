@@ -2,6 +2,11 @@ from typing import Any
 
 from pydantic import BaseModel, Field, HttpUrl, field_validator
 
+from prodapi.automations.base import ExecutionHint, OutputBudget
+from prodapi.config import settings
+from prodapi.observability.metrics import GITHUB_API_REQUESTS, GITHUB_RATELIMIT_REMAINING
+from prodapi.observability.tracing import traced_async_client
+
 
 class GitHubMonitorConfig(BaseModel):
     repo: str = Field(..., pattern=r"^[a-zA-Z0-9_-]+/[a-zA-Z0-9_-]+$")
@@ -23,19 +28,30 @@ class GitHubMonitorConfig(BaseModel):
 
 
 class GitHubMonitorExecutor:
+    execution_hint: ExecutionHint = "io"
+    output_budget = OutputBudget(
+        items_key="new_items",
+        max_items=settings.github_monitor_max_output_items,
+        max_bytes=settings.run_output_max_bytes,
+    )
+
     @staticmethod
     def validate_config(config: dict[str, Any]) -> GitHubMonitorConfig:
         return GitHubMonitorConfig.model_validate(config)
 
     @staticmethod
-    async def execute(config: dict[str, Any]) -> dict[str, Any]:
+    async def execute(config: dict[str, Any] | BaseModel) -> dict[str, Any]:
         from datetime import UTC, datetime
 
         import httpx
 
-        validated = GitHubMonitorConfig.model_validate(config)
+        if isinstance(config, GitHubMonitorConfig):
+            validated = config
+        else:
+            validated = GitHubMonitorConfig.model_validate(config)
 
-        state = validated.state
+        # A copy: the validated config may be cached and shared with later runs.
+        state = dict(validated.state)
         new_items: list[dict[str, Any]] = []
         counts_by_type: dict[str, int] = {}
 
@@ -45,8 +61,9 @@ class GitHubMonitorExecutor:
         }
         if validated.github_token:
             headers["Authorization"] = f"token {validated.github_token}"
+        auth = "token" if validated.github_token else "anonymous"
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        async with traced_async_client(timeout=30.0) as client:
             for event_type in validated.events:
                 cursor = state.get(event_type)
                 endpoint = GitHubMonitorExecutor._get_endpoint(validated.repo, event_type)
@@ -61,6 +78,10 @@ class GitHubMonitorExecutor:
                         headers=headers,
                         params=params,
                     )
+                    GITHUB_API_REQUESTS.inc(event_type, str(response.status_code))
+                    remaining = response.headers.get("X-RateLimit-Remaining")
+                    if isinstance(remaining, str) and remaining.isdigit():
+                        GITHUB_RATELIMIT_REMAINING.set(float(remaining), auth)
                     response.raise_for_status()
                     items = response.json()
 
@@ -108,6 +129,7 @@ class GitHubMonitorExecutor:
                         f"GitHub API error for {event_type}: {e.response.status_code}"
                     ) from e
                 except httpx.RequestError as e:
+                    GITHUB_API_REQUESTS.inc(event_type, "error")
                     raise ValueError(f"GitHub API request failed for {event_type}: {e}") from e
 
         return {
@@ -120,7 +142,7 @@ class GitHubMonitorExecutor:
 
     @staticmethod
     def _get_endpoint(repo: str, event_type: str) -> str:
-        base = f"https://api.github.com/repos/{repo}"
+        base = f"{settings.github_api_url.rstrip('/')}/repos/{repo}"
         endpoints = {
             "issues": f"{base}/issues",
             "pulls": f"{base}/pulls",
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -14,6 +16,15 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./prodapi.db",
         description="Database connection URL",
     )
+    database_read_url: str | None = Field(
+        default=None,
+        description="Optional read replica URL for read-only routes and the daily digest",
+    )
+    read_after_write_window_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="Reads from a client that just wrote stay on the primary for this long",
+    )
     environment: str = Field(
         default="development",
         description="Application environment",
@@ -22,6 +33,263 @@ class Settings(BaseSettings):
         default="INFO",
         description="Logging level",
     )
+    db_pool_size: int = Field(
+        default=10,
+        gt=0,
+        description="Persistent connections kept in the pool",
+    )
+    db_max_overflow: int = Field(
+        default=20,
+        ge=0,
+        description="Extra connections allowed above db_pool_size under burst",
+    )
+    db_pool_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Time to wait for a pooled connection before failing",
+    )
+    db_pool_recycle_seconds: int = Field(
+        default=1800,
+        description="Recycle connections older than this (-1 disables)",
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description="Check connection liveness on checkout",
+    )
+    db_statement_cache_size: int = Field(
+        default=500,
+        ge=0,
+        description="asyncpg prepared statement cache size per connection",
+    )
+    sqlite_journal_mode: Literal["wal", "delete", "truncate", "persist", "memory"] = Field(
+        default="wal",
+        description="SQLite journal_mode pragma",
+    )
+    sqlite_synchronous: Literal["off", "normal", "full", "extra"] = Field(
+        default="normal",
+        description="SQLite synchronous pragma",
+    )
+    sqlite_busy_timeout_ms: int = Field(
+        default=5000,
+        ge=0,
+        description="SQLite busy_timeout pragma, avoids immediate 'database is locked'",
+    )
+    sqlite_mmap_size_bytes: int = Field(
+        default=268_435_456,
+        ge=0,
+        description="SQLite mmap_size pragma",
+    )
+    scheduler_backend: Literal["apscheduler", "heap"] = Field(
+        default="apscheduler",
+        description="Cron engine: one APScheduler job per schedule or grouped min-heap",
+    )
+    schedule_batch_window_ms: int = Field(
+        default=200,
+        ge=0,
+        description="Window used to coalesce scheduled fires into one enqueue batch",
+    )
+    schedule_batch_max_size: int = Field(
+        default=500,
+        gt=0,
+        description="Maximum runs inserted per scheduled enqueue transaction",
+    )
+    schedule_default_jitter_seconds: int = Field(
+        default=0,
+        ge=0,
+        le=3600,
+        description="Spread window applied to schedules without their own jitter_seconds",
+    )
+    schedule_catchup_max_runs: int = Field(
+        default=10,
+        gt=0,
+        description="Missed ticks replayed per schedule under the run_all_bounded policy",
+    )
+    schedule_catchup_rate_per_second: float = Field(
+        default=2.0,
+        gt=0,
+        description="Rate at which catch-up runs are enqueued after a restart",
+    )
+    schedule_sync_interval_seconds: int = Field(
+        default=30,
+        ge=0,
+        description="Interval between incremental schedule syncs (0 disables the loop)",
+    )
+
+    response_compression_enabled: bool = Field(
+        default=True,
+        description="Compress JSON responses with zstd, brotli or gzip when the client accepts it",
+    )
+    response_compression_min_bytes: int = Field(
+        default=1024,
+        ge=0,
+        description="Responses smaller than this are sent uncompressed",
+    )
+
+    blob_store_path: str = Field(
+        default="./data/blobs",
+        description="Directory of the content-addressed blob store for large run outputs",
+    )
+    summary_offload_threshold_bytes: int = Field(
+        default=64 * 1024,
+        ge=0,
+        description="Run summaries larger than this move to the blob store (0 disables)",
+    )
+    run_output_max_bytes: int = Field(
+        default=256 * 1024,
+        gt=0,
+        description="Serialized size budget for the item list kept in a run summary",
+    )
+    github_api_url: str = Field(
+        default="https://api.github.com",
+        description="GitHub REST API base URL (GitHub Enterprise or a local stub)",
+    )
+    github_monitor_max_output_items: int = Field(
+        default=100,
+        gt=0,
+        description="new_items kept in a github_monitor summary and webhook",
+    )
+    daily_digest_max_output_items: int = Field(
+        default=100,
+        gt=0,
+        description="failures kept in a daily_digest summary and webhook",
+    )
+    cpu_executor_pool_size: int = Field(
+        default=2,
+        gt=0,
+        description="Worker processes for automation types with execution_hint='cpu'",
+    )
+
+    metrics_enabled: bool = Field(
+        default=True,
+        description="Expose Prometheus metrics at /metrics and time every request",
+    )
+    tracing_enabled: bool = Field(
+        default=False,
+        description="Record spans for requests, runs, SQL, outbound HTTP and webhooks",
+    )
+    tracing_exporter: Literal["file", "otlp"] = Field(
+        default="file",
+        description="Write spans as JSON lines to a file or POST them as OTLP/HTTP JSON",
+    )
+    tracing_file_path: str = Field(
+        default="./traces.jsonl",
+        description="Output file of the file span exporter",
+    )
+    tracing_otlp_endpoint: str = Field(
+        default="http://localhost:4318/v1/traces",
+        description="OTLP/HTTP traces endpoint of the collector",
+    )
+    loop_monitor_enabled: bool = Field(
+        default=False,
+        description="Measure event loop lag and log stack samples of blocking code",
+    )
+    loop_monitor_interval_ms: float = Field(
+        default=50.0,
+        gt=0,
+        description="Heartbeat interval of the loop monitor",
+    )
+    loop_monitor_slow_threshold_ms: float = Field(
+        default=100.0,
+        gt=0,
+        description="Lag at which the loop monitor logs a blocking spike",
+    )
+    run_profile_sample_interval_ms: float = Field(
+        default=5.0,
+        gt=0,
+        description="Stack sampling interval of runs triggered with profile=true",
+    )
+    api_key_last_used_resolution_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        description="Minimum interval between last_used_at writes of an API key",
+    )
+    automation_cache_enabled: bool = Field(
+        default=True,
+        description="Cache automation ownership/type/enabled for existence and owner checks",
+    )
+    automation_cache_max_entries: int = Field(
+        default=10_000,
+        gt=0,
+        description="Automations kept in the ownership cache (LRU)",
+    )
+    automation_cache_version_check_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description="Interval of the table-wide version check that picks up other replicas' writes",
+    )
+    config_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse validated executor configs across runs while the config is unchanged",
+    )
+    config_cache_max_entries: int = Field(
+        default=10_000,
+        gt=0,
+        description="Validated executor configs kept in memory (LRU)",
+    )
+    sql_budget_enabled: bool = Field(
+        default=True,
+        description="Count SQL statements per request and run and log budget overruns",
+    )
+    sql_request_statement_budget: int = Field(
+        default=8,
+        gt=0,
+        description="Statements a single HTTP request may issue before a warning is logged",
+    )
+    sql_run_statement_budget: int = Field(
+        default=12,
+        gt=0,
+        description="Statements a single run may issue before a warning is logged",
+    )
+    sql_repeated_statement_threshold: int = Field(
+        default=5,
+        gt=1,
+        description="Repetitions of one statement within a request or run logged as a likely N+1",
+    )
+    slow_query_log_enabled: bool = Field(
+        default=True,
+        description="Aggregate SQL timings by fingerprint and log statements over the threshold",
+    )
+    slow_query_threshold_ms: float = Field(
+        default=200.0,
+        gt=0,
+        description="Duration at which a statement is logged as slow",
+    )
+    slow_query_explain_sample_rate: float = Field(
+        default=0.01,
+        ge=0,
+        le=1,
+        description="Fraction of slow SELECTs re-run under EXPLAIN (ANALYZE, BUFFERS) on Postgres",
+    )
+    admin_api_key: str | None = Field(
+        default=None,
+        description="Key expected in X-Admin-Key by /admin endpoints; they 404 while unset",
+    )
+    health_cache_seconds: float = Field(
+        default=2.0,
+        ge=0,
+        description="How long /health/ready and /health/live reuse their last result",
+    )
+    health_db_timeout_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        description="Database round-trip budget of the readiness probe",
+    )
+    health_pool_saturation_threshold: float = Field(
+        default=0.9,
+        gt=0,
+        le=1,
+        description="Fraction of pool connections in use at which the replica is not ready",
+    )
+    health_max_queue_depth: int = Field(
+        default=1000,
+        gt=0,
+        description="Runs waiting for execution at which the replica is not ready",
+    )
+    health_max_loop_lag_ms: float = Field(
+        default=500.0,
+        gt=0,
+        description="Event loop lag at which the replica is not ready or live",
+    )
 
 
 settings = Settings()
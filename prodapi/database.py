@@ -1,15 +1,115 @@
+import time
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
-from typing import Any
+from typing import Annotated, Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Depends, Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+from prodapi.config import Settings, settings
+from prodapi.observability.metrics import DB_POOL_CHECKOUT_WAIT, DB_POOL_IN_USE
+from prodapi.observability.profiling import profile_engine
+from prodapi.observability.slow_queries import log_slow_queries
+from prodapi.observability.sql_budget import count_statements
+from prodapi.observability.tracing import instrument_engine
+from prodapi.services.auth import hash_api_key
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+def engine_options(url: str, profile: Settings) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "echo": profile.environment == "development",
+        "future": True,
+    }
+
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return options
+
+    options.update(
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=profile.db_pool_size,
+        max_overflow=profile.db_max_overflow,
+        pool_timeout=profile.db_pool_timeout_seconds,
+        pool_recycle=profile.db_pool_recycle_seconds,
+        pool_pre_ping=profile.db_pool_pre_ping,
+    )
+
+    if parsed.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": profile.db_statement_cache_size,
+        }
+
+    return options
 
-from prodapi.config import settings
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.environment == "development",
-    future=True,
+def build_engine(url: str, profile: Settings = settings) -> AsyncEngine:
+    engine = create_async_engine(url, **engine_options(url, profile))
+
+    if engine.dialect.name == "sqlite":
+        pragmas = [
+            f"PRAGMA journal_mode={profile.sqlite_journal_mode}",
+            f"PRAGMA synchronous={profile.sqlite_synchronous}",
+            f"PRAGMA busy_timeout={profile.sqlite_busy_timeout_ms}",
+            f"PRAGMA mmap_size={profile.sqlite_mmap_size_bytes}",
+            # Off by default in SQLite. Ownership checks are cached, so the FK is what
+            # rejects a run inserted for an automation deleted behind a stale entry.
+            "PRAGMA foreign_keys=ON",
+        ]
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def apply_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            for pragma in pragmas:
+                cursor.execute(pragma)
+            cursor.close()
+
+    return engine
+
+
+engine = build_engine(settings.database_url)
+DB_POOL_IN_USE.set_function(
+    lambda: engine.pool.checkedout() if isinstance(engine.pool, QueuePool) else 0
 )
+read_engine = (
+    build_engine(settings.database_read_url) if settings.database_read_url else engine
+)
+
+# No-op unless a profiled run is executing.
+profile_engine(engine)
+if read_engine is not engine:
+    profile_engine(read_engine)
+
+if settings.sql_budget_enabled:
+    count_statements(engine)
+    if read_engine is not engine:
+        count_statements(read_engine)
+
+if settings.slow_query_log_enabled:
+    log_slow_queries(engine)
+    if read_engine is not engine:
+        log_slow_queries(read_engine)
+
+if settings.tracing_enabled:
+    instrument_engine(engine)
+    if read_engine is not engine:
+        instrument_engine(read_engine)
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -19,7 +119,59 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+AsyncReadSessionLocal = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
+# Read-your-writes: a client that just wrote reads from the primary for a short window.
+# The cookie carries this across workers and replicas; the in-process store covers
+# clients that drop cookies, for requests landing on the same worker.
+READ_PRIMARY_COOKIE = "prodapi_read_primary"
+RECENT_WRITERS_MAX = 10_000
+
+_recent_writers: OrderedDict[str, float] = OrderedDict()
+
+
+def mark_recent_write(key_hash: str) -> None:
+    now = time.monotonic()
+    _recent_writers[key_hash] = now + settings.read_after_write_window_seconds
+    _recent_writers.move_to_end(key_hash)
+    # Deadlines grow with insertion order, so expired and excess entries sit at the front.
+    while _recent_writers and (
+        len(_recent_writers) > RECENT_WRITERS_MAX or next(iter(_recent_writers.values())) < now
+    ):
+        _recent_writers.popitem(last=False)
+
+
+def has_recent_write(key_hash: str) -> bool:
+    deadline = _recent_writers.get(key_hash)
+    return deadline is not None and deadline >= time.monotonic()
+
+
+def reads_from_primary(request: Request) -> bool:
+    if read_engine is engine or READ_PRIMARY_COOKIE in request.cookies:
+        return True
+    raw_key = request.headers.get("x-api-key")
+    return raw_key is not None and has_recent_write(hash_api_key(raw_key))
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, Any]:
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_session(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> AsyncGenerator[AsyncSession, Any]:
+    # Sessions are lazy, so reusing the primary one costs nothing when no replica is set.
+    if reads_from_primary(request):
+        yield session
+        return
+
+    async with AsyncReadSessionLocal() as read_session:
+        yield read_session
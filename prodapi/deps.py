@@ -1,14 +1,17 @@
+import secrets
 from typing import Annotated
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from prodapi.config import settings
 from prodapi.database import get_session
 from prodapi.models import ApiKey
 from prodapi.services.auth import verify_api_key
 
 
 async def get_current_api_key(
+    request: Request,
     x_api_key: Annotated[str, Header()],
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> ApiKey:
@@ -20,4 +23,18 @@ async def get_current_api_key(
             detail="Invalid or revoked API key",
         )
 
+    # Read by ReadAfterWriteMiddleware once the response is known to be successful.
+    request.state.api_key_hash = api_key.key_hash
     return api_key
+
+
+async def require_admin(x_admin_key: Annotated[str | None, Header()] = None) -> None:
+    # Admin endpoints do not exist until an admin key is configured.
+    if settings.admin_api_key is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    if x_admin_key is None or not secrets.compare_digest(x_admin_key, settings.admin_api_key):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid admin key",
+        )
@@ -0,0 +1,212 @@
+import math
+import time
+from functools import partial
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from prodapi.database import READ_PRIMARY_COOKIE, mark_recent_write
+from prodapi.observability.loop_monitor import tag_current_task
+from prodapi.observability.metrics import HTTP_REQUEST_DURATION
+from prodapi.observability.sql_budget import statement_budget
+from prodapi.observability.tracing import parse_traceparent, tracer
+from prodapi.services.compression import ENCODERS, negotiate_encoding
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    def __init__(self, send: Send, encoding: str, minimum_size: int) -> None:
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self._start: Message | None = None
+        self._chunks: list[bytes] = []
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self._passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 304)
+                or not content_type.startswith(COMPRESSIBLE_TYPES)
+            )
+            if self._passthrough:
+                await self._send(message)
+            else:
+                self._start = message
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        self._chunks.append(message.get("body", b""))
+        if message.get("more_body", False):
+            return
+
+        assert self._start is not None
+        body = b"".join(self._chunks)
+        headers = MutableHeaders(raw=self._start["headers"])
+        headers.add_vary_header("Accept-Encoding")
+
+        if len(body) >= self.minimum_size:
+            body = ENCODERS[self.encoding](body)
+            headers["Content-Encoding"] = self.encoding
+            headers["Content-Length"] = str(len(body))
+
+        await self._send(self._start)
+        await self._send({"type": "http.response.body", "body": body})
+
+
+def describe_request(scope: Scope) -> str:
+    # scope["route"] is only set once routing ran, so this is evaluated lazily.
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope["path"]
+    return f"{scope['method']} {path}"
+
+
+class ActivityMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            tag_current_task(partial(describe_request, scope))
+        await self.app(scope, receive, send)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Unmatched paths share one label so scanners cannot blow up cardinality.
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                route,
+                str(status_code),
+            )
+
+
+class StatementBudgetMiddleware:
+    def __init__(self, app: ASGIApp, limit: int, repeat_threshold: int) -> None:
+        self.app = app
+        self.limit = limit
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with statement_budget(
+            partial(describe_request, scope), self.limit, self.repeat_threshold
+        ) as budget:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                # Unmatched paths share one label, as in MetricsMiddleware.
+                if getattr(scope.get("route"), "path", None) is None:
+                    budget.scope = "unmatched"
+
+
+class TracingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        remote_parent = parse_traceparent(Headers(scope=scope).get("traceparent"))
+
+        with tracer.span(
+            f"HTTP {method}",
+            kind="server",
+            attributes={"http.method": method, "http.target": scope["path"]},
+            remote_parent=remote_parent,
+        ) as span:
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    span.name = f"{method} {route}"
+                    span.set_attribute("http.route", route)
+
+
+class ReadAfterWriteMiddleware:
+    def __init__(self, app: ASGIApp, window_seconds: float) -> None:
+        self.app = app
+        self.cookie = (
+            f"{READ_PRIMARY_COOKIE}=1; Max-Age={math.ceil(window_seconds)}; Path=/; "
+            "HttpOnly; SameSite=Lax"
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        # Shared with request.state, where get_current_api_key records the caller.
+        state = scope.setdefault("state", {})
+
+        async def send_marking_writer(message: Message) -> None:
+            # Only successful, authenticated writes pin the client to the primary.
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                key_hash = state.get("api_key_hash")
+                if key_hash is not None:
+                    mark_recent_write(key_hash)
+                    MutableHeaders(scope=message).append("Set-Cookie", self.cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_marking_writer)
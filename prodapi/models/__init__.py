@@ -2,7 +2,7 @@ from prodapi.models.api_key import ApiKey
 from prodapi.models.automation import Automation, AutomationType
 from prodapi.models.base import Base
 from prodapi.models.run import Run, RunStatus, TriggerType
-from prodapi.models.schedule import Schedule
+from prodapi.models.schedule import MisfirePolicy, Schedule
 
 __all__ = [
     "Base",
@@ -10,6 +10,7 @@ __all__ = [
     "Automation",
     "AutomationType",
     "Schedule",
+    "MisfirePolicy",
     "Run",
     "RunStatus",
     "TriggerType",
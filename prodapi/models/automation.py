@@ -36,7 +36,7 @@ class Automation(Base, UUIDMixin, TimestampMixin):
         nullable=False,
     )
 
-    owner: Mapped["ApiKey"] = relationship(lazy="joined")
+    owner: Mapped["ApiKey"] = relationship(lazy="select")
     runs: Mapped[list["Run"]] = relationship(
         back_populates="automation",
         cascade="all, delete-orphan",
@@ -40,6 +40,9 @@ class Run(Base, UUIDMixin):
     ended_at: Mapped[datetime | None] = mapped_column(nullable=True)
     duration_ms: Mapped[int | None] = mapped_column(nullable=True)
     summary_json: Mapped[dict[str, object] | None] = mapped_column(JSON, nullable=True)
+    summary_ref: Mapped[str | None] = mapped_column(String(80), nullable=True)
+    items_ref: Mapped[str | None] = mapped_column(String(80), nullable=True)
+    profile_ref: Mapped[str | None] = mapped_column(String(80), nullable=True)
     error_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     idempotency_key: Mapped[str | None] = mapped_column(String(100), nullable=True)
     triggered_by: Mapped[str] = mapped_column(String(20), nullable=False)
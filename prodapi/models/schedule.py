@@ -1,8 +1,9 @@
 from datetime import datetime
+from enum import StrEnum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from prodapi.models.base import Base, TimestampMixin, UUIDMixin
@@ -11,6 +12,12 @@ if TYPE_CHECKING:
     from prodapi.models.automation import Automation
 
 
+class MisfirePolicy(StrEnum):
+    SKIP = "skip"
+    RUN_ONCE = "run_once"
+    RUN_ALL_BOUNDED = "run_all_bounded"
+
+
 class Schedule(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "schedules"
 
@@ -21,6 +28,13 @@ class Schedule(Base, UUIDMixin, TimestampMixin):
     cron: Mapped[str] = mapped_column(String(100), nullable=False)
     timezone: Mapped[str] = mapped_column(String(50), default="UTC", nullable=False)
     enabled: Mapped[bool] = mapped_column(default=True, nullable=False)
+    jitter_seconds: Mapped[int | None] = mapped_column(nullable=True)
+    misfire_policy: Mapped[str] = mapped_column(
+        String(20),
+        default=MisfirePolicy.SKIP,
+        nullable=False,
+    )
+    last_fired_at: Mapped[datetime | None] = mapped_column(nullable=True)
     updated_at: Mapped[datetime] = mapped_column(
         default=TimestampMixin.utcnow,
         onupdate=TimestampMixin.utcnow,
@@ -29,4 +43,7 @@ class Schedule(Base, UUIDMixin, TimestampMixin):
 
     automation: Mapped["Automation"] = relationship(back_populates="schedule")
 
-    __table_args__ = (UniqueConstraint("automation_id", name="uq_schedule_automation"),)
+    __table_args__ = (
+        UniqueConstraint("automation_id", name="uq_schedule_automation"),
+        Index("ix_schedules_updated_at", "updated_at"),
+    )
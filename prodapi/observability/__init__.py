@@ -0,0 +1 @@
+"""Observabilidade: métricas de runtime e diagnóstico."""
@@ -0,0 +1,156 @@
+import asyncio
+import bisect
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from prodapi.config import settings
+
+logger = logging.getLogger(__name__)
+
+LAG_BUCKETS_MS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0)
+STACK_DEPTH = 12
+
+Activity = str | Callable[[], str]
+
+_activities: WeakKeyDictionary[asyncio.Task[Any], Activity] = WeakKeyDictionary()
+
+
+def tag_current_task(activity: Activity) -> None:
+    task = asyncio.current_task()
+    if task is not None:
+        _activities[task] = activity
+
+
+def task_activity(task: asyncio.Task[Any] | None) -> str | None:
+    if task is None:
+        return None
+    activity = _activities.get(task)
+    if activity is None:
+        return None
+    return activity() if callable(activity) else activity
+
+
+@dataclass
+class LagHistogram:
+    buckets: tuple[float, ...] = LAG_BUCKETS_MS
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LAG_BUCKETS_MS) + 1))
+    total_ms: float = 0.0
+    count: int = 0
+    max_ms: float = 0.0
+
+    def observe(self, lag_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, lag_ms)] += 1
+        self.total_ms += lag_ms
+        self.count += 1
+        self.max_ms = max(self.max_ms, lag_ms)
+
+    def cumulative(self) -> dict[str, int]:
+        result: dict[str, int] = {}
+        running = 0
+        for bound, bucket_count in zip(self.buckets, self.counts, strict=False):
+            running += bucket_count
+            result[f"{bound:g}"] = running
+        result["+Inf"] = self.count
+        return result
+
+
+@dataclass(frozen=True)
+class LagSpike:
+    at: float
+    lag_ms: float
+    activity: str | None
+    stack: list[str]
+
+
+class LoopMonitor:
+    def __init__(self, interval_ms: float, slow_threshold_ms: float) -> None:
+        self.interval = interval_ms / 1000
+        self.slow_threshold = slow_threshold_ms / 1000
+        self.histogram = LagHistogram()
+        self.spikes: deque[LagSpike] = deque(maxlen=50)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._last_beat = time.monotonic()
+        self._stall_sample: tuple[str | None, list[str]] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        if self._task is not None:
+            return
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(loop.time() - expected, 0.0)
+            self.record(lag * 1000)
+
+    def record(self, lag_ms: float) -> None:
+        self.histogram.observe(lag_ms)
+        if lag_ms < self.slow_threshold * 1000:
+            return
+
+        activity, stack = self._stall_sample or (None, [])
+        self._stall_sample = None
+        spike = LagSpike(at=time.time(), lag_ms=lag_ms, activity=activity, stack=stack)
+        self.spikes.append(spike)
+        logger.warning(
+            "Event loop blocked for %.1f ms (activity: %s)\n%s",
+            lag_ms,
+            activity or "unknown",
+            "".join(stack),
+        )
+
+    def _watch(self) -> None:
+        # Runs in its own thread so it can look at the loop while the loop is stuck.
+        period = max(self.slow_threshold / 2, 0.001)
+        while not self._stop.wait(period):
+            stalled_for = time.monotonic() - self._last_beat - self.interval
+            if stalled_for < self.slow_threshold or self._stall_sample is not None:
+                continue
+            self._stall_sample = self._sample()
+
+    def _sample(self) -> tuple[str | None, list[str]]:
+        frame = sys._current_frames().get(self._loop_thread_id or 0)
+        stack = traceback.format_stack(frame, limit=STACK_DEPTH) if frame else []
+        task = asyncio.current_task(self._loop) if self._loop is not None else None
+        return task_activity(task), stack
+
+
+loop_monitor = LoopMonitor(
+    interval_ms=settings.loop_monitor_interval_ms,
+    slow_threshold_ms=settings.loop_monitor_slow_threshold_ms,
+)
@@ -0,0 +1,255 @@
+import bisect
+import math
+from collections.abc import Callable, Iterator
+from typing import TypeVar
+
+LabelValues = tuple[str, ...]
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = labels
+
+    def _labels(self, values: LabelValues, extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape(value)}"'
+            for name, value in zip(self.label_names, values, strict=True)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        yield from self.samples()
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{self._labels(labels)} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labels)
+        self._values: dict[LabelValues, float] = {}
+        self._function: Callable[[], float] | None = None
+
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        # Evaluated at scrape time, for values that are cheaper to read than to track.
+        self._function = function
+
+    def value(self, *labels: str) -> float:
+        if self._function is not None and not labels:
+            return self._function()
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[str]:
+        if self._function is not None:
+            yield f"{self.name} {_format_value(self._function())}"
+            return
+        for labels, value in self._values.items():
+            yield f"{self.name}{self._labels(labels)} {_format_value(value)}"
+
+
+class _HistogramSeries:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = buckets
+        self._series: dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = _HistogramSeries(len(self.buckets) + 1)
+        series.counts[bisect.bisect_left(self.buckets, value)] += 1
+        series.sum += value
+        series.count += 1
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return series.count if series else 0
+
+    def samples(self) -> Iterator[str]:
+        for labels, series in self._series.items():
+            running = 0
+            for bound, bucket_count in zip(self.buckets, series.counts, strict=False):
+                running += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{self._labels(labels, le)} {running}"
+            inf = self._labels(labels, 'le="+Inf"')
+            yield f"{self.name}_bucket{inf} {series.count}"
+            yield f"{self.name}_sum{self._labels(labels)} {_format_value(series.sum)}"
+            yield f"{self.name}_count{self._labels(labels)} {series.count}"
+
+
+M = TypeVar("M", bound=Metric)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = metrics_registry.register(
+    Histogram(
+        "prodapi_http_request_duration_seconds",
+        "HTTP request latency by route template",
+        labels=("method", "route", "status"),
+    )
+)
+RUN_QUEUE_DEPTH = metrics_registry.register(
+    Gauge("prodapi_run_queue_depth", "Runs enqueued in this process that have not finished")
+)
+RUN_QUEUE_WAIT = metrics_registry.register(
+    Histogram(
+        "prodapi_run_queue_wait_seconds",
+        "Time between a run being queued and starting",
+        labels=("type",),
+        buckets=LATENCY_BUCKETS,
+    )
+)
+RUN_DURATION = metrics_registry.register(
+    Histogram(
+        "prodapi_run_duration_seconds",
+        "Executor run duration by automation type",
+        labels=("type",),
+        buckets=DURATION_BUCKETS,
+    )
+)
+RUNS_TOTAL = metrics_registry.register(
+    Counter("prodapi_runs_total", "Finished runs by automation type and status", ("type", "status"))
+)
+WEBHOOK_ATTEMPT_DURATION = metrics_registry.register(
+    Histogram(
+        "prodapi_webhook_attempt_duration_seconds",
+        "Latency of individual webhook delivery attempts",
+        labels=("outcome",),
+    )
+)
+WEBHOOK_RETRIES = metrics_registry.register(
+    Counter("prodapi_webhook_retries_total", "Webhook attempts that were retried")
+)
+WEBHOOK_DELIVERIES = metrics_registry.register(
+    Counter("prodapi_webhook_deliveries_total", "Webhook deliveries by final outcome", ("outcome",))
+)
+GITHUB_API_REQUESTS = metrics_registry.register(
+    Counter(
+        "prodapi_github_api_requests_total",
+        "GitHub API calls by event type and HTTP status",
+        ("event_type", "status"),
+    )
+)
+GITHUB_RATELIMIT_REMAINING = metrics_registry.register(
+    Gauge(
+        "prodapi_github_ratelimit_remaining",
+        "Last X-RateLimit-Remaining seen from GitHub",
+        labels=("auth",),
+    )
+)
+SCHEDULER_FIRE_LAG = metrics_registry.register(
+    Histogram(
+        "prodapi_scheduler_fire_lag_seconds",
+        "Delay between a schedule's fire time and its dispatch",
+        labels=("backend",),
+    )
+)
+DB_POOL_CHECKOUT_WAIT = metrics_registry.register(
+    Histogram(
+        "prodapi_db_pool_checkout_wait_seconds",
+        "Time spent waiting for a connection from the pool",
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+    )
+)
+SQL_STATEMENTS = metrics_registry.register(
+    Histogram(
+        "prodapi_sql_statements",
+        "SQL statements issued per request route or run",
+        labels=("scope",),
+        buckets=(1, 2, 3, 5, 10, 20, 50, 100, 500),
+    )
+)
+SQL_BUDGET_EXCEEDED = metrics_registry.register(
+    Counter(
+        "prodapi_sql_budget_exceeded_total",
+        "Requests and runs that issued more statements than their budget",
+        ("scope",),
+    )
+)
+DB_POOL_IN_USE = metrics_registry.register(
+    Gauge("prodapi_db_pool_connections_in_use", "Connections currently checked out")
+)
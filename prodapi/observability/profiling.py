@@ -0,0 +1,227 @@
+import asyncio
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+MAX_STACK_DEPTH = 40
+TOP_FUNCTIONS = 20
+TOP_STATEMENTS = 20
+MAX_HTTP_CALLS = 100
+
+_WHITESPACE = re.compile(r"\s+")
+_current_profile: ContextVar["RunProfile | None"] = ContextVar(
+    "prodapi_current_profile", default=None
+)
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_owned = False
+
+
+def current_profile() -> "RunProfile | None":
+    return _current_profile.get()
+
+
+@dataclass
+class _StatementStats:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+class RunProfile:
+    def __init__(self, sample_interval_ms: float) -> None:
+        self.interval = sample_interval_ms / 1000
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self.idle_samples = 0
+        self.statements: dict[str, _StatementStats] = {}
+        self.http_calls: list[dict[str, Any]] = []
+        self.http_count = 0
+        self.http_total_ms = 0.0
+        self.memory_peak_bytes = 0
+        self.memory_net_bytes = 0
+        self._started = 0.0
+        self._ended = 0.0
+        self._memory_start = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[Any] | None = None
+        self._thread_id = 0
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+
+    def record_sql(self, statement: str, elapsed_ms: float) -> None:
+        key = _WHITESPACE.sub(" ", statement).strip()[:300]
+        stats = self.statements.setdefault(key, _StatementStats())
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+
+    def record_http(self, method: str, url: str, status: int | None, elapsed_ms: float) -> None:
+        self.http_count += 1
+        self.http_total_ms += elapsed_ms
+        if len(self.http_calls) < MAX_HTTP_CALLS:
+            self.http_calls.append(
+                {
+                    "method": method,
+                    "url": url,
+                    "status": status,
+                    "elapsed_ms": round(elapsed_ms, 3),
+                }
+            )
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+        self._thread_id = threading.get_ident()
+        self._start_tracemalloc()
+        self._started = time.perf_counter()
+        self._sampler = threading.Thread(target=self._sample, name="run-profiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._ended = time.perf_counter()
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        self._stop_tracemalloc()
+
+    def _start_tracemalloc(self) -> None:
+        global _tracemalloc_users, _tracemalloc_owned
+        with _tracemalloc_lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracemalloc_owned = True
+            _tracemalloc_users += 1
+            # Process-wide: concurrent profiled runs share the peak.
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+
+    def _stop_tracemalloc(self) -> None:
+        global _tracemalloc_users, _tracemalloc_owned
+        with _tracemalloc_lock:
+            current, peak = tracemalloc.get_traced_memory()
+            self.memory_peak_bytes = max(peak - self._memory_start, 0)
+            self.memory_net_bytes = current - self._memory_start
+            _tracemalloc_users -= 1
+            # Leave tracing alone if something else (PYTHONTRACEMALLOC) started it.
+            if _tracemalloc_users == 0 and _tracemalloc_owned:
+                tracemalloc.stop()
+                _tracemalloc_owned = False
+
+    def _sample(self) -> None:
+        # Runs in its own thread; a sample only counts while the run's task is
+        # the one executing on the loop, so other requests do not pollute it.
+        while not self._stop.wait(self.interval):
+            if self._loop is None or asyncio.current_task(self._loop) is not self._task:
+                self.idle_samples += 1
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            self.samples += 1
+            self.stacks[_fold(frame)] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        self_samples: Counter[str] = Counter()
+        total_samples: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(";")
+            self_samples[frames[-1]] += count
+            for function in set(frames):
+                total_samples[function] += count
+
+        statements = sorted(self.statements.items(), key=lambda kv: kv[1].total_ms, reverse=True)
+        return {
+            "duration_ms": round((self._ended - self._started) * 1000, 3),
+            "sample_interval_ms": self.interval * 1000,
+            "samples": self.samples,
+            "idle_samples": self.idle_samples,
+            "stacks": [
+                {"stack": stack, "samples": count} for stack, count in self.stacks.most_common()
+            ],
+            "functions": [
+                {
+                    "function": function,
+                    "self_samples": count,
+                    "total_samples": total_samples[function],
+                }
+                for function, count in self_samples.most_common(TOP_FUNCTIONS)
+            ],
+            "sql_count": sum(stats.count for stats in self.statements.values()),
+            "sql_total_ms": round(sum(s.total_ms for s in self.statements.values()), 3),
+            "sql_statements": [
+                {
+                    "statement": statement,
+                    "count": stats.count,
+                    "total_ms": round(stats.total_ms, 3),
+                    "max_ms": round(stats.max_ms, 3),
+                }
+                for statement, stats in statements[:TOP_STATEMENTS]
+            ],
+            "http_count": self.http_count,
+            "http_total_ms": round(self.http_total_ms, 3),
+            "http_calls": self.http_calls,
+            "memory_peak_bytes": self.memory_peak_bytes,
+            "memory_net_bytes": self.memory_net_bytes,
+        }
+
+
+def _fold(frame: FrameType) -> str:
+    frames: list[str] = []
+    current: FrameType | None = frame
+    while current is not None and len(frames) < MAX_STACK_DEPTH:
+        code = current.f_code
+        # Everything above the callback that resumed the task is event loop machinery.
+        if code.co_name == "_run" and code.co_filename.endswith("events.py"):
+            break
+        frames.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+        current = current.f_back
+    return ";".join(reversed(frames))
+
+
+@contextmanager
+def profiled(profile: RunProfile | None) -> Iterator[RunProfile | None]:
+    if profile is None:
+        yield None
+        return
+
+    token = _current_profile.set(profile)
+    profile.start()
+    try:
+        yield profile
+    finally:
+        profile.stop()
+        _current_profile.reset(token)
+
+
+def profile_engine(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def start_statement(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        if _current_profile.get() is not None:
+            context._prodapi_profile_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def end_statement(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        profile = _current_profile.get()
+        started = getattr(context, "_prodapi_profile_started", None)
+        if profile is not None and started is not None:
+            profile.record_sql(statement, (time.perf_counter() - started) * 1000)
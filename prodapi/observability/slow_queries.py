@@ -0,0 +1,179 @@
+import functools
+import logging
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from prodapi.config import Settings, settings
+from prodapi.observability.sql_budget import current_scope
+
+logger = logging.getLogger(__name__)
+
+MAX_FINGERPRINTS = 500
+MAX_PLAN_CHARS = 20_000
+
+_NORMALIZERS = (
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+\b"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)"), "(...)"),
+    (re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+"), "(...), ..."),
+    (re.compile(r"\s+"), " "),
+)
+
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    # Literals, bind placeholders and IN/VALUES lists of any length collapse, so
+    # the same query shape aggregates regardless of arguments or driver paramstyle.
+    for pattern, replacement in _NORMALIZERS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+def _redact_value(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, str | bytes):
+        return f"<{type(value).__name__}:{len(value)}>"
+    return f"<{type(value).__name__}>"
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> Any:
+    if executemany and isinstance(parameters, list | tuple):
+        first = redact_parameters(parameters[0]) if parameters else None
+        return {"rows": len(parameters), "first": first}
+    if isinstance(parameters, dict):
+        return {name: _redact_value(value) for name, value in parameters.items()}
+    if isinstance(parameters, list | tuple):
+        return [_redact_value(value) for value in parameters]
+    return _redact_value(parameters)
+
+
+@dataclass
+class QueryStats:
+    fingerprint: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    slow_calls: int = 0
+    sources: Counter[str] = field(default_factory=Counter)
+    last_plan: str | None = None
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class QueryStatsRegistry:
+    def __init__(self, max_fingerprints: int = MAX_FINGERPRINTS) -> None:
+        self.max_fingerprints = max_fingerprints
+        self.stats: dict[str, QueryStats] = {}
+        self.dropped = 0
+
+    def record(
+        self, key: str, elapsed_ms: float, slow: bool, source: str | None
+    ) -> QueryStats | None:
+        stats = self.stats.get(key)
+        if stats is None:
+            # Bounded: a flood of unique shapes (e.g. un-parameterized SQL) must not grow memory.
+            if len(self.stats) >= self.max_fingerprints:
+                self.dropped += 1
+                return None
+            stats = self.stats[key] = QueryStats(key)
+        stats.calls += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        if slow:
+            stats.slow_calls += 1
+        stats.sources[source or "unknown"] += 1
+        return stats
+
+    def top(self, order_by: str = "total_ms", limit: int = 20) -> list[QueryStats]:
+        ranked = sorted(self.stats.values(), key=lambda s: getattr(s, order_by), reverse=True)
+        return ranked[:limit]
+
+    def reset(self) -> None:
+        self.stats.clear()
+        self.dropped = 0
+
+
+query_stats = QueryStatsRegistry()
+
+
+def _explain(conn: Any, statement: str, parameters: Any) -> str:
+    # A fresh DBAPI cursor: re-using the original one would discard its result rows.
+    # The savepoint keeps a failed EXPLAIN from aborting the caller's transaction.
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SAVEPOINT prodapi_explain")
+        try:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+        except Exception:
+            cursor.execute("ROLLBACK TO SAVEPOINT prodapi_explain")
+            raise
+        cursor.execute("RELEASE SAVEPOINT prodapi_explain")
+        return plan[:MAX_PLAN_CHARS]
+    finally:
+        cursor.close()
+
+
+def log_slow_queries(
+    engine: AsyncEngine,
+    registry: QueryStatsRegistry = query_stats,
+    profile: Settings = settings,
+) -> None:
+    sync_engine = engine.sync_engine
+    can_explain = engine.dialect.name == "postgresql"
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def start_statement(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        context._prodapi_slow_query_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def end_statement(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        started = getattr(context, "_prodapi_slow_query_started", None)
+        if started is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        slow = elapsed_ms >= profile.slow_query_threshold_ms
+        key = fingerprint(statement)
+        source = current_scope()
+        stats = registry.record(key, elapsed_ms, slow, source)
+        if not slow:
+            return
+
+        logger.warning(
+            "Slow query %.1f ms in %s [%s] params=%s",
+            elapsed_ms,
+            source or "unknown",
+            key[:1000],
+            redact_parameters(parameters, executemany),
+        )
+
+        # ANALYZE executes the statement again, so only ever sample read-only selects.
+        if (
+            can_explain
+            and not executemany
+            and statement.lstrip()[:6].upper() == "SELECT"
+            and random.random() < profile.slow_query_explain_sample_rate
+        ):
+            try:
+                plan = _explain(conn, statement, parameters)
+            except Exception:
+                logger.exception("EXPLAIN failed for [%s]", key[:1000])
+                return
+            if stats is not None:
+                stats.last_plan = plan
+            logger.warning("EXPLAIN (ANALYZE, BUFFERS) for [%s]:\n%s", key[:1000], plan)
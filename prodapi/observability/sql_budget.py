@@ -0,0 +1,135 @@
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from prodapi.observability.metrics import SQL_BUDGET_EXCEEDED, SQL_STATEMENTS
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_active_budgets: ContextVar[tuple["StatementBudget", ...]] = ContextVar(
+    "prodapi_statement_budgets", default=()
+)
+
+
+@dataclass
+class StatementBudget:
+    # Callables are resolved lazily, e.g. a request's route is only known once routing ran.
+    name: str | Callable[[], str]
+    limit: int | None = None
+    repeat_threshold: int | None = None
+    # Metrics label; name may carry ids that would blow up cardinality.
+    scope: str | None = None
+    count: int = 0
+    total_ms: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.statements[_WHITESPACE.sub(" ", statement).strip()] += 1
+
+    @property
+    def label(self) -> str:
+        return self.name if isinstance(self.name, str) else self.name()
+
+    @property
+    def exceeded(self) -> bool:
+        return self.limit is not None and self.count > self.limit
+
+    def repeated(self) -> list[tuple[str, int]]:
+        # The same statement issued over and over in one scope is the N+1 signature.
+        if self.repeat_threshold is None:
+            return []
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= self.repeat_threshold
+        ]
+
+    def describe(self) -> str:
+        lines = [f"{self.count} statements in {self.total_ms:.1f} ms for {self.label}:"]
+        lines += [f"  {count}x {statement}" for statement, count in self.statements.most_common()]
+        return "\n".join(lines)
+
+
+def current_budgets() -> tuple[StatementBudget, ...]:
+    return _active_budgets.get()
+
+
+def current_scope() -> str | None:
+    budgets = _active_budgets.get()
+    if not budgets:
+        return None
+    return budgets[-1].scope or budgets[-1].label
+
+
+@contextmanager
+def statement_budget(
+    name: str | Callable[[], str],
+    limit: int | None = None,
+    repeat_threshold: int | None = None,
+    scope: str | None = None,
+    isolated: bool = False,
+    report: bool = True,
+) -> Iterator[StatementBudget]:
+    # Budgets nest: a statement counts towards every enclosing one, unless the
+    # scope is isolated (background runs must not leak into the request that
+    # spawned them).
+    budget = StatementBudget(name, limit, repeat_threshold, scope)
+    parents = () if isolated else _active_budgets.get()
+    token = _active_budgets.set((*parents, budget))
+    try:
+        yield budget
+    finally:
+        _active_budgets.reset(token)
+        if report:
+            report_budget(budget)
+
+
+def report_budget(budget: StatementBudget) -> None:
+    scope = budget.scope or budget.label
+    SQL_STATEMENTS.observe(budget.count, scope)
+    if budget.exceeded:
+        SQL_BUDGET_EXCEEDED.inc(scope)
+        logger.warning(
+            "SQL budget exceeded: %d statements (budget %d, %.1f ms) for %s",
+            budget.count,
+            budget.limit,
+            budget.total_ms,
+            budget.label,
+        )
+    for statement, count in budget.repeated():
+        logger.warning("Possible N+1: %dx in %s: %s", count, budget.label, statement[:300])
+
+
+def count_statements(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def start_statement(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        if _active_budgets.get():
+            context._prodapi_budget_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def end_statement(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        budgets = _active_budgets.get()
+        started = getattr(context, "_prodapi_budget_started", None)
+        if not budgets or started is None:
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for budget in budgets:
+            budget.record(statement, elapsed_ms)
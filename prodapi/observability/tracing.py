@@ -0,0 +1,368 @@
+import asyncio
+import functools
+import json
+import logging
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal, ParamSpec, Protocol, TypeVar
+
+import httpx
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from prodapi.config import Settings, settings
+from prodapi.observability.profiling import current_profile
+
+logger = logging.getLogger(__name__)
+
+SpanKind = Literal["internal", "server", "client"]
+P = ParamSpec("P")
+R = TypeVar("R")
+
+OTLP_SPAN_KINDS = {"internal": 1, "server": 2, "client": 3}
+MAX_BUFFERED_SPANS = 10_000
+FLUSH_INTERVAL_SECONDS = 1.0
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    kind: SpanKind = "internal"
+    start_ns: int = 0
+    end_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: Literal["ok", "error"] = "ok"
+    recording: bool = True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.recording:
+            self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        if self.recording:
+            self.status = "error"
+            self.attributes["error"] = repr(error)[:300]
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+NOOP_SPAN = Span(name="", trace_id="0" * 32, span_id="0" * 16, parent_id=None, recording=False)
+
+_current_span: ContextVar[Span | None] = ContextVar("prodapi_current_span", default=None)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str] | None:
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return parts[1], parts[2]
+
+
+class SpanExporter(Protocol):
+    def export(self, spans: list[Span]) -> None: ...
+
+
+class FileSpanExporter:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def export(self, spans: list[Span]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.writelines(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+
+
+class OTLPHttpSpanExporter:
+    def __init__(self, endpoint: str, service_name: str = "prodapi") -> None:
+        self.endpoint = endpoint
+        self.service_name = service_name
+
+    def export(self, spans: list[Span]) -> None:
+        try:
+            response = httpx.post(self.endpoint, json=self.payload(spans), timeout=5.0)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning("Dropping %d spans, OTLP export failed: %s", len(spans), e)
+
+    def payload(self, spans: list[Span]) -> dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [_otlp_attribute("service.name", self.service_name)]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "prodapi"},
+                            "spans": [_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _otlp_span(span: Span) -> dict[str, Any]:
+    otlp: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": OTLP_SPAN_KINDS[span.kind],
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [_otlp_attribute(k, v) for k, v in span.attributes.items()],
+        "status": {"code": 2 if span.status == "error" else 1},
+    }
+    if span.parent_id:
+        otlp["parentSpanId"] = span.parent_id
+    return otlp
+
+
+class Tracer:
+    def __init__(self, exporter: SpanExporter | None) -> None:
+        self.exporter = exporter
+        self._buffer: deque[Span] = deque(maxlen=MAX_BUFFERED_SPANS)
+        self._flush_task: asyncio.Task[None] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = "internal",
+        attributes: dict[str, Any] | None = None,
+        remote_parent: tuple[str, str] | None = None,
+    ) -> Span:
+        if self.exporter is None:
+            return NOOP_SPAN
+
+        parent = _current_span.get()
+        if parent is not None and parent.recording:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        elif remote_parent is not None:
+            trace_id, parent_id = remote_parent
+        else:
+            trace_id, parent_id = os.urandom(16).hex(), None
+
+        return Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent_id,
+            kind=kind,
+            start_ns=time.time_ns(),
+            attributes=attributes or {},
+        )
+
+    def end_span(self, span: Span) -> None:
+        if span.recording:
+            span.end_ns = time.time_ns()
+            self._buffer.append(span)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: SpanKind = "internal",
+        attributes: dict[str, Any] | None = None,
+        remote_parent: tuple[str, str] | None = None,
+    ) -> Iterator[Span]:
+        span = self.start_span(name, kind, attributes, remote_parent)
+        if not span.recording:
+            yield span
+            return
+
+        # Tasks created inside this block copy the context, so detached work
+        # (execute_run_background, deliver_webhook) becomes a child span.
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def start(self) -> None:
+        if self.exporter is not None and self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def shutdown(self) -> None:
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        if self.exporter is None or not self._buffer:
+            return
+        batch = list(self._buffer)
+        self._buffer.clear()
+        await asyncio.to_thread(self.exporter.export, batch)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Span export failed")
+
+
+def traced(
+    name: str,
+) -> Callable[[Callable[P, Coroutine[Any, Any, R]]], Callable[P, Coroutine[Any, Any, R]]]:
+    def decorator(fn: Callable[P, Coroutine[Any, Any, R]]) -> Callable[P, Coroutine[Any, Any, R]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with tracer.span(name):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        profile = current_profile()
+        started = time.perf_counter()
+        status: int | None = None
+        try:
+            response = await self._send(request)
+            status = response.status_code
+            return response
+        finally:
+            if profile is not None:
+                profile.record_http(
+                    request.method,
+                    f"{request.url.scheme}://{request.url.host}{request.url.path}",
+                    status,
+                    (time.perf_counter() - started) * 1000,
+                )
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        # Outbound calls are only traced as part of an existing trace.
+        if current_span() is None:
+            return await self.transport.handle_async_request(request)
+
+        with tracer.span(
+            f"HTTP {request.method}",
+            kind="client",
+            attributes={"http.method": request.method, "http.host": request.url.host},
+        ) as span:
+            request.headers["traceparent"] = span.traceparent
+            response = await self.transport.handle_async_request(request)
+            span.set_attribute("http.status_code", response.status_code)
+            return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def traced_async_client(**kwargs: Any) -> httpx.AsyncClient:
+    if not tracer.enabled and current_profile() is None:
+        return httpx.AsyncClient(**kwargs)
+    return httpx.AsyncClient(transport=TracingTransport(), **kwargs)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+    system = engine.dialect.name
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def start_sql_span(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        if current_span() is None:
+            return
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+        context._prodapi_span = tracer.start_span(
+            f"SQL {operation}",
+            kind="client",
+            attributes={"db.system": system, "db.statement": statement[:500]},
+        )
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def end_sql_span(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        span = getattr(context, "_prodapi_span", None)
+        if span is not None:
+            context._prodapi_span = None
+            span.set_attribute("db.rowcount", cursor.rowcount)
+            tracer.end_span(span)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def fail_sql_span(exception_context: ExceptionContext) -> None:
+        context: Any = exception_context.execution_context
+        span = getattr(context, "_prodapi_span", None)
+        if span is not None:
+            context._prodapi_span = None
+            span.record_error(exception_context.original_exception)
+            tracer.end_span(span)
+
+
+def create_exporter(profile: Settings) -> SpanExporter | None:
+    if not profile.tracing_enabled:
+        return None
+    if profile.tracing_exporter == "otlp":
+        return OTLPHttpSpanExporter(profile.tracing_otlp_endpoint)
+    return FileSpanExporter(Path(profile.tracing_file_path))
+
+
+tracer = Tracer(create_exporter(settings))
@@ -0,0 +1,42 @@
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Query, status
+
+from prodapi.config import settings
+from prodapi.deps import require_admin
+from prodapi.observability.slow_queries import query_stats
+from prodapi.schemas.admin import QueryFingerprintResponse, QueryStatsResponse
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/queries", response_model=QueryStatsResponse)
+async def top_queries(
+    order_by: Annotated[
+        Literal["total_ms", "mean_ms", "max_ms", "calls", "slow_calls"], Query()
+    ] = "total_ms",
+    limit: int = Query(20, ge=1, le=200),
+) -> QueryStatsResponse:
+    return QueryStatsResponse(
+        threshold_ms=settings.slow_query_threshold_ms,
+        fingerprints=len(query_stats.stats),
+        dropped=query_stats.dropped,
+        queries=[
+            QueryFingerprintResponse(
+                fingerprint=stats.fingerprint,
+                calls=stats.calls,
+                total_ms=round(stats.total_ms, 3),
+                mean_ms=round(stats.mean_ms, 3),
+                max_ms=round(stats.max_ms, 3),
+                slow_calls=stats.slow_calls,
+                sources=dict(stats.sources.most_common()),
+                last_plan=stats.last_plan,
+            )
+            for stats in query_stats.top(order_by, limit)
+        ],
+    )
+
+
+@router.delete("/queries", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_queries() -> None:
+    query_stats.reset()
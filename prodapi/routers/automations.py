@@ -1,23 +1,29 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import ValidationError
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prodapi.automations import validate_automation_config
-from prodapi.database import get_session
+from prodapi.database import get_read_session, get_session
 from prodapi.deps import get_current_api_key
 from prodapi.models import ApiKey, Automation, AutomationType
 from prodapi.schemas.automation import (
     AutomationCreate,
+    AutomationListAdapter,
     AutomationResponse,
     AutomationUpdate,
 )
+from prodapi.services.automation_cache import automation_cache
+from prodapi.services.config_cache import config_cache
+from prodapi.services.http_cache import etag_matches, not_modified, weak_etag
 
 router = APIRouter(prefix="/automations", tags=["automations"])
 
+AUTOMATION_COLUMNS = tuple(getattr(Automation, name) for name in AutomationResponse.model_fields)
+
 
 @router.post("", response_model=AutomationResponse, status_code=status.HTTP_201_CREATED)
 async def create_automation(
@@ -42,27 +48,42 @@ async def create_automation(
     )
     session.add(automation)
     await session.commit()
-    await session.refresh(automation)
+    automation_cache.put(automation)
 
     return AutomationResponse.model_validate(automation)
 
 
 @router.get("", response_model=list[AutomationResponse])
 async def list_automations(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_read_session)],
     current_key: Annotated[ApiKey, Depends(get_current_api_key)],
-) -> list[AutomationResponse]:
-    stmt = select(Automation).where(Automation.owner_key_id == current_key.id)
+) -> Response:
+    # Creates and deletes change the count, edits bump max(updated_at).
+    version_stmt = select(func.count(), func.max(Automation.updated_at)).where(
+        Automation.owner_key_id == current_key.id
+    )
+    count, last_updated = (await session.execute(version_stmt)).one()
+    etag = weak_etag(current_key.id, count, last_updated)
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    stmt = select(*AUTOMATION_COLUMNS).where(Automation.owner_key_id == current_key.id)
     result = await session.execute(stmt)
-    automations = result.scalars().all()
 
-    return [AutomationResponse.model_validate(a) for a in automations]
+    automations = AutomationListAdapter.validate_python(result.all(), from_attributes=True)
+    return Response(
+        content=AutomationListAdapter.dump_json(automations),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @router.get("/{automation_id}", response_model=AutomationResponse)
 async def get_automation(
     automation_id: UUID,
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
     current_key: Annotated[ApiKey, Depends(get_current_api_key)],
 ) -> AutomationResponse:
     stmt = select(Automation).where(
@@ -119,7 +140,9 @@ async def update_automation(
         automation.enabled = data.enabled
 
     await session.commit()
-    await session.refresh(automation)
+    automation_cache.put(automation)
+    if data.config_json is not None:
+        config_cache.invalidate(automation_id)
 
     return AutomationResponse.model_validate(automation)
 
@@ -145,3 +168,5 @@ async def delete_automation(
 
     await session.delete(automation)
     await session.commit()
+    automation_cache.invalidate(automation_id)
+    config_cache.invalidate(automation_id)
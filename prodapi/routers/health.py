@@ -1,10 +1,83 @@
-from fastapi import APIRouter
+from datetime import UTC, datetime
 
-from prodapi.schemas.health import HealthResponse
+from fastapi import APIRouter, Response, status
+
+from prodapi.database import engine
+from prodapi.observability.loop_monitor import loop_monitor
+from prodapi.schemas.health import (
+    HealthResponse,
+    LoopHealthResponse,
+    LoopSpikeResponse,
+    ProbeCheckResponse,
+    ProbeResponse,
+)
+from prodapi.services.readiness import HealthProbe, ProbeKind
+from prodapi.services.scheduler import scheduler_service
 
 router = APIRouter(tags=["health"])
 
+health_probe = HealthProbe(engine, scheduler_service)
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health() -> HealthResponse:
     return HealthResponse(status="ok")
+
+
+@router.get(
+    "/health/ready",
+    response_model=ProbeResponse,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ProbeResponse}},
+)
+async def ready(response: Response) -> ProbeResponse:
+    return await _probe("ready", response)
+
+
+@router.get(
+    "/health/live",
+    response_model=ProbeResponse,
+    responses={status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ProbeResponse}},
+)
+async def live(response: Response) -> ProbeResponse:
+    return await _probe("live", response)
+
+
+async def _probe(kind: ProbeKind, response: Response) -> ProbeResponse:
+    report = await health_probe.report(kind)
+    if not report.healthy:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ProbeResponse(
+        status="ok" if report.healthy else "unavailable",
+        checked_at=datetime.fromtimestamp(report.checked_at, UTC),
+        checks=[
+            ProbeCheckResponse(
+                name=check.name,
+                healthy=check.healthy,
+                value=check.value,
+                threshold=check.threshold,
+                detail=check.detail,
+            )
+            for check in report.checks
+        ],
+    )
+
+
+@router.get("/health/loop", response_model=LoopHealthResponse)
+async def loop_health() -> LoopHealthResponse:
+    histogram = loop_monitor.histogram
+    return LoopHealthResponse(
+        enabled=loop_monitor.running,
+        samples=histogram.count,
+        mean_lag_ms=histogram.total_ms / histogram.count if histogram.count else 0.0,
+        max_lag_ms=histogram.max_ms,
+        buckets_ms=histogram.cumulative(),
+        spikes=[
+            LoopSpikeResponse(
+                at=datetime.fromtimestamp(spike.at, UTC),
+                lag_ms=spike.lag_ms,
+                activity=spike.activity,
+                stack=spike.stack,
+            )
+            for spike in loop_monitor.spikes
+        ],
+    )
@@ -1,19 +1,59 @@
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import PlainTextResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from prodapi.database import get_session
+from prodapi.automations import REGISTRY
+from prodapi.database import get_read_session, get_session
 from prodapi.deps import get_current_api_key
-from prodapi.models import ApiKey, Automation, Run, RunStatus, TriggerType
-from prodapi.schemas.run import RunResponse, RunTriggerRequest
+from prodapi.models import ApiKey, Automation, AutomationType, Run, RunStatus, TriggerType
+from prodapi.schemas.run import (
+    RUN_SUMMARY_FIELDS,
+    PartialRunListAdapter,
+    PartialRunResponse,
+    RunItemsPage,
+    RunListAdapter,
+    RunProfileResponse,
+    RunResponse,
+    RunTriggerRequest,
+)
+from prodapi.services.automation_cache import automation_cache
+from prodapi.services.blob_store import BlobNotFoundError, blob_store
+from prodapi.services.http_cache import etag_matches, not_modified, weak_etag
+from prodapi.services.run_summary import load_items, load_summary
 from prodapi.services.runner import enqueue_run
 
 router = APIRouter(prefix="/automations", tags=["runs"])
 runs_router = APIRouter(tags=["runs"])
 
+RUN_COLUMNS = tuple(getattr(Run, name) for name in RunResponse.model_fields)
+
+
+def select_run_fields(fields: str | None, include_summary: bool) -> list[str] | None:
+    if fields is None and include_summary:
+        return None
+
+    if fields is None:
+        selected = list(RunResponse.model_fields)
+    else:
+        selected = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in selected if name not in RunResponse.model_fields]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Unknown run fields: {', '.join(unknown)}",
+            )
+        if "id" not in selected:
+            selected.insert(0, "id")
+
+    if not include_summary:
+        selected = [name for name in selected if name not in RUN_SUMMARY_FIELDS]
+
+    return list(dict.fromkeys(selected))
+
 
 @router.post(
     "/{automation_id}/run",
@@ -26,41 +66,49 @@ async def trigger_run(
     session: Annotated[AsyncSession, Depends(get_session)],
     current_key: Annotated[ApiKey, Depends(get_current_api_key)],
 ) -> RunResponse:
-    stmt = select(Automation).where(
-        Automation.id == automation_id,
-        Automation.owner_key_id == current_key.id,
-    )
-    result = await session.execute(stmt)
-    automation = result.scalar_one_or_none()
-
-    if automation is None:
+    if await automation_cache.get_owned(session, automation_id, current_key.id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Automation not found",
         )
 
-    run = await enqueue_run(
-        session=session,
-        automation_id=automation_id,
-        triggered_by=TriggerType.MANUAL,
-        trigger_meta={"api_key_id": str(current_key.id)},
-        idempotency_key=data.idempotency_key,
-    )
+    trigger_meta: dict[str, object] = {"api_key_id": str(current_key.id)}
+    if data.profile:
+        trigger_meta["profile"] = True
+
+    try:
+        run = await enqueue_run(
+            session=session,
+            automation_id=automation_id,
+            triggered_by=TriggerType.MANUAL,
+            trigger_meta=trigger_meta,
+            idempotency_key=data.idempotency_key,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Automation not found",
+        ) from e
 
     return RunResponse.model_validate(run)
 
 
-@runs_router.get("/runs", response_model=list[RunResponse])
+@runs_router.get("/runs", response_model=list[PartialRunResponse])
 async def list_runs(
-    session: Annotated[AsyncSession, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_read_session)],
     current_key: Annotated[ApiKey, Depends(get_current_api_key)],
     automation_id: UUID | None = Query(None),
     status_filter: RunStatus | None = Query(None, alias="status"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-) -> list[RunResponse]:
+    fields: str | None = Query(None, description="Comma-separated run fields to return"),
+    include_summary: bool = Query(True),
+) -> Response:
+    selected = select_run_fields(fields, include_summary)
+    columns = RUN_COLUMNS if selected is None else [getattr(Run, name) for name in selected]
+
     stmt = (
-        select(Run)
+        select(*columns)
         .join(Automation)
         .where(Automation.owner_key_id == current_key.id)
     )
@@ -74,27 +122,51 @@ async def list_runs(
     stmt = stmt.order_by(Run.queued_at.desc()).offset(offset).limit(limit)
 
     result = await session.execute(stmt)
-    runs = result.scalars().all()
 
-    return [RunResponse.model_validate(r) for r in runs]
+    if selected is not None:
+        partial = [row._asdict() for row in result.all()]
+        return Response(
+            content=PartialRunListAdapter.dump_json(partial),
+            media_type="application/json",
+        )
+
+    # Plain rows validated and serialized in one pass; returning a Response
+    # skips FastAPI's second validation against response_model.
+    runs = RunListAdapter.validate_python(result.all(), from_attributes=True)
+    return Response(content=RunListAdapter.dump_json(runs), media_type="application/json")
 
 
 @runs_router.get("/runs/{run_id}", response_model=RunResponse)
 async def get_run(
     run_id: UUID,
-    session: Annotated[AsyncSession, Depends(get_session)],
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    primary: Annotated[AsyncSession, Depends(get_session)],
     current_key: Annotated[ApiKey, Depends(get_current_api_key)],
-) -> RunResponse:
-    stmt = (
-        select(Run)
+) -> RunResponse | Response:
+    # A run only changes through status transitions, so the version columns
+    # answer conditional requests without loading summary_json.
+    version_stmt = (
+        select(Run.status, Run.ended_at)
         .join(Automation)
         .where(
             Run.id == run_id,
             Automation.owner_key_id == current_key.id,
         )
     )
-    result = await session.execute(stmt)
-    run = result.scalar_one_or_none()
+    version = (await session.execute(version_stmt)).one_or_none()
+    if version is None and session is not primary:
+        # The run may have been created through another worker and not reached the replica.
+        session = primary
+        version = (await session.execute(version_stmt)).one_or_none()
+
+    if version is not None:
+        etag = weak_etag(run_id, version.status, version.ended_at)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return not_modified(etag)
+
+    run = await session.get(Run, run_id) if version is not None else None
 
     if run is None:
         raise HTTPException(
@@ -102,4 +174,96 @@ async def get_run(
             detail="Run not found",
         )
 
-    return RunResponse.model_validate(run)
+    response.headers["ETag"] = weak_etag(run.id, run.status, run.ended_at)
+    run_response = RunResponse.model_validate(run)
+    run_response.summary_json = await load_summary(run.summary_json, run.summary_ref)
+    return run_response
+
+
+@runs_router.get("/runs/{run_id}/items", response_model=RunItemsPage)
+async def list_run_items(
+    run_id: UUID,
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    primary: Annotated[AsyncSession, Depends(get_session)],
+    current_key: Annotated[ApiKey, Depends(get_current_api_key)],
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+) -> RunItemsPage:
+    stmt = (
+        select(Run.summary_json, Run.summary_ref, Run.items_ref, Automation.type)
+        .join(Automation)
+        .where(
+            Run.id == run_id,
+            Automation.owner_key_id == current_key.id,
+        )
+    )
+    row = (await session.execute(stmt)).one_or_none()
+    if row is None and session is not primary:
+        row = (await primary.execute(stmt)).one_or_none()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Run not found",
+        )
+
+    items_key = REGISTRY[AutomationType(row.type)].output_budget.items_key
+    try:
+        items = await load_items(row.summary_json, row.summary_ref, row.items_ref, items_key)
+    except BlobNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Run items are no longer available",
+        ) from e
+
+    return RunItemsPage(
+        run_id=run_id,
+        total=len(items),
+        offset=offset,
+        limit=limit,
+        items=items[offset : offset + limit],
+    )
+
+
+@runs_router.get(
+    "/runs/{run_id}/profile",
+    response_model=RunProfileResponse,
+    responses={200: {"content": {"text/plain": {}}}},
+)
+async def get_run_profile(
+    run_id: UUID,
+    session: Annotated[AsyncSession, Depends(get_read_session)],
+    current_key: Annotated[ApiKey, Depends(get_current_api_key)],
+    output: Literal["json", "folded"] = Query("json", alias="format"),
+) -> Response | RunProfileResponse:
+    stmt = (
+        select(Run.profile_ref)
+        .join(Automation)
+        .where(
+            Run.id == run_id,
+            Automation.owner_key_id == current_key.id,
+        )
+    )
+    profile_ref = (await session.execute(stmt)).scalar_one_or_none()
+
+    if profile_ref is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Run profile not found",
+        )
+
+    try:
+        artifact = await blob_store.aget_json(profile_ref)
+    except BlobNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Run profile is no longer available",
+        ) from e
+
+    profile = RunProfileResponse.model_validate({"run_id": run_id, **artifact})
+    if output == "folded":
+        # Collapsed stacks, the input format of flamegraph.pl / speedscope.
+        return PlainTextResponse(
+            "".join(f"{entry.stack} {entry.samples}\n" for entry in profile.stacks)
+        )
+    return profile
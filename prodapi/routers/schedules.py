@@ -1,20 +1,37 @@
+from datetime import UTC, datetime
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import ValidationError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prodapi.database import get_session
 from prodapi.deps import get_current_api_key
-from prodapi.models import ApiKey, Automation, Schedule
-from prodapi.schemas.schedule import ScheduleCreate, ScheduleResponse, ScheduleUpdate
+from prodapi.models import ApiKey, Schedule
+from prodapi.schemas.schedule import (
+    ScheduleCreate,
+    ScheduleNextFires,
+    ScheduleResponse,
+    ScheduleUpdate,
+)
+from prodapi.services.automation_cache import automation_cache
+from prodapi.services.cron import build_trigger, next_fire_times
 from prodapi.services.scheduler import scheduler_service
 
 router = APIRouter(prefix="/automations", tags=["schedules"])
 
 
+async def _owned_schedule(
+    session: AsyncSession, automation_id: UUID, owner_key_id: UUID
+) -> Schedule | None:
+    if await automation_cache.get_owned(session, automation_id, owner_key_id) is None:
+        return None
+    stmt = select(Schedule).where(Schedule.automation_id == automation_id)
+    return (await session.execute(stmt)).scalar_one_or_none()
+
+
 @router.put("/{automation_id}/schedule", response_model=ScheduleResponse)
 async def create_or_update_schedule(
     automation_id: UUID,
@@ -22,14 +39,7 @@ async def create_or_update_schedule(
     session: Annotated[AsyncSession, Depends(get_session)],
     current_key: Annotated[ApiKey, Depends(get_current_api_key)],
 ) -> ScheduleResponse:
-    stmt = select(Automation).where(
-        Automation.id == automation_id,
-        Automation.owner_key_id == current_key.id,
-    )
-    result = await session.execute(stmt)
-    automation = result.scalar_one_or_none()
-
-    if automation is None:
+    if await automation_cache.get_owned(session, automation_id, current_key.id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Automation not found",
@@ -44,17 +54,20 @@ async def create_or_update_schedule(
             schedule.cron = data.cron
             schedule.timezone = data.timezone
             schedule.enabled = data.enabled
+            schedule.jitter_seconds = data.jitter_seconds
+            schedule.misfire_policy = data.misfire_policy
         else:
             schedule = Schedule(
                 automation_id=automation_id,
                 cron=data.cron,
                 timezone=data.timezone,
                 enabled=data.enabled,
+                jitter_seconds=data.jitter_seconds,
+                misfire_policy=data.misfire_policy,
             )
             session.add(schedule)
 
         await session.commit()
-        await session.refresh(schedule)
 
         if schedule.enabled:
             scheduler_service.add_schedule(
@@ -62,6 +75,7 @@ async def create_or_update_schedule(
                 automation_id=automation_id,
                 cron=schedule.cron,
                 timezone=schedule.timezone,
+                jitter_seconds=schedule.jitter_seconds,
             )
         else:
             scheduler_service.remove_schedule(schedule.id)
@@ -82,16 +96,7 @@ async def update_schedule(
     session: Annotated[AsyncSession, Depends(get_session)],
     current_key: Annotated[ApiKey, Depends(get_current_api_key)],
 ) -> ScheduleResponse:
-    stmt = (
-        select(Schedule)
-        .join(Automation)
-        .where(
-            Schedule.automation_id == automation_id,
-            Automation.owner_key_id == current_key.id,
-        )
-    )
-    result = await session.execute(stmt)
-    schedule = result.scalar_one_or_none()
+    schedule = await _owned_schedule(session, automation_id, current_key.id)
 
     if schedule is None:
         raise HTTPException(
@@ -106,9 +111,12 @@ async def update_schedule(
             schedule.timezone = data.timezone
         if data.enabled is not None:
             schedule.enabled = data.enabled
+        if "jitter_seconds" in data.model_fields_set:
+            schedule.jitter_seconds = data.jitter_seconds
+        if data.misfire_policy is not None:
+            schedule.misfire_policy = data.misfire_policy
 
         await session.commit()
-        await session.refresh(schedule)
 
         if schedule.enabled:
             scheduler_service.add_schedule(
@@ -116,6 +124,7 @@ async def update_schedule(
                 automation_id=automation_id,
                 cron=schedule.cron,
                 timezone=schedule.timezone,
+                jitter_seconds=schedule.jitter_seconds,
             )
         else:
             scheduler_service.remove_schedule(schedule.id)
@@ -129,22 +138,46 @@ async def update_schedule(
     return ScheduleResponse.model_validate(schedule)
 
 
+@router.get("/{automation_id}/schedule/next", response_model=ScheduleNextFires)
+async def preview_schedule(
+    automation_id: UUID,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    current_key: Annotated[ApiKey, Depends(get_current_api_key)],
+    n: int = Query(10, ge=1, le=1000),
+) -> ScheduleNextFires:
+    schedule = await _owned_schedule(session, automation_id, current_key.id)
+
+    if schedule is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule not found",
+        )
+
+    offset = scheduler_service.jitter_offset_for(schedule.id, schedule.jitter_seconds)
+    try:
+        trigger = build_trigger(schedule.cron, schedule.timezone, offset)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e),
+        ) from e
+
+    return ScheduleNextFires(
+        schedule_id=schedule.id,
+        cron=schedule.cron,
+        timezone=schedule.timezone,
+        jitter_offset_seconds=offset,
+        fire_times=next_fire_times(trigger, datetime.now(UTC), n),
+    )
+
+
 @router.delete("/{automation_id}/schedule", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_schedule(
     automation_id: UUID,
     session: Annotated[AsyncSession, Depends(get_session)],
     current_key: Annotated[ApiKey, Depends(get_current_api_key)],
 ) -> None:
-    stmt = (
-        select(Schedule)
-        .join(Automation)
-        .where(
-            Schedule.automation_id == automation_id,
-            Automation.owner_key_id == current_key.id,
-        )
-    )
-    result = await session.execute(stmt)
-    schedule = result.scalar_one_or_none()
+    schedule = await _owned_schedule(session, automation_id, current_key.id)
 
     if schedule is None:
         raise HTTPException(
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+
+
+class QueryFingerprintResponse(BaseModel):
+    fingerprint: str
+    calls: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    slow_calls: int
+    sources: dict[str, int]
+    last_plan: str | None
+
+
+class QueryStatsResponse(BaseModel):
+    threshold_ms: float
+    fingerprints: int
+    dropped: int
+    queries: list[QueryFingerprintResponse]
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any, cast
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from prodapi.models import AutomationType
 
@@ -40,3 +40,6 @@ class AutomationResponse(BaseModel):
             safe_v["github_token"] = "***" if v["github_token"] else None
             return safe_v
         return cast(dict[str, Any], v)
+
+
+AutomationListAdapter = TypeAdapter(list[AutomationResponse])
@@ -1,5 +1,38 @@
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel
 
 
 class HealthResponse(BaseModel):
     status: str
+
+
+class LoopSpikeResponse(BaseModel):
+    at: datetime
+    lag_ms: float
+    activity: str | None
+    stack: list[str]
+
+
+class LoopHealthResponse(BaseModel):
+    enabled: bool
+    samples: int
+    mean_lag_ms: float
+    max_lag_ms: float
+    buckets_ms: dict[str, int]
+    spikes: list[LoopSpikeResponse]
+
+
+class ProbeCheckResponse(BaseModel):
+    name: str
+    healthy: bool
+    value: float
+    threshold: float | None
+    detail: str | None
+
+
+class ProbeResponse(BaseModel):
+    status: Literal["ok", "unavailable"]
+    checked_at: datetime
+    checks: list[ProbeCheckResponse]
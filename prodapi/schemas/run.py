@@ -2,11 +2,12 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, create_model
 
 
 class RunTriggerRequest(BaseModel):
     idempotency_key: str | None = None
+    profile: bool = False
 
 
 class RunResponse(BaseModel):
@@ -18,9 +19,78 @@ class RunResponse(BaseModel):
     ended_at: datetime | None
     duration_ms: int | None
     summary_json: dict[str, Any] | None
+    summary_ref: str | None = None
+    items_ref: str | None = None
+    profile_ref: str | None = None
     error_text: str | None
     idempotency_key: str | None
     triggered_by: str
     trigger_meta: dict[str, Any]
 
     model_config = {"from_attributes": True}
+
+
+# An item of GET /runs: with fields= or include_summary=false only the selected
+# fields are present, so everything but `id` is optional.
+_partial_fields: dict[str, Any] = {
+    name: (field.annotation, ... if name == "id" else None)
+    for name, field in RunResponse.model_fields.items()
+}
+PartialRunResponse = create_model("PartialRunResponse", **_partial_fields)
+
+
+class RunItemsPage(BaseModel):
+    run_id: UUID
+    total: int
+    offset: int
+    limit: int
+    items: list[Any]
+
+
+class ProfileStack(BaseModel):
+    stack: str
+    samples: int
+
+
+class ProfileFunction(BaseModel):
+    function: str
+    self_samples: int
+    total_samples: int
+
+
+class ProfileStatement(BaseModel):
+    statement: str
+    count: int
+    total_ms: float
+    max_ms: float
+
+
+class ProfileHttpCall(BaseModel):
+    method: str
+    url: str
+    status: int | None
+    elapsed_ms: float
+
+
+class RunProfileResponse(BaseModel):
+    run_id: UUID
+    duration_ms: float
+    sample_interval_ms: float
+    samples: int
+    idle_samples: int
+    stacks: list[ProfileStack]
+    functions: list[ProfileFunction]
+    sql_count: int
+    sql_total_ms: float
+    sql_statements: list[ProfileStatement]
+    http_count: int
+    http_total_ms: float
+    http_calls: list[ProfileHttpCall]
+    memory_peak_bytes: int
+    memory_net_bytes: int
+
+
+RUN_SUMMARY_FIELDS = frozenset({"summary_json", "error_text", "trigger_meta"})
+
+RunListAdapter = TypeAdapter(list[RunResponse])
+PartialRunListAdapter = TypeAdapter(list[dict[str, Any]])
@@ -1,13 +1,19 @@
 from datetime import datetime
+from typing import Self
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from prodapi.models import MisfirePolicy
+from prodapi.services.cron import compile_cron
 
 
 class ScheduleCreate(BaseModel):
     cron: str = Field(..., min_length=9, max_length=100)
     timezone: str = "UTC"
     enabled: bool = True
+    jitter_seconds: int | None = Field(None, ge=0, le=3600)
+    misfire_policy: MisfirePolicy = MisfirePolicy.SKIP
 
     @field_validator("cron")
     @classmethod
@@ -17,11 +23,18 @@ class ScheduleCreate(BaseModel):
             raise ValueError("Cron expression must have exactly 5 fields")
         return v
 
+    @model_validator(mode="after")
+    def validate_trigger(self) -> Self:
+        compile_cron(self.cron, self.timezone)
+        return self
+
 
 class ScheduleUpdate(BaseModel):
     cron: str | None = Field(None, min_length=9, max_length=100)
     timezone: str | None = None
     enabled: bool | None = None
+    jitter_seconds: int | None = Field(None, ge=0, le=3600)
+    misfire_policy: MisfirePolicy | None = None
 
     @field_validator("cron")
     @classmethod
@@ -32,6 +45,12 @@ class ScheduleUpdate(BaseModel):
                 raise ValueError("Cron expression must have exactly 5 fields")
         return v
 
+    @model_validator(mode="after")
+    def validate_trigger(self) -> Self:
+        if self.cron is not None or self.timezone is not None:
+            compile_cron(self.cron or "* * * * *", self.timezone or "UTC")
+        return self
+
 
 class ScheduleResponse(BaseModel):
     id: UUID
@@ -39,7 +58,18 @@ class ScheduleResponse(BaseModel):
     cron: str
     timezone: str
     enabled: bool
+    jitter_seconds: int | None
+    misfire_policy: str
+    last_fired_at: datetime | None
     created_at: datetime
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ScheduleNextFires(BaseModel):
+    schedule_id: UUID
+    cron: str
+    timezone: str
+    jitter_offset_seconds: int
+    fire_times: list[datetime]
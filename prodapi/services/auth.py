@@ -27,7 +27,6 @@ async def create_api_key(session: AsyncSession, label: str) -> tuple[ApiKey, str
     )
     session.add(api_key)
     await session.commit()
-    await session.refresh(api_key)
 
     return api_key, raw_key
 
@@ -43,8 +42,19 @@ async def verify_api_key(session: AsyncSession, raw_key: str) -> ApiKey | None:
     api_key = result.scalar_one_or_none()
 
     if api_key:
-        api_key.last_used_at = datetime.now(UTC)
-        await session.commit()
+        # Imported here: tests.factories (and through it the benchmarks) import this
+        # module before setting the environment that Settings reads.
+        from prodapi.config import settings
+
+        # One write per resolution window instead of one per request.
+        now = datetime.now(UTC)
+        last_used = api_key.last_used_at
+        if last_used is not None and last_used.tzinfo is None:
+            last_used = last_used.replace(tzinfo=UTC)
+        resolution = settings.api_key_last_used_resolution_seconds
+        if last_used is None or (now - last_used).total_seconds() >= resolution:
+            api_key.last_used_at = now
+            await session.commit()
 
     return api_key
 
@@ -57,6 +67,5 @@ async def revoke_api_key(session: AsyncSession, key_id: UUID) -> ApiKey | None:
     if api_key and api_key.revoked_at is None:
         api_key.revoked_at = datetime.now(UTC)
         await session.commit()
-        await session.refresh(api_key)
 
     return api_key
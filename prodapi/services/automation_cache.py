@@ -0,0 +1,138 @@
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prodapi.config import settings
+from prodapi.models import Automation
+
+
+@dataclass(frozen=True)
+class AutomationRef:
+    id: UUID
+    owner_key_id: UUID
+    type: str
+    enabled: bool
+
+
+# Existence/ownership facts about automations, shared by every request of the
+# process. Local writes invalidate their entry; writes from other replicas are
+# picked up by a periodic version check that drops everything.
+class AutomationCache:
+    def __init__(
+        self, max_entries: int, version_check_seconds: float, enabled: bool = True
+    ) -> None:
+        self.max_entries = max_entries
+        self.version_check_seconds = version_check_seconds
+        self.enabled = enabled
+        self._entries: OrderedDict[UUID, AutomationRef] = OrderedDict()
+        self._version: tuple[int, datetime | None] | None = None
+        self._checked_at = float("-inf")
+        self._generation = 0
+
+    async def get(self, session: AsyncSession, automation_id: UUID) -> AutomationRef | None:
+        return (await self.get_many(session, [automation_id])).get(automation_id)
+
+    async def get_owned(
+        self, session: AsyncSession, automation_id: UUID, owner_key_id: UUID
+    ) -> AutomationRef | None:
+        ref = await self.get(session, automation_id)
+        return ref if ref is not None and ref.owner_key_id == owner_key_id else None
+
+    async def get_many(
+        self, session: AsyncSession, automation_ids: Iterable[UUID]
+    ) -> dict[UUID, AutomationRef]:
+        ids = list(dict.fromkeys(automation_ids))
+        if not self.enabled:
+            return await self._load(session, ids)
+
+        await self._check_version(session)
+        found = {}
+        missing = []
+        for automation_id in ids:
+            ref = self._entries.get(automation_id)
+            if ref is None:
+                missing.append(automation_id)
+            else:
+                self._entries.move_to_end(automation_id)
+                found[automation_id] = ref
+
+        if missing:
+            generation = self._generation
+            loaded = await self._load(session, missing)
+            # An invalidation that landed while we were loading may make these rows stale.
+            if generation == self._generation:
+                for ref in loaded.values():
+                    self._store(ref)
+            found.update(loaded)
+        return found
+
+    def put(self, automation: Automation) -> None:
+        self._generation += 1
+        self._store(
+            AutomationRef(
+                automation.id, automation.owner_key_id, automation.type, automation.enabled
+            )
+        )
+
+    def invalidate(self, automation_id: UUID) -> None:
+        self._generation += 1
+        self._entries.pop(automation_id, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+        self._version = None
+        self._checked_at = float("-inf")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, ref: AutomationRef) -> None:
+        if not self.enabled:
+            return
+        self._entries[ref.id] = ref
+        self._entries.move_to_end(ref.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _check_version(self, session: AsyncSession) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.version_check_seconds:
+            return
+        self._checked_at = now
+
+        # Same signal as the /automations ETag, table-wide: creates and deletes
+        # change the count, edits bump max(updated_at).
+        stmt = select(func.count(), func.max(Automation.updated_at))
+        count, last_updated = (await session.execute(stmt)).one()
+        version = (count, last_updated)
+        if self._version is not None and version != self._version:
+            self._generation += 1
+            self._entries.clear()
+        self._version = version
+
+    @staticmethod
+    async def _load(session: AsyncSession, ids: list[UUID]) -> dict[UUID, AutomationRef]:
+        if not ids:
+            return {}
+        stmt = select(
+            Automation.id, Automation.owner_key_id, Automation.type, Automation.enabled
+        ).where(Automation.id.in_(ids))
+        rows = (await session.execute(stmt)).all()
+        return {
+            row.id: AutomationRef(row.id, row.owner_key_id, row.type, row.enabled)
+            for row in rows
+        }
+
+
+automation_cache = AutomationCache(
+    max_entries=settings.automation_cache_max_entries,
+    version_check_seconds=settings.automation_cache_version_check_seconds,
+    enabled=settings.automation_cache_enabled,
+)
@@ -0,0 +1,76 @@
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from prodapi.config import settings
+from prodapi.services.compression import compress_blob, decompress_blob
+
+
+class BlobNotFoundError(LookupError):
+    pass
+
+
+class BlobStore:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def put(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        for existing in self._directory(digest).glob(f"{digest}.*"):
+            return f"{existing.suffix[1:]}:{digest}"
+
+        codec, compressed = compress_blob(data)
+        path = self._path(codec, digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temp file first so readers never see a partial blob.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(compressed)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        return f"{codec}:{digest}"
+
+    def get(self, ref: str) -> bytes:
+        codec, _, digest = ref.partition(":")
+        path = self._path(codec, digest)
+
+        try:
+            blob = path.open("rb")
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(ref) from e
+
+        # Decompress straight from the page cache instead of copying the file first.
+        with blob, mmap.mmap(blob.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return decompress_blob(codec, view)
+
+    def put_json(self, value: Any) -> str:
+        return self.put(json.dumps(value, separators=(",", ":"), default=str).encode())
+
+    def get_json(self, ref: str) -> Any:
+        return json.loads(self.get(ref))
+
+    async def aput_json(self, value: Any) -> str:
+        return await asyncio.to_thread(self.put_json, value)
+
+    async def aget_json(self, ref: str) -> Any:
+        return await asyncio.to_thread(self.get_json, ref)
+
+    def _directory(self, digest: str) -> Path:
+        return self.root / digest[:2]
+
+    def _path(self, codec: str, digest: str) -> Path:
+        return self._directory(digest) / f"{digest}.{codec}"
+
+
+blob_store = BlobStore(Path(settings.blob_store_path))
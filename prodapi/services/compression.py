@@ -0,0 +1,63 @@
+import gzip
+import zlib
+from collections.abc import Callable
+
+import brotli
+import zstandard
+
+Encoder = Callable[[bytes], bytes]
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def _brotli_compress(data: bytes) -> bytes:
+    compressed: bytes = brotli.compress(data, quality=4)
+    return compressed
+
+
+def _gzip_compress(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=6)
+
+
+# Server preference order.
+ENCODERS: dict[str, Encoder] = {
+    "zstd": _zstd_compress,
+    "br": _brotli_compress,
+    "gzip": _gzip_compress,
+}
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ENCODERS:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def compress_blob(data: bytes) -> tuple[str, bytes]:
+    return "zstd", _zstd_compress(data)
+
+
+def decompress_blob(codec: str, data: bytes | memoryview) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    # Written by nodes that ran without zstandard; still readable, never written.
+    if codec == "zlib":
+        return zlib.decompress(data)
+    raise ValueError(f"Unknown blob codec: {codec}")
@@ -0,0 +1,58 @@
+import copy
+from collections import OrderedDict
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from prodapi.automations import REGISTRY
+from prodapi.config import settings
+from prodapi.models import AutomationType
+
+
+# Validated executor configs, reused across runs of the same automation. The
+# entry keeps a snapshot of the raw config it was built from and only hits when
+# the config loaded for the run is equal to it: a dict comparison is cheaper
+# than hashing the config, and any change (PATCH, another replica, the github
+# monitor cursor) re-validates without explicit invalidation.
+class ValidatedConfigCache:
+    def __init__(self, max_entries: int, enabled: bool = True) -> None:
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[UUID, tuple[dict[str, Any], BaseModel]] = OrderedDict()
+
+    def get(self, automation_id: UUID, automation_type: str, config: dict[str, Any]) -> BaseModel:
+        entry = self._entries.get(automation_id)
+        if entry is not None and entry[0] == config:
+            self.hits += 1
+            self._entries.move_to_end(automation_id)
+            return entry[1]
+
+        self.misses += 1
+        validated = REGISTRY[AutomationType(automation_type)].validate_config(config)
+        if self.enabled:
+            # The runner mutates config_json in place, so keep a copy of what was validated.
+            self._entries[automation_id] = (copy.deepcopy(config), validated)
+            self._entries.move_to_end(automation_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return validated
+
+    def invalidate(self, automation_id: UUID) -> None:
+        self._entries.pop(automation_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+config_cache = ValidatedConfigCache(
+    max_entries=settings.config_cache_max_entries,
+    enabled=settings.config_cache_enabled,
+)
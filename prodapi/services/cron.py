@@ -0,0 +1,82 @@
+import hashlib
+from collections import deque
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from uuid import UUID
+from zoneinfo import ZoneInfoNotFoundError
+
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.triggers.cron import CronTrigger
+
+COMPILED_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def compile_cron(cron: str, timezone: str) -> CronTrigger:
+    try:
+        return CronTrigger.from_crontab(cron, timezone=timezone)
+    except ZoneInfoNotFoundError as e:
+        raise ValueError(f"Unknown timezone: {timezone}") from e
+
+
+def jitter_offset(schedule_id: UUID, window_seconds: int) -> int:
+    if window_seconds <= 0:
+        return 0
+    digest = hashlib.blake2b(schedule_id.bytes, digest_size=8).digest()
+    return int.from_bytes(digest) % window_seconds
+
+
+class OffsetCronTrigger(BaseTrigger):  # type: ignore[misc]
+    def __init__(self, trigger: CronTrigger, offset_seconds: int) -> None:
+        self.trigger = trigger
+        self.offset = timedelta(seconds=offset_seconds)
+
+    def get_next_fire_time(
+        self, previous_fire_time: datetime | None, now: datetime
+    ) -> datetime | None:
+        previous = previous_fire_time - self.offset if previous_fire_time else None
+        next_fire: datetime | None = self.trigger.get_next_fire_time(previous, now - self.offset)
+        return next_fire + self.offset if next_fire else None
+
+    def __str__(self) -> str:
+        return f"{self.trigger} +{int(self.offset.total_seconds())}s"
+
+
+def build_trigger(cron: str, timezone: str, offset_seconds: int = 0) -> BaseTrigger:
+    trigger = compile_cron(cron, timezone)
+    if offset_seconds:
+        return OffsetCronTrigger(trigger, offset_seconds)
+    return trigger
+
+
+def next_fire_times(trigger: BaseTrigger, start: datetime, count: int) -> list[datetime]:
+    fire_times: list[datetime] = []
+    next_fire = trigger.get_next_fire_time(None, start)
+    while next_fire is not None and len(fire_times) < count:
+        fire_times.append(next_fire)
+        next_fire = trigger.get_next_fire_time(None, next_fire + timedelta(microseconds=1))
+    return fire_times
+
+
+def missed_fire_times(
+    trigger: BaseTrigger, since: datetime, now: datetime, limit: int
+) -> list[datetime]:
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    if limit <= 0 or now <= since:
+        return []
+
+    # The newest `limit` ticks in (since, now]. Triggers only step forward, so scan a
+    # window ending at `now` that widens until it holds enough ticks or reaches `since`:
+    # a long outage of a dense cron does not walk every tick since the last fire.
+    window = timedelta(minutes=1)
+    while True:
+        start = max(since, now - window)
+        missed: deque[datetime] = deque(maxlen=limit)
+        fire_time = trigger.get_next_fire_time(None, start + timedelta(microseconds=1))
+        while fire_time is not None and fire_time <= now:
+            missed.append(fire_time)
+            fire_time = trigger.get_next_fire_time(None, fire_time + timedelta(microseconds=1))
+        if len(missed) == limit or start == since:
+            return list(missed)
+        window *= 4
@@ -0,0 +1,26 @@
+import hashlib
+
+from fastapi import Response, status
+
+
+def weak_etag(*parts: object) -> str:
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(),
+        digest_size=8,
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    # If-None-Match always uses weak comparison.
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,45 @@
+import asyncio
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, TypeVar
+
+from prodapi.config import settings
+
+T = TypeVar("T")
+
+
+def execute_in_worker(automation_type: str, config: dict[str, Any]) -> dict[str, Any]:
+    from prodapi.automations import REGISTRY
+    from prodapi.models import AutomationType
+
+    executor = REGISTRY[AutomationType(automation_type)]
+    return asyncio.run(executor.execute(config))
+
+
+class ExecutorPool:
+    def __init__(self, max_workers: int) -> None:
+        self.max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+
+    def start(self) -> None:
+        if self._pool is None:
+            # spawn keeps the event loop, DB connections and threads of the API
+            # process out of the workers.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        self.start()
+        assert self._pool is not None
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+
+executor_pool = ExecutorPool(settings.cpu_executor_pool_size)
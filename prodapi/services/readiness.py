@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Literal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from prodapi.config import Settings, settings
+from prodapi.observability.metrics import RUN_QUEUE_DEPTH
+from prodapi.services.scheduler import SchedulerService
+
+logger = logging.getLogger(__name__)
+
+ProbeKind = Literal["ready", "live"]
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    name: str
+    healthy: bool
+    value: float
+    threshold: float | None = None
+    detail: str | None = None
+
+
+@dataclass(frozen=True)
+class ProbeReport:
+    healthy: bool
+    checked_at: float
+    checks: list[CheckResult] = field(default_factory=list)
+
+
+class HealthProbe:
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        scheduler: SchedulerService,
+        profile: Settings = settings,
+    ) -> None:
+        self.engine = engine
+        self.scheduler = scheduler
+        self.profile = profile
+        self._cache: dict[ProbeKind, ProbeReport] = {}
+        self._locks: dict[ProbeKind, asyncio.Lock] = {
+            "ready": asyncio.Lock(),
+            "live": asyncio.Lock(),
+        }
+
+    async def report(self, kind: ProbeKind) -> ProbeReport:
+        cached = self._fresh(kind)
+        if cached is not None:
+            return cached
+
+        # Concurrent probes wait for the one in flight instead of hitting the database again.
+        async with self._locks[kind]:
+            cached = self._fresh(kind)
+            if cached is not None:
+                return cached
+
+            # A stopped scheduler takes the replica out of rotation, but restarting it
+            # would not help (e.g. during shutdown), so liveness only watches the loop.
+            checks = [await self.check_event_loop()]
+            if kind == "ready":
+                checks += [
+                    self.check_scheduler(),
+                    await self.check_database(),
+                    self.check_pool(),
+                    self.check_queue(),
+                ]
+
+            report = ProbeReport(
+                healthy=all(check.healthy for check in checks),
+                checked_at=time.time(),
+                checks=checks,
+            )
+            self._cache[kind] = report
+            return report
+
+    def _fresh(self, kind: ProbeKind) -> ProbeReport | None:
+        cached = self._cache.get(kind)
+        if cached is None or time.time() - cached.checked_at >= self.profile.health_cache_seconds:
+            return None
+        return cached
+
+    async def check_database(self) -> CheckResult:
+        timeout = self.profile.health_db_timeout_seconds
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                async with self.engine.connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+        except TimeoutError:
+            return CheckResult(
+                name="database",
+                healthy=False,
+                value=timeout * 1000,
+                threshold=timeout * 1000,
+                detail="timed out",
+            )
+        except Exception as e:
+            logger.warning("Readiness database check failed: %s", e)
+            return CheckResult(
+                name="database",
+                healthy=False,
+                value=(time.perf_counter() - started) * 1000,
+                threshold=timeout * 1000,
+                detail=type(e).__name__,
+            )
+
+        return CheckResult(
+            name="database",
+            healthy=True,
+            value=(time.perf_counter() - started) * 1000,
+            threshold=timeout * 1000,
+        )
+
+    def check_pool(self) -> CheckResult:
+        threshold = self.profile.health_pool_saturation_threshold
+        pool = self.engine.pool
+        if not isinstance(pool, QueuePool):
+            return CheckResult(name="db_pool", healthy=True, value=0.0, threshold=threshold)
+
+        capacity = self.profile.db_pool_size + self.profile.db_max_overflow
+        saturation = pool.checkedout() / capacity
+        return CheckResult(
+            name="db_pool",
+            healthy=saturation < threshold,
+            value=saturation,
+            threshold=threshold,
+            detail=f"{pool.checkedout()}/{capacity} connections in use",
+        )
+
+    def check_scheduler(self) -> CheckResult:
+        running = self.scheduler.is_running()
+        return CheckResult(
+            name="scheduler",
+            healthy=running,
+            value=float(self.scheduler.job_count()),
+            detail=None if running else "not running",
+        )
+
+    def check_queue(self) -> CheckResult:
+        depth = RUN_QUEUE_DEPTH.value()
+        threshold = self.profile.health_max_queue_depth
+        return CheckResult(
+            name="run_queue", healthy=depth < threshold, value=depth, threshold=threshold
+        )
+
+    async def check_event_loop(self) -> CheckResult:
+        # Time until a freshly scheduled callback runs, i.e. how far behind the loop is now.
+        loop = asyncio.get_running_loop()
+        ran = loop.create_future()
+        scheduled = loop.time()
+        loop.call_soon(ran.set_result, None)
+        await ran
+        lag_ms = (loop.time() - scheduled) * 1000
+
+        threshold = self.profile.health_max_loop_lag_ms
+        return CheckResult(
+            name="event_loop", healthy=lag_ms < threshold, value=lag_ms, threshold=threshold
+        )
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import logging
+from typing import Any
+
+from prodapi.automations.base import OutputBudget
+from prodapi.config import settings
+from prodapi.services.blob_store import BlobNotFoundError, blob_store
+
+logger = logging.getLogger(__name__)
+
+PREVIEW_LIST_ITEMS = 5
+PREVIEW_STRING_CHARS = 500
+
+
+def summary_preview(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: summary_preview(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [summary_preview(item) for item in value[:PREVIEW_LIST_ITEMS]]
+    if isinstance(value, str) and len(value) > PREVIEW_STRING_CHARS:
+        return value[:PREVIEW_STRING_CHARS]
+    return value
+
+
+def apply_output_budget(
+    summary: dict[str, Any], budget: OutputBudget
+) -> tuple[dict[str, Any], list[Any] | None]:
+    items = summary.get(budget.items_key)
+    if not isinstance(items, list):
+        return summary, None
+
+    kept: list[Any] = []
+    used_bytes = 0
+    for item in items:
+        if len(kept) >= budget.max_items:
+            break
+        used_bytes += len(json.dumps(item, separators=(",", ":"), default=str))
+        if used_bytes > budget.max_bytes:
+            break
+        kept.append(item)
+
+    if len(kept) == len(items):
+        return summary, None
+
+    truncated = {
+        **summary,
+        budget.items_key: kept,
+        "truncated": True,
+        "items_total": len(items),
+    }
+    return truncated, items
+
+
+async def offload_summary(summary: dict[str, Any]) -> tuple[dict[str, Any], str | None]:
+    threshold = settings.summary_offload_threshold_bytes
+    if threshold <= 0:
+        return summary, None
+
+    encoded = json.dumps(summary, separators=(",", ":"), default=str).encode()
+    if len(encoded) <= threshold:
+        return summary, None
+
+    ref = await asyncio.to_thread(blob_store.put, encoded)
+    return summary_preview(summary), ref
+
+
+async def load_summary(
+    preview: dict[str, Any] | None, ref: str | None
+) -> dict[str, Any] | None:
+    if ref is None:
+        return preview
+
+    try:
+        summary: dict[str, Any] = await blob_store.aget_json(ref)
+    except BlobNotFoundError:
+        logger.warning("Summary blob %s is missing, serving the preview", ref)
+        return preview
+
+    return summary
+
+
+async def load_items(
+    preview: dict[str, Any] | None,
+    summary_ref: str | None,
+    items_ref: str | None,
+    items_key: str,
+) -> list[Any]:
+    if items_ref is not None:
+        items: list[Any] = await blob_store.aget_json(items_ref)
+        return items
+
+    summary = await load_summary(preview, summary_ref) or {}
+    kept = summary.get(items_key)
+    return kept if isinstance(kept, list) else []
@@ -1,15 +1,29 @@
 import asyncio
+from collections.abc import Sequence
 from datetime import UTC, datetime
-from uuid import UUID
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prodapi.automations import REGISTRY
+from prodapi.config import settings
 from prodapi.models import Automation, AutomationType, Run, RunStatus, TriggerType
-
-
+from prodapi.observability.loop_monitor import tag_current_task
+from prodapi.observability.metrics import RUN_DURATION, RUN_QUEUE_DEPTH, RUN_QUEUE_WAIT, RUNS_TOTAL
+from prodapi.observability.profiling import RunProfile, profiled
+from prodapi.observability.sql_budget import statement_budget
+from prodapi.observability.tracing import current_span, traced, tracer
+from prodapi.services.automation_cache import automation_cache
+from prodapi.services.blob_store import blob_store
+from prodapi.services.config_cache import config_cache
+from prodapi.services.process_pool import execute_in_worker, executor_pool
+from prodapi.services.run_summary import apply_output_budget, offload_summary
+
+
+@traced("enqueue_run")
 async def enqueue_run(
     session: AsyncSession,
     automation_id: UUID,
@@ -17,11 +31,7 @@ async def enqueue_run(
     trigger_meta: dict[str, object] | None = None,
     idempotency_key: str | None = None,
 ) -> Run:
-    stmt = select(Automation).where(Automation.id == automation_id)
-    result = await session.execute(stmt)
-    automation = result.scalar_one_or_none()
-
-    if automation is None:
+    if await automation_cache.get(session, automation_id) is None:
         raise ValueError("Automation not found")
 
     if idempotency_key:
@@ -46,32 +56,90 @@ async def enqueue_run(
 
     try:
         await session.commit()
-    except IntegrityError:
+    except IntegrityError as e:
         await session.rollback()
         existing_stmt = select(Run).where(
             Run.automation_id == automation_id,
             Run.idempotency_key == idempotency_key,
         )
         existing_result = await session.execute(existing_stmt)
-        return existing_result.scalar_one()
-
-    await session.refresh(run)
+        existing_run = existing_result.scalar_one_or_none()
+        if existing_run is None:
+            # Not an idempotency race: the automation was deleted behind a cached check.
+            automation_cache.invalidate(automation_id)
+            raise ValueError("Automation not found") from e
+        return existing_run
 
+    RUN_QUEUE_DEPTH.inc()
     asyncio.create_task(execute_run_background(run.id))
 
     return run
 
 
-async def execute_run_background(run_id: UUID) -> None:
-    from prodapi.database import AsyncSessionLocal
+@traced("enqueue_runs_batch")
+async def enqueue_runs_batch(
+    session: AsyncSession,
+    automation_ids: Sequence[UUID],
+    triggered_by: TriggerType,
+    trigger_meta: dict[str, object] | None = None,
+) -> list[UUID]:
+    refs = await automation_cache.get_many(session, automation_ids)
+    enabled_ids = [ref.id for ref in refs.values() if ref.enabled]
+
+    if not enabled_ids:
+        return []
+
+    run_ids = [uuid4() for _ in enabled_ids]
+    queued_at = datetime.now(UTC)
+    rows = [
+        {
+            "id": run_id,
+            "automation_id": automation_id,
+            "status": RunStatus.QUEUED,
+            "queued_at": queued_at,
+            "triggered_by": triggered_by,
+            "trigger_meta": trigger_meta or {},
+            "idempotency_key": None,
+        }
+        for run_id, automation_id in zip(run_ids, enabled_ids, strict=True)
+    ]
+
+    await session.execute(insert(Run).values(rows))
+    await session.commit()
+
+    RUN_QUEUE_DEPTH.inc(amount=len(run_ids))
+    for run_id in run_ids:
+        asyncio.create_task(execute_run_background(run_id))
 
-    async with AsyncSessionLocal() as session:
-        await execute_run(session, run_id)
+    return run_ids
 
 
+async def execute_run_background(run_id: UUID) -> None:
+    from prodapi.database import AsyncSessionLocal
+
+    try:
+        with statement_budget(
+            f"run {run_id}",
+            settings.sql_run_statement_budget,
+            settings.sql_repeated_statement_threshold,
+            scope="run",
+            isolated=True,
+        ):
+            async with AsyncSessionLocal() as session:
+                await execute_run(session, run_id)
+    finally:
+        RUN_QUEUE_DEPTH.dec()
+
+
+@traced("execute_run")
 async def execute_run(session: AsyncSession, run_id: UUID) -> None:
     from prodapi.services.webhook import deliver_webhook
 
+    tag_current_task(f"run:{run_id}")
+    span = current_span()
+    if span is not None:
+        span.set_attribute("run.id", str(run_id))
+
     stmt = select(Run).where(Run.id == run_id)
     result = await session.execute(stmt)
     run = result.scalar_one_or_none()
@@ -79,32 +147,70 @@ async def execute_run(session: AsyncSession, run_id: UUID) -> None:
     if run is None:
         return
 
-    run.status = RunStatus.RUNNING
-    run.started_at = datetime.now(UTC)
-    await session.commit()
-
-    automation_stmt = select(Automation).where(Automation.id == run.automation_id)
-    automation_result = await session.execute(automation_stmt)
-    automation = automation_result.scalar_one()
-
-    try:
-        automation_type = AutomationType(automation.type)
-        executor = REGISTRY[automation_type]
-
-        summary = await executor.execute(automation.config_json)
-
-        if automation_type == AutomationType.GITHUB_MONITOR and "updated_state" in summary:
-            automation.config_json["state"] = summary["updated_state"]
-            await session.commit()
+    # Opt-in per run: POST /automations/{id}/run with {"profile": true}.
+    profile = (
+        RunProfile(settings.run_profile_sample_interval_ms)
+        if run.trigger_meta.get("profile")
+        else None
+    )
 
-        run.status = RunStatus.SUCCESS
-        run.summary_json = summary
-        run.error_text = None
+    with profiled(profile):
+        run.status = RunStatus.RUNNING
+        run.started_at = datetime.now(UTC)
+        await session.commit()
 
-    except Exception as e:
-        run.status = RunStatus.FAILED
-        run.summary_json = None
-        run.error_text = str(e)
+        automation_stmt = select(Automation).where(Automation.id == run.automation_id)
+        automation_result = await session.execute(automation_stmt)
+        automation = automation_result.scalar_one()
+
+        queued_at = run.queued_at if run.queued_at.tzinfo else run.queued_at.replace(tzinfo=UTC)
+        RUN_QUEUE_WAIT.observe((run.started_at - queued_at).total_seconds(), automation.type)
+
+        summary: dict[str, Any] | None = None
+
+        try:
+            automation_type = AutomationType(automation.type)
+            executor = REGISTRY[automation_type]
+
+            with tracer.span(
+                "executor.execute",
+                attributes={
+                    "automation.type": automation.type,
+                    "automation.execution_hint": executor.execution_hint,
+                },
+            ):
+                if executor.execution_hint == "cpu":
+                    summary = await executor_pool.run(
+                        execute_in_worker, automation.type, automation.config_json
+                    )
+                else:
+                    config = config_cache.get(
+                        automation.id, automation.type, automation.config_json
+                    )
+                    summary = await executor.execute(config)
+
+            if automation_type == AutomationType.GITHUB_MONITOR and "updated_state" in summary:
+                automation.config_json["state"] = summary["updated_state"]
+                await session.commit()
+
+            summary, full_items = apply_output_budget(summary, executor.output_budget)
+            if full_items is not None:
+                run.items_ref = await blob_store.aput_json(full_items)
+
+            run.status = RunStatus.SUCCESS
+            run.summary_json, run.summary_ref = await offload_summary(summary)
+            run.error_text = None
+
+        except Exception as e:
+            summary = None
+            run.status = RunStatus.FAILED
+            run.summary_json = None
+            run.summary_ref = None
+            run.items_ref = None
+            run.error_text = str(e)
+
+    if profile is not None:
+        run.profile_ref = await blob_store.aput_json(profile.to_dict())
 
     run.ended_at = datetime.now(UTC)
     started = run.started_at
@@ -112,8 +218,10 @@ async def execute_run(session: AsyncSession, run_id: UUID) -> None:
     if started and ended:
         duration = ended - started
         run.duration_ms = int(duration.total_seconds() * 1000)
+        RUN_DURATION.observe(duration.total_seconds(), automation.type)
 
     await session.commit()
+    RUNS_TOTAL.inc(automation.type, run.status)
 
     webhook_url = automation.config_json.get("webhook_url")
     if webhook_url:
@@ -124,7 +232,7 @@ async def execute_run(session: AsyncSession, run_id: UUID) -> None:
                 run_id=run.id,
                 status=run.status,
                 automation_type=automation.type,
-                summary=run.summary_json,
+                summary=summary,
                 error=run.error_text,
             )
         )
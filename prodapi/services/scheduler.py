@@ -1,37 +1,336 @@
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy import select
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from prodapi.models import Automation, Schedule, TriggerType
-from prodapi.services.runner import enqueue_run
+from prodapi.config import settings
+from prodapi.models import Automation, MisfirePolicy, Schedule, TriggerType
+from prodapi.services.cron import build_trigger, jitter_offset, missed_fire_times
+from prodapi.services.runner import enqueue_run, enqueue_runs_batch
+from prodapi.services.scheduler_backends import BackendName, SchedulerBackend, create_backend
+
+logger = logging.getLogger(__name__)
+
+SYNC_JOB_ID = "__schedule_sync__"
+SYNC_OVERLAP = timedelta(minutes=1)
+
+
+@dataclass(frozen=True)
+class ScheduleSyncReport:
+    full: bool
+    added: int
+    updated: int
+    removed: int
+    elapsed_ms: float
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+@dataclass(frozen=True)
+class CatchUpRun:
+    schedule_id: UUID
+    automation_id: UUID
+    scheduled_for: datetime
+
+
+class FireBatcher:
+    def __init__(
+        self,
+        flush: Callable[[list[UUID]], Coroutine[Any, Any, None]],
+        window_seconds: float,
+        max_size: int,
+    ) -> None:
+        self.flush = flush
+        self.window_seconds = window_seconds
+        self.max_size = max_size
+        self._pending: list[UUID] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def submit(self, automation_ids: list[UUID]) -> None:
+        self._pending.extend(automation_ids)
+
+        if len(self._pending) >= self.max_size:
+            self.flush_pending()
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.window_seconds, self.flush_pending)
+
+    def flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        for start in range(0, len(pending), self.max_size):
+            task = asyncio.create_task(self.flush(pending[start : start + self.max_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
 
 
 class SchedulerService:
-    def __init__(self) -> None:
+    def __init__(self, backend: BackendName = "apscheduler") -> None:
         self.scheduler = AsyncIOScheduler()
+        self.batcher = FireBatcher(
+            flush=self._enqueue_batch,
+            window_seconds=settings.schedule_batch_window_ms / 1000,
+            max_size=settings.schedule_batch_max_size,
+        )
+        self.backend: SchedulerBackend = create_backend(
+            backend, self.scheduler, self._trigger_automations
+        )
+        self._synced: dict[UUID, datetime] = {}
+        self._watermark: datetime | None = None
+        self._catchup_task: asyncio.Task[None] | None = None
 
     def start(self) -> None:
         if not self.scheduler.running:
             self.scheduler.start()
+            self.backend.start()
 
     def shutdown(self) -> None:
+        if self._catchup_task is not None:
+            self._catchup_task.cancel()
+            self._catchup_task = None
+
         if self.scheduler.running:
+            self.backend.shutdown()
             self.scheduler.shutdown()
 
-    async def restore_schedules(self, session: AsyncSession) -> None:
-        stmt = select(Schedule).where(Schedule.enabled == True)  # noqa: E712
+    def start_sync_loop(self, interval_seconds: int) -> None:
+        if interval_seconds <= 0:
+            return
+
+        self.scheduler.add_job(
+            func=self._sync_job,
+            trigger="interval",
+            seconds=interval_seconds,
+            id=SYNC_JOB_ID,
+            replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+        )
+
+    async def restore_schedules(self, session: AsyncSession) -> ScheduleSyncReport:
+        report = await self.sync_schedules(session)
+        logger.info(
+            "Restored %d schedules in %.1f ms",
+            report.added,
+            report.elapsed_ms,
+        )
+
+        catchup = await self.plan_catchup(session, datetime.now(UTC))
+        if catchup:
+            logger.info("Replaying %d missed scheduled runs", len(catchup))
+            self._catchup_task = asyncio.create_task(
+                self._run_catchup(catchup, settings.schedule_catchup_rate_per_second)
+            )
+
+        return report
+
+    async def plan_catchup(self, session: AsyncSession, now: datetime) -> list[CatchUpRun]:
+        stmt = (
+            select(
+                Schedule.id,
+                Schedule.automation_id,
+                Schedule.cron,
+                Schedule.timezone,
+                Schedule.jitter_seconds,
+                Schedule.misfire_policy,
+                Schedule.last_fired_at,
+            )
+            .join(Automation)
+            .where(
+                Schedule.enabled == True,  # noqa: E712
+                Automation.enabled == True,  # noqa: E712
+                Schedule.misfire_policy != MisfirePolicy.SKIP,
+                Schedule.last_fired_at.is_not(None),
+            )
+        )
         result = await session.execute(stmt)
-        schedules = result.scalars().all()
-
-        for schedule in schedules:
-            self.add_schedule(
-                schedule_id=schedule.id,
-                automation_id=schedule.automation_id,
-                cron=schedule.cron,
-                timezone=schedule.timezone,
+
+        plan: list[CatchUpRun] = []
+        for row in result.all():
+            offset = self.jitter_offset_for(row.id, row.jitter_seconds)
+            try:
+                trigger = build_trigger(row.cron, row.timezone, offset)
+            except ValueError:
+                continue
+
+            limit = 1
+            if row.misfire_policy == MisfirePolicy.RUN_ALL_BOUNDED:
+                limit = settings.schedule_catchup_max_runs
+
+            missed = missed_fire_times(trigger, row.last_fired_at, now, limit)
+            plan.extend(
+                CatchUpRun(
+                    schedule_id=row.id,
+                    automation_id=row.automation_id,
+                    scheduled_for=fire_time,
+                )
+                for fire_time in missed
+            )
+
+        plan.sort(key=lambda run: run.scheduled_for)
+        return plan
+
+    async def _run_catchup(self, plan: list[CatchUpRun], rate_per_second: float) -> None:
+        from prodapi.database import AsyncSessionLocal
+
+        interval = 1 / rate_per_second
+
+        for item in plan:
+            try:
+                async with AsyncSessionLocal() as session:
+                    await enqueue_run(
+                        session=session,
+                        automation_id=item.automation_id,
+                        triggered_by=TriggerType.SCHEDULE,
+                        trigger_meta={
+                            "scheduled": True,
+                            "catchup": True,
+                            "scheduled_for": item.scheduled_for.isoformat(),
+                        },
+                        idempotency_key=(
+                            f"catchup:{item.schedule_id}:{item.scheduled_for:%Y%m%dT%H%M%S}"
+                        ),
+                    )
+                    await session.execute(
+                        update(Schedule)
+                        .where(
+                            Schedule.id == item.schedule_id,
+                            or_(
+                                Schedule.last_fired_at.is_(None),
+                                Schedule.last_fired_at < item.scheduled_for,
+                            ),
+                        )
+                        .values(
+                            last_fired_at=item.scheduled_for,
+                            updated_at=Schedule.updated_at,
+                        )
+                    )
+                    await session.commit()
+            except Exception:
+                logger.exception("Catch-up run for schedule %s failed", item.schedule_id)
+
+            await asyncio.sleep(interval)
+
+    async def sync_schedules(self, session: AsyncSession) -> ScheduleSyncReport:
+        started = time.perf_counter()
+        full = self._watermark is None
+
+        stmt = select(
+            Schedule.id,
+            Schedule.automation_id,
+            Schedule.cron,
+            Schedule.timezone,
+            Schedule.enabled,
+            Schedule.jitter_seconds,
+            Schedule.updated_at,
+        )
+        if self._watermark is None:
+            stmt = stmt.where(Schedule.enabled == True)  # noqa: E712
+        else:
+            stmt = stmt.where(Schedule.updated_at >= self._watermark - SYNC_OVERLAP)
+
+        # updated_at is stored naive (UTC), so the fallback watermark is too.
+        queried_at = datetime.now(UTC).replace(tzinfo=None)
+        result = await session.execute(stmt)
+
+        added = updated = removed = 0
+        watermark = self._watermark
+
+        for row in result.all():
+            if watermark is None or row.updated_at > watermark:
+                watermark = row.updated_at
+
+            known = self._synced.get(row.id)
+            if known == row.updated_at:
+                continue
+
+            if not row.enabled:
+                if known is not None:
+                    self.remove_schedule(row.id)
+                    removed += 1
+                continue
+
+            try:
+                self.add_schedule(
+                    schedule_id=row.id,
+                    automation_id=row.automation_id,
+                    cron=row.cron,
+                    timezone=row.timezone,
+                    jitter_seconds=row.jitter_seconds,
+                )
+            except ValueError as e:
+                logger.warning("Skipping schedule %s: %s", row.id, e)
+                # Recorded so the next syncs neither retry it until it changes nor miss
+                # the enabled-count check in _remove_deleted; an older valid cron stops.
+                self.backend.remove(row.id)
+                self._synced[row.id] = row.updated_at
+                continue
+
+            self._synced[row.id] = row.updated_at
+            if known is None:
+                added += 1
+            else:
+                updated += 1
+
+        if not full:
+            removed += await self._remove_deleted(session)
+
+        # Without any row to take it from, a first sync over an empty table would
+        # leave the watermark unset and make every later sync a full reload.
+        self._watermark = watermark if watermark is not None else queried_at
+
+        return ScheduleSyncReport(
+            full=full,
+            added=added,
+            updated=updated,
+            removed=removed,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    async def _remove_deleted(self, session: AsyncSession) -> int:
+        count_stmt = select(func.count()).select_from(Schedule).where(
+            Schedule.enabled == True  # noqa: E712
+        )
+        enabled_count = (await session.execute(count_stmt)).scalar_one()
+        if enabled_count == len(self._synced):
+            return 0
+
+        ids_stmt = select(Schedule.id).where(Schedule.enabled == True)  # noqa: E712
+        live_ids = set((await session.execute(ids_stmt)).scalars().all())
+
+        stale_ids = self._synced.keys() - live_ids
+        for schedule_id in stale_ids:
+            self.remove_schedule(schedule_id)
+
+        return len(stale_ids)
+
+    async def _sync_job(self) -> None:
+        from prodapi.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as session:
+            report = await self.sync_schedules(session)
+
+        if report.changed:
+            logger.info(
+                "Schedule sync: %d added, %d updated, %d removed in %.1f ms",
+                report.added,
+                report.updated,
+                report.removed,
+                report.elapsed_ms,
             )
 
     def add_schedule(
@@ -40,43 +339,59 @@ class SchedulerService:
         automation_id: UUID,
         cron: str,
         timezone: str,
+        jitter_seconds: int | None = None,
     ) -> None:
-        job_id = str(schedule_id)
+        offset = self.jitter_offset_for(schedule_id, jitter_seconds)
+        self.backend.add(schedule_id, automation_id, cron, timezone, offset)
 
-        if self.scheduler.get_job(job_id):
-            self.scheduler.remove_job(job_id)
+    @staticmethod
+    def jitter_offset_for(schedule_id: UUID, jitter_seconds: int | None) -> int:
+        if jitter_seconds is None:
+            jitter_seconds = settings.schedule_default_jitter_seconds
+        return jitter_offset(schedule_id, jitter_seconds)
 
-        trigger = CronTrigger.from_crontab(cron, timezone=timezone)
+    def remove_schedule(self, schedule_id: UUID) -> None:
+        self._synced.pop(schedule_id, None)
+        self.backend.remove(schedule_id)
 
-        self.scheduler.add_job(
-            func=self._trigger_automation,
-            trigger=trigger,
-            id=job_id,
-            kwargs={"automation_id": automation_id},
-            replace_existing=True,
-        )
+    def is_running(self) -> bool:
+        return bool(self.scheduler.running) and self.backend.is_alive()
 
-    def remove_schedule(self, schedule_id: UUID) -> None:
-        job_id = str(schedule_id)
-        if self.scheduler.get_job(job_id):
-            self.scheduler.remove_job(job_id)
+    def has_schedule(self, schedule_id: UUID) -> bool:
+        return self.backend.has(schedule_id)
+
+    def job_count(self) -> int:
+        return self.backend.job_count()
+
+    async def _trigger_automations(self, automation_ids: list[UUID]) -> None:
+        self.batcher.submit(automation_ids)
 
     @staticmethod
-    async def _trigger_automation(automation_id: UUID) -> None:
+    async def _enqueue_batch(automation_ids: list[UUID]) -> None:
         from prodapi.database import AsyncSessionLocal
 
-        async with AsyncSessionLocal() as session:
-            stmt = select(Automation).where(Automation.id == automation_id)
-            result = await session.execute(stmt)
-            automation = result.scalar_one_or_none()
+        fired_at = datetime.now(UTC)
 
-            if automation and automation.enabled:
-                await enqueue_run(
+        try:
+            async with AsyncSessionLocal() as session:
+                # updated_at is pinned so firing does not look like an edit to the sync loop.
+                await session.execute(
+                    update(Schedule)
+                    .where(Schedule.automation_id.in_(automation_ids))
+                    .values(last_fired_at=fired_at, updated_at=Schedule.updated_at)
+                )
+                run_ids = await enqueue_runs_batch(
                     session=session,
-                    automation_id=automation_id,
+                    automation_ids=automation_ids,
                     triggered_by=TriggerType.SCHEDULE,
                     trigger_meta={"scheduled": True},
                 )
+                await session.commit()
+        except Exception:
+            logger.exception("Failed to enqueue %d scheduled runs", len(automation_ids))
+            return
+
+        logger.debug("Enqueued %d scheduled runs in one batch", len(run_ids))
 
 
-scheduler_service = SchedulerService()
+scheduler_service = SchedulerService(settings.scheduler_backend)
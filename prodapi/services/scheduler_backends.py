@@ -0,0 +1,247 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Literal, Protocol
+from uuid import UUID
+
+from apscheduler.events import EVENT_JOB_SUBMITTED, JobSubmissionEvent
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.base import BaseTrigger
+
+from prodapi.observability.metrics import SCHEDULER_FIRE_LAG
+from prodapi.services.cron import build_trigger
+
+logger = logging.getLogger(__name__)
+
+BackendName = Literal["apscheduler", "heap"]
+FireCallback = Callable[[list[UUID]], Coroutine[Any, Any, None]]
+GroupKey = tuple[str, str, int]
+
+
+class SchedulerBackend(Protocol):
+    def start(self) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+    def add(
+        self,
+        schedule_id: UUID,
+        automation_id: UUID,
+        cron: str,
+        timezone: str,
+        offset_seconds: int = 0,
+    ) -> None: ...
+
+    def remove(self, schedule_id: UUID) -> None: ...
+
+    def has(self, schedule_id: UUID) -> bool: ...
+
+    def job_count(self) -> int: ...
+
+    def is_alive(self) -> bool: ...
+
+
+class APSchedulerBackend:
+    def __init__(self, scheduler: AsyncIOScheduler, on_fire: FireCallback) -> None:
+        self.scheduler = scheduler
+        self.on_fire = on_fire
+        self._job_ids: set[str] = set()
+        scheduler.add_listener(self._record_fire_lag, EVENT_JOB_SUBMITTED)
+
+    def start(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+    def add(
+        self,
+        schedule_id: UUID,
+        automation_id: UUID,
+        cron: str,
+        timezone: str,
+        offset_seconds: int = 0,
+    ) -> None:
+        job_id = str(schedule_id)
+
+        if self.scheduler.get_job(job_id):
+            self.scheduler.remove_job(job_id)
+
+        trigger = build_trigger(cron, timezone, offset_seconds)
+
+        self.scheduler.add_job(
+            func=self._fire,
+            trigger=trigger,
+            id=job_id,
+            kwargs={"automation_id": automation_id},
+            replace_existing=True,
+        )
+        self._job_ids.add(job_id)
+
+    def remove(self, schedule_id: UUID) -> None:
+        job_id = str(schedule_id)
+        self._job_ids.discard(job_id)
+        if self.scheduler.get_job(job_id):
+            self.scheduler.remove_job(job_id)
+
+    def has(self, schedule_id: UUID) -> bool:
+        return self.scheduler.get_job(str(schedule_id)) is not None
+
+    def job_count(self) -> int:
+        return len(self._job_ids)
+
+    def is_alive(self) -> bool:
+        return bool(self.scheduler.running)
+
+    async def _fire(self, automation_id: UUID) -> None:
+        await self.on_fire([automation_id])
+
+    def _record_fire_lag(self, event: JobSubmissionEvent) -> None:
+        if event.job_id not in self._job_ids:
+            return
+        now = datetime.now(UTC)
+        for scheduled in event.scheduled_run_times:
+            SCHEDULER_FIRE_LAG.observe((now - scheduled).total_seconds(), "apscheduler")
+
+
+@dataclass
+class _CronGroup:
+    trigger: BaseTrigger
+    next_fire: datetime | None
+    members: dict[UUID, UUID] = field(default_factory=dict)
+
+
+class HeapSchedulerBackend:
+    def __init__(self, on_fire: FireCallback) -> None:
+        self.on_fire = on_fire
+        self._groups: dict[GroupKey, _CronGroup] = {}
+        self._membership: dict[UUID, GroupKey] = {}
+        self._heap: list[tuple[datetime, int, GroupKey]] = []
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._pending: set[asyncio.Task[None]] = set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            self._task.add_done_callback(self._log_crash)
+
+    def shutdown(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def add(
+        self,
+        schedule_id: UUID,
+        automation_id: UUID,
+        cron: str,
+        timezone: str,
+        offset_seconds: int = 0,
+    ) -> None:
+        key = (cron, timezone, offset_seconds)
+        if self._membership.get(schedule_id) == key:
+            self._groups[key].members[schedule_id] = automation_id
+            return
+
+        group = self._groups.get(key)
+        if group is None:
+            trigger = build_trigger(cron, timezone, offset_seconds)
+            next_fire = trigger.get_next_fire_time(None, datetime.now(UTC))
+            group = _CronGroup(trigger=trigger, next_fire=next_fire)
+            self._groups[key] = group
+            self._push(key, group)
+
+        self.remove(schedule_id)
+        group.members[schedule_id] = automation_id
+        self._membership[schedule_id] = key
+
+    def remove(self, schedule_id: UUID) -> None:
+        key = self._membership.pop(schedule_id, None)
+        if key is None:
+            return
+
+        group = self._groups[key]
+        group.members.pop(schedule_id, None)
+        if not group.members:
+            # The heap entry becomes stale and is dropped when popped.
+            del self._groups[key]
+
+    def has(self, schedule_id: UUID) -> bool:
+        return schedule_id in self._membership
+
+    def job_count(self) -> int:
+        return len(self._membership)
+
+    def is_alive(self) -> bool:
+        # APScheduler keeps "running" even if the timer task below has died.
+        return self._task is not None and not self._task.done()
+
+    def group_count(self) -> int:
+        return len(self._groups)
+
+    def pop_due(self, now: datetime) -> list[list[UUID]]:
+        batches: list[list[UUID]] = []
+
+        while self._heap and self._heap[0][0] <= now:
+            fire_time, _, key = heapq.heappop(self._heap)
+            group = self._groups.get(key)
+            if group is None or group.next_fire != fire_time:
+                continue
+
+            batches.append(list(group.members.values()))
+            SCHEDULER_FIRE_LAG.observe((now - fire_time).total_seconds(), "heap")
+
+            after = max(now, fire_time + timedelta(microseconds=1))
+            group.next_fire = group.trigger.get_next_fire_time(None, after)
+            self._push(key, group)
+
+        return batches
+
+    def _push(self, key: GroupKey, group: _CronGroup) -> None:
+        if group.next_fire is None:
+            return
+
+        is_earliest = not self._heap or group.next_fire < self._heap[0][0]
+        heapq.heappush(self._heap, (group.next_fire, next(self._seq), key))
+        if is_earliest:
+            self._wakeup.set()
+
+    @staticmethod
+    def _log_crash(task: asyncio.Task[None]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Heap scheduler stopped firing", exc_info=task.exception())
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+
+            for automation_ids in self.pop_due(datetime.now(UTC)):
+                task = asyncio.create_task(self.on_fire(automation_ids))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+
+            timeout = None
+            if self._heap:
+                delay = self._heap[0][0] - datetime.now(UTC)
+                timeout = max(delay.total_seconds(), 0.0)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except TimeoutError:
+                pass
+
+
+def create_backend(
+    name: BackendName,
+    scheduler: AsyncIOScheduler,
+    on_fire: FireCallback,
+) -> SchedulerBackend:
+    if name == "heap":
+        return HeapSchedulerBackend(on_fire)
+    return APSchedulerBackend(scheduler, on_fire)
@@ -1,16 +1,24 @@
 import asyncio
 import logging
+import time
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
 import httpx
 
+from prodapi.observability.metrics import (
+    WEBHOOK_ATTEMPT_DURATION,
+    WEBHOOK_DELIVERIES,
+    WEBHOOK_RETRIES,
+)
+from prodapi.observability.tracing import traced, traced_async_client
 from prodapi.schemas.webhook import WebhookPayload
 
 logger = logging.getLogger(__name__)
 
 
+@traced("deliver_webhook")
 async def deliver_webhook(
     webhook_url: str,
     automation_id: UUID,
@@ -33,14 +41,17 @@ async def deliver_webhook(
     )
 
     for attempt in range(max_retries):
+        started = time.perf_counter()
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with traced_async_client(timeout=30.0) as client:
                 response = await client.post(
                     webhook_url,
                     json=payload.model_dump(mode="json"),
                     headers={"Content-Type": "application/json"},
                 )
                 response.raise_for_status()
+                WEBHOOK_ATTEMPT_DURATION.observe(time.perf_counter() - started, "success")
+                WEBHOOK_DELIVERIES.inc("delivered")
                 logger.info(
                     "Webhook delivered to %s for run %s",
                     webhook_url,
@@ -48,7 +59,9 @@ async def deliver_webhook(
                 )
                 return
         except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            WEBHOOK_ATTEMPT_DURATION.observe(time.perf_counter() - started, "error")
             if attempt == max_retries - 1:
+                WEBHOOK_DELIVERIES.inc("failed")
                 logger.error(
                     "Webhook delivery failed after %d retries to %s for run %s: %s",
                     max_retries,
@@ -58,5 +71,6 @@ async def deliver_webhook(
                 )
                 return
 
+            WEBHOOK_RETRIES.inc()
             backoff = 2**attempt
             await asyncio.sleep(backoff)
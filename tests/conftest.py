@@ -1,14 +1,28 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from prodapi.app import app
 from prodapi.database import get_session
 from prodapi.models import Base
+from prodapi.observability.sql_budget import StatementBudget, count_statements, statement_budget
+from prodapi.services.automation_cache import automation_cache
+from prodapi.services.config_cache import config_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_automation_cache() -> Iterator[None]:
+    automation_cache.clear()
+    config_cache.clear()
+    yield
+    automation_cache.clear()
+    config_cache.clear()
 
 
 @pytest.fixture
@@ -19,6 +33,12 @@ async def engine() -> Any:
         poolclass=StaticPool,
     )
 
+    @event.listens_for(engine.sync_engine, "connect")
+    def enable_foreign_keys(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -54,3 +74,16 @@ async def client(session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield client
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def max_statements(engine: Any) -> Callable[[int], AbstractContextManager[StatementBudget]]:
+    count_statements(engine)
+
+    @contextmanager
+    def assert_max_statements(limit: int) -> Iterator[StatementBudget]:
+        with statement_budget("test", limit, report=False) as budget:
+            yield budget
+        assert not budget.exceeded, budget.describe()
+
+    return assert_max_statements
@@ -1,10 +1,31 @@
+import random
+from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from prodapi.models import ApiKey, Automation, Run, RunStatus, Schedule, TriggerType
-from prodapi.services.auth import create_api_key
+from prodapi.models import (
+    ApiKey,
+    Automation,
+    AutomationType,
+    MisfirePolicy,
+    Run,
+    RunStatus,
+    Schedule,
+    TriggerType,
+)
+from prodapi.services.auth import create_api_key, hash_api_key
+
+# Skewed like production: mostly successes, a tail of failures, few in flight.
+RUN_STATUS_WEIGHTS = {
+    RunStatus.SUCCESS: 0.86,
+    RunStatus.FAILED: 0.10,
+    RunStatus.QUEUED: 0.025,
+    RunStatus.RUNNING: 0.015,
+}
+GITHUB_EVENTS = ["issues", "pulls", "releases", "commits"]
+CRONS = ["0 * * * *", "*/5 * * * *", "*/15 * * * *", "0 9 * * *", "0 0 * * *", "30 8 * * 1-5"]
 
 
 async def create_test_api_key(session: AsyncSession, label: str = "test") -> tuple[ApiKey, str]:
@@ -66,3 +87,153 @@ async def create_test_schedule(
     await session.commit()
     await session.refresh(schedule)
     return schedule
+
+
+def seeded_uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def build_api_key_row(
+    rng: random.Random, index: int, anchor: datetime
+) -> tuple[dict[str, Any], str]:
+    raw_key = f"seed-{rng.getrandbits(128):032x}"
+    row = {
+        "id": seeded_uuid(rng),
+        "label": f"key-{index}",
+        "key_hash": hash_api_key(raw_key),
+        "revoked_at": anchor - timedelta(days=1) if rng.random() < 0.05 else None,
+        "last_used_at": anchor - timedelta(minutes=rng.randrange(60 * 24 * 7)),
+        "created_at": anchor - timedelta(days=rng.randrange(30, 365)),
+    }
+    return row, raw_key
+
+
+def build_automation_row(
+    rng: random.Random, owner_key_id: UUID, index: int, anchor: datetime
+) -> dict[str, Any]:
+    created_at = anchor - timedelta(days=rng.randrange(1, 365))
+    if rng.random() < 0.7:
+        automation_type = AutomationType.GITHUB_MONITOR
+        events = rng.sample(GITHUB_EVENTS, rng.randint(1, len(GITHUB_EVENTS)))
+        config: dict[str, Any] = {
+            "repo": f"org-{index % 97}/repo-{index}",
+            "events": events,
+            "github_token": None,
+            "webhook_url": f"https://hooks.example.com/{index}",
+            "state": {event: created_at.isoformat() for event in events},
+        }
+    else:
+        automation_type = AutomationType.DAILY_DIGEST
+        config = {
+            "webhook_url": f"https://hooks.example.com/{index}",
+            "only_failures": rng.random() < 0.3,
+            "max_items": 50,
+        }
+
+    return {
+        "id": seeded_uuid(rng),
+        "owner_key_id": owner_key_id,
+        "name": f"automation-{index}",
+        "type": automation_type,
+        "config_json": config,
+        "enabled": rng.random() < 0.9,
+        "created_at": created_at,
+        "updated_at": created_at + timedelta(hours=rng.randrange(24 * 30)),
+    }
+
+
+def build_schedule_row(rng: random.Random, automation_id: UUID, anchor: datetime) -> dict[str, Any]:
+    return {
+        "id": seeded_uuid(rng),
+        "automation_id": automation_id,
+        "cron": rng.choice(CRONS),
+        "timezone": rng.choice(["UTC", "UTC", "America/Sao_Paulo", "Europe/Berlin"]),
+        "enabled": rng.random() < 0.95,
+        "jitter_seconds": rng.choice([None, None, 30, 300]),
+        "misfire_policy": rng.choice(list(MisfirePolicy)),
+        "last_fired_at": anchor - timedelta(minutes=rng.randrange(60)),
+        "created_at": anchor - timedelta(days=30),
+        "updated_at": anchor - timedelta(days=rng.randrange(30)),
+    }
+
+
+def build_run_row(
+    rng: random.Random,
+    automation_id: UUID,
+    automation_type: str,
+    anchor: datetime,
+    days: int = 30,
+    max_items: int = 500,
+) -> dict[str, Any]:
+    status = rng.choices(list(RUN_STATUS_WEIGHTS), weights=list(RUN_STATUS_WEIGHTS.values()))[0]
+    in_flight = status in (RunStatus.QUEUED, RunStatus.RUNNING)
+    window = 3_600 if in_flight else days * 86_400
+    queued_at = anchor - timedelta(seconds=rng.randrange(window))
+
+    started_at = ended_at = duration_ms = summary = error = None
+    if status != RunStatus.QUEUED:
+        started_at = queued_at + timedelta(milliseconds=rng.randrange(50, 5_000))
+    if not in_flight:
+        duration_ms = int(rng.lognormvariate(6.5, 1.0))
+        ended_at = started_at + timedelta(milliseconds=duration_ms) if started_at else None
+    if status == RunStatus.SUCCESS:
+        summary = _build_summary(rng, automation_type, queued_at, max_items)
+    elif status == RunStatus.FAILED:
+        error = rng.choice(
+            [
+                "GitHub API rate limit exceeded for issues.",
+                "GitHub API error for pulls: 502",
+                "Webhook delivery failed",
+                "Timed out after 30s",
+            ]
+        )
+
+    return {
+        "id": seeded_uuid(rng),
+        "automation_id": automation_id,
+        "status": status,
+        "queued_at": queued_at,
+        "started_at": started_at,
+        "ended_at": ended_at,
+        "duration_ms": duration_ms,
+        "summary_json": summary,
+        "error_text": error,
+        "idempotency_key": None,
+        "triggered_by": TriggerType.SCHEDULE if rng.random() < 0.8 else TriggerType.MANUAL,
+        "trigger_meta": {"scheduled": True},
+    }
+
+
+def _build_summary(
+    rng: random.Random, automation_type: str, queued_at: datetime, max_items: int
+) -> dict[str, Any]:
+    # Pareto-distributed item counts: most runs find little, a few find hundreds.
+    count = min(int(rng.paretovariate(1.2)) - 1, max_items)
+    if automation_type == AutomationType.DAILY_DIGEST:
+        failed = min(count, 50)
+        return {
+            "title": "Daily Digest",
+            "total_runs": count * 10,
+            "success": count * 10 - failed,
+            "failed": failed,
+            "failures": [
+                {"run_id": str(seeded_uuid(rng)), "error": "Timed out after 30s"}
+                for _ in range(failed)
+            ],
+        }
+
+    return {
+        "repo": "org/repo",
+        "checked_at": queued_at.isoformat(),
+        "new_items": [
+            {
+                "type": rng.choice(GITHUB_EVENTS),
+                "title": f"Item {n} " + "x" * rng.randrange(10, 120),
+                "url": f"https://github.com/org/repo/issues/{n}",
+                "author": f"user-{rng.randrange(1_000)}",
+                "created_at": (queued_at - timedelta(minutes=n)).isoformat(),
+            }
+            for n in range(count)
+        ],
+        "new_items_count": count,
+    }
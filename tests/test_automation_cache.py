@@ -0,0 +1,99 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prodapi.models import Automation, Run, TriggerType
+from prodapi.observability.sql_budget import StatementBudget
+from prodapi.services.automation_cache import automation_cache
+from prodapi.services.runner import enqueue_runs_batch
+from tests.factories import create_test_api_key, create_test_automation
+
+MaxStatements = Callable[[int], AbstractContextManager[StatementBudget]]
+
+
+async def test_trigger_run_checks_ownership_from_cache(
+    session: AsyncSession, client: AsyncClient, max_statements: MaxStatements
+) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    _, other_raw_key = await create_test_api_key(session, "Other")
+    automation = await create_test_automation(session, api_key.id)
+    url = f"/automations/{automation.id}/run"
+
+    with patch("prodapi.services.runner.execute_run_background", new_callable=AsyncMock):
+        await client.post(url, headers={"X-API-Key": raw_key}, json={})
+        # Auth plus the INSERT: existence and ownership come from the cache.
+        with max_statements(2):
+            response = await client.post(url, headers={"X-API-Key": raw_key}, json={})
+        assert response.status_code == 202
+
+        response = await client.post(url, headers={"X-API-Key": other_raw_key}, json={})
+        assert response.status_code == 404
+
+
+async def test_writes_invalidate_cached_automation(
+    session: AsyncSession, client: AsyncClient
+) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    headers = {"X-API-Key": raw_key}
+    assert (await automation_cache.get(session, automation.id)) is not None
+
+    await client.patch(f"/automations/{automation.id}", headers=headers, json={"enabled": False})
+    ref = await automation_cache.get(session, automation.id)
+    assert ref is not None
+    assert not ref.enabled
+
+    with patch("prodapi.services.runner.execute_run_background", new_callable=AsyncMock):
+        run_ids = await enqueue_runs_batch(session, [automation.id], TriggerType.SCHEDULE)
+    assert run_ids == []
+
+    await client.delete(f"/automations/{automation.id}", headers=headers)
+    response = await client.post(f"/automations/{automation.id}/run", headers=headers, json={})
+    assert response.status_code == 404
+
+
+async def test_version_check_drops_entries_written_elsewhere(
+    session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    api_key, _ = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    await automation_cache.get(session, automation.id)
+
+    # Another replica disables the automation; this process never sees the write.
+    await session.execute(
+        update(Automation).where(Automation.id == automation.id).values(enabled=False)
+    )
+    await session.commit()
+
+    ref = await automation_cache.get(session, automation.id)
+    assert ref is not None and ref.enabled
+
+    monkeypatch.setattr(automation_cache, "version_check_seconds", 0.0)
+    ref = await automation_cache.get(session, automation.id)
+    assert ref is not None and not ref.enabled
+
+
+async def test_run_for_automation_deleted_behind_the_cache_is_rejected(
+    session: AsyncSession, client: AsyncClient
+) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    assert (await automation_cache.get(session, automation.id)) is not None
+
+    # Deleted by another replica: the cached entry is still within its version window.
+    await session.execute(delete(Automation).where(Automation.id == automation.id))
+    await session.commit()
+
+    with patch("prodapi.services.runner.execute_run_background", new_callable=AsyncMock):
+        response = await client.post(
+            f"/automations/{automation.id}/run", headers={"X-API-Key": raw_key}, json={}
+        )
+
+    assert response.status_code == 404
+    assert (await session.execute(select(func.count()).select_from(Run))).scalar_one() == 0
+    assert (await automation_cache.get(session, automation.id)) is None
@@ -50,6 +50,22 @@ async def test_list_automations(session: AsyncSession, client: AsyncClient) -> N
     assert len(data) == 2
 
 
+async def test_list_automations_masks_github_token(
+    session: AsyncSession, client: AsyncClient
+) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    await create_test_automation(
+        session,
+        api_key.id,
+        automation_type="github_monitor",
+        config={"repos": ["octo/repo"], "github_token": "ghp_secret"},
+    )
+
+    response = await client.get("/automations", headers={"X-API-Key": raw_key})
+    assert response.status_code == 200
+    assert response.json()[0]["config_json"]["github_token"] == "***"
+
+
 async def test_get_automation(session: AsyncSession, client: AsyncClient) -> None:
     api_key, raw_key = await create_test_api_key(session)
     automation = await create_test_automation(session, api_key.id)
@@ -0,0 +1,64 @@
+import argparse
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from benchmarks.suite import Context, teardown
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_suite_only_touches_the_given_database(tmp_path: Path) -> None:
+    scratch = tmp_path / "scratch.db"
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    env.pop("DATABASE_URL", None)
+
+    # Run from tmp_path: a suite that ignored --url would use ./prodapi.db here.
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.suite",
+            "--url",
+            f"sqlite+aiosqlite:///{scratch}",
+            "--scenarios",
+            "digest",
+            "--automations",
+            "2",
+            "--digest-runs",
+            "200",
+            "--rounds",
+            "1",
+        ],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.returncode == 0, result.stderr
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [line["benchmark"] for line in lines] == ["digest_query", "digest_query"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["scratch.db"]
+    # The suite created its tables in the scratch database and dropped them afterwards.
+    with sqlite3.connect(scratch) as conn:
+        tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    assert tables == []
+
+
+async def test_teardown_refuses_to_drop_another_database(tmp_path: Path) -> None:
+    args = argparse.Namespace(url=f"sqlite+aiosqlite:///{tmp_path / 'scratch.db'}")
+    ctx = Context(args=args, stub=Mock(), meta={}, out=None)
+
+    with (
+        patch("benchmarks.suite.drain", new_callable=AsyncMock),
+        pytest.raises(RuntimeError, match="refusing to drop tables"),
+    ):
+        await teardown(ctx)
@@ -0,0 +1,140 @@
+import hashlib
+import zlib
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prodapi.automations.base import OutputBudget
+from prodapi.config import settings
+from prodapi.models import RunStatus
+from prodapi.services import run_summary
+from prodapi.services.blob_store import BlobNotFoundError, BlobStore, blob_store
+from prodapi.services.run_summary import (
+    PREVIEW_LIST_ITEMS,
+    apply_output_budget,
+    offload_summary,
+)
+from tests.factories import create_test_api_key, create_test_automation, create_test_run
+
+
+def test_blob_store_roundtrip_is_content_addressed(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path)
+    data = b'{"new_items": []}' * 1000
+
+    ref = store.put(data)
+
+    assert store.put(data) == ref
+    assert store.get(ref) == data
+    assert len(list(tmp_path.rglob("*.*"))) == 1
+
+    with pytest.raises(BlobNotFoundError):
+        store.get(ref.replace(ref[-8:], "0" * 8))
+
+
+def test_blob_store_writes_zstd_and_reads_legacy_zlib(tmp_path: Path) -> None:
+    store = BlobStore(tmp_path)
+    data = b'{"failures": []}' * 1000
+
+    assert store.put(data).startswith("zstd:")
+
+    digest = hashlib.sha256(data).hexdigest()
+    legacy = store._path("zlib", digest)
+    legacy.parent.mkdir(parents=True, exist_ok=True)
+    legacy.write_bytes(zlib.compress(data))
+    assert store.get(f"zlib:{digest}") == data
+
+
+async def test_offload_summary_keeps_preview(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "summary_offload_threshold_bytes", 1024)
+    monkeypatch.setattr(run_summary.blob_store, "root", tmp_path)
+    summary = {"new_items": [{"title": f"Issue {n}"} for n in range(200)], "count": 200}
+
+    preview, ref = await offload_summary(summary)
+
+    assert ref is not None
+    assert preview["count"] == 200
+    assert len(preview["new_items"]) == PREVIEW_LIST_ITEMS
+    assert blob_store.get_json(ref) == summary
+
+    small, small_ref = await offload_summary({"count": 1})
+    assert small == {"count": 1}
+    assert small_ref is None
+
+
+async def test_get_run_loads_offloaded_summary(
+    session: AsyncSession,
+    client: AsyncClient,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(blob_store, "root", tmp_path)
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    run = await create_test_run(session, automation.id, RunStatus.SUCCESS)
+
+    full = {"new_items": list(range(100))}
+    run.summary_json = {"new_items": list(range(PREVIEW_LIST_ITEMS))}
+    run.summary_ref = blob_store.put_json(full)
+    await session.commit()
+
+    response = await client.get(f"/runs/{run.id}", headers={"X-API-Key": raw_key})
+    assert response.json()["summary_json"] == full
+
+    response = await client.get("/runs", headers={"X-API-Key": raw_key})
+    assert len(response.json()[0]["summary_json"]["new_items"]) == PREVIEW_LIST_ITEMS
+
+
+def test_apply_output_budget_truncates_items() -> None:
+    budget = OutputBudget(items_key="new_items", max_items=3, max_bytes=10_000)
+    summary = {"new_items": list(range(10)), "counts_by_type": {"issues": 10}}
+
+    truncated, full_items = apply_output_budget(summary, budget)
+
+    assert truncated["new_items"] == [0, 1, 2]
+    assert truncated["truncated"] is True
+    assert truncated["items_total"] == 10
+    assert truncated["counts_by_type"] == {"issues": 10}
+    assert full_items == list(range(10))
+
+    within, none = apply_output_budget({"new_items": [1]}, budget)
+    assert within == {"new_items": [1]}
+    assert none is None
+
+
+def test_apply_output_budget_respects_byte_limit() -> None:
+    budget = OutputBudget(items_key="new_items", max_items=100, max_bytes=50)
+    summary = {"new_items": ["x" * 20 for _ in range(10)]}
+
+    truncated, _ = apply_output_budget(summary, budget)
+
+    assert len(truncated["new_items"]) == 2
+
+
+async def test_list_run_items_pages_offloaded_items(
+    session: AsyncSession,
+    client: AsyncClient,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(blob_store, "root", tmp_path)
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id, automation_type="github_monitor")
+    run = await create_test_run(session, automation.id, RunStatus.SUCCESS)
+
+    run.summary_json = {"new_items": [0, 1], "truncated": True, "items_total": 25}
+    run.items_ref = blob_store.put_json(list(range(25)))
+    await session.commit()
+
+    response = await client.get(
+        f"/runs/{run.id}/items",
+        headers={"X-API-Key": raw_key},
+        params={"offset": 20, "limit": 10},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 25
+    assert data["items"] == [20, 21, 22, 23, 24]
@@ -0,0 +1,60 @@
+from typing import Any
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prodapi.automations.github_monitor import GitHubMonitorConfig, GitHubMonitorExecutor
+from prodapi.services.config_cache import ValidatedConfigCache, config_cache
+from tests.factories import create_test_api_key, create_test_automation
+
+
+def test_cached_config_is_reused_until_the_config_changes() -> None:
+    cache = ValidatedConfigCache(max_entries=1)
+    automation_id = uuid4()
+    config: dict[str, Any] = {"webhook_url": "https://example.com/webhook"}
+
+    first = cache.get(automation_id, "daily_digest", config)
+    assert cache.get(automation_id, "daily_digest", dict(config)) is first
+
+    # In-place edits of the dict handed in must not leak into the snapshot.
+    config["max_items"] = 5
+    changed = cache.get(automation_id, "daily_digest", config)
+    assert changed is not first
+    assert changed.max_items == 5  # type: ignore[attr-defined]
+
+    cache.get(uuid4(), "daily_digest", config)
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+async def test_github_monitor_does_not_mutate_cached_state() -> None:
+    validated = GitHubMonitorConfig.model_validate(
+        {"repo": "owner/repo", "webhook_url": "https://example.com/webhook", "events": ["issues"]}
+    )
+    mock_response = Mock(status_code=200, headers={})
+    mock_response.json.return_value = [{"title": "Bug", "created_at": "2024-01-02T00:00:00Z"}]
+
+    with patch("httpx.AsyncClient.get", return_value=mock_response):
+        result = await GitHubMonitorExecutor.execute(validated)
+
+    assert result["updated_state"] == {"issues": "2024-01-02T00:00:00Z"}
+    assert validated.state == {}
+
+
+async def test_config_update_invalidates_cached_config(
+    session: AsyncSession, client: AsyncClient
+) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    config_cache.get(automation.id, automation.type, automation.config_json)
+    assert len(config_cache) == 1
+
+    response = await client.patch(
+        f"/automations/{automation.id}",
+        headers={"X-API-Key": raw_key},
+        json={"config_json": {"webhook_url": "https://example.com/other"}},
+    )
+    assert response.status_code == 200
+    assert len(config_cache) == 0
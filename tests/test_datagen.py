@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, select
+
+from benchmarks.datagen import DatasetGenerator, DatasetSpec, load_dataset
+from prodapi.models import Automation, Run, RunStatus
+
+ANCHOR = datetime(2026, 1, 1)
+
+
+def _dataset(spec: DatasetSpec) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    generator = DatasetGenerator(spec)
+    keys = generator.api_keys()
+    automations = generator.automations([key["id"] for key in keys])
+    runs = [row for chunk in generator.runs(automations, chunk_size=64) for row in chunk]
+    return automations, runs
+
+
+def test_generator_is_deterministic_per_seed() -> None:
+    spec = DatasetSpec(seed=7, api_keys=5, automations=20, runs=200, anchor=ANCHOR)
+    other = DatasetSpec(seed=8, api_keys=5, automations=20, runs=200, anchor=ANCHOR)
+
+    assert _dataset(spec) == _dataset(spec)
+    assert _dataset(spec) != _dataset(other)
+
+
+def test_more_runs_keep_the_same_automations() -> None:
+    small = DatasetSpec(seed=7, api_keys=5, automations=20, runs=10, anchor=ANCHOR)
+    large = DatasetSpec(seed=7, api_keys=5, automations=20, runs=500, anchor=ANCHOR)
+
+    assert _dataset(small)[0] == _dataset(large)[0]
+
+
+async def test_load_dataset_bulk_inserts(engine: Any, session: Any) -> None:
+    spec = DatasetSpec(seed=1, api_keys=3, automations=30, runs=1_000, anchor=ANCHOR)
+
+    generator, reports = await load_dataset(engine, spec, chunk_size=250)
+
+    assert {report.table: report.rows for report in reports}["runs"] == 1_000
+    assert len(generator.raw_keys) == 3
+    assert await session.scalar(select(func.count()).select_from(Automation)) == 30
+
+    statuses = dict(
+        (await session.execute(select(Run.status, func.count()).group_by(Run.status))).all()
+    )
+    assert statuses[RunStatus.SUCCESS] > statuses[RunStatus.FAILED] > statuses[RunStatus.QUEUED]
@@ -1,7 +1,78 @@
+import asyncio
+from typing import Any
+from unittest.mock import Mock
+
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from prodapi.services.readiness import HealthProbe
+from prodapi.services.scheduler import SchedulerService
+from prodapi.services.scheduler_backends import HeapSchedulerBackend
 
 
 async def test_health(client: AsyncClient) -> None:
     response = await client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+async def test_ready_reports_every_dependency(client: AsyncClient) -> None:
+    response = await client.get("/health/ready")
+
+    body = response.json()
+    assert {check["name"] for check in body["checks"]} == {
+        "event_loop",
+        "scheduler",
+        "database",
+        "db_pool",
+        "run_queue",
+    }
+    # The scheduler is only started by the lifespan, which the test client skips.
+    assert response.status_code == 503
+    assert body["status"] == "unavailable"
+
+
+async def test_live_skips_external_dependencies(client: AsyncClient) -> None:
+    response = await client.get("/health/live")
+
+    names = {check["name"] for check in response.json()["checks"]}
+    assert names == {"event_loop"}
+    # A scheduler that is not running fails readiness, never liveness.
+    assert response.status_code == 200
+
+
+async def test_ready_fails_when_heap_scheduler_stops_firing(engine: Any) -> None:
+    scheduler = SchedulerService(backend="heap")
+    backend = scheduler.backend
+    assert isinstance(backend, HeapSchedulerBackend)
+    backend.pop_due = Mock(side_effect=RuntimeError("boom"))  # type: ignore[method-assign]
+    scheduler.start()
+    try:
+        await asyncio.sleep(0)
+
+        check = HealthProbe(engine, scheduler).check_scheduler()
+        assert scheduler.scheduler.running
+        assert not check.healthy
+    finally:
+        scheduler.shutdown()
+
+
+async def test_probe_is_cached_and_detects_database_failure(engine: Any) -> None:
+    scheduler = SchedulerService()
+    scheduler.start()
+    try:
+        probe = HealthProbe(engine, scheduler)
+        report = await probe.report("ready")
+        assert report.healthy
+        assert await probe.report("ready") is report
+
+        probe.engine = create_async_engine("sqlite+aiosqlite:////nonexistent/dir/db.sqlite")
+        assert await probe.report("ready") is report
+
+        probe._cache.clear()
+        failed = await probe.report("ready")
+        database = next(check for check in failed.checks if check.name == "database")
+        assert not failed.healthy
+        assert not database.healthy
+    finally:
+        scheduler.shutdown()
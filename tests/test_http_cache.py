@@ -0,0 +1,93 @@
+import gzip
+
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prodapi.models import RunStatus
+from prodapi.services.compression import negotiate_encoding
+from prodapi.services.http_cache import etag_matches, weak_etag
+from tests.factories import create_test_api_key, create_test_automation, create_test_run
+
+
+async def test_get_run_conditional_request(session: AsyncSession, client: AsyncClient) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    run = await create_test_run(session, automation.id)
+
+    response = await client.get(f"/runs/{run.id}", headers={"X-API-Key": raw_key})
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    response = await client.get(
+        f"/runs/{run.id}",
+        headers={"X-API-Key": raw_key, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    run.status = RunStatus.SUCCESS
+    await session.commit()
+
+    response = await client.get(
+        f"/runs/{run.id}",
+        headers={"X-API-Key": raw_key, "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+async def test_list_automations_conditional_request(
+    session: AsyncSession, client: AsyncClient
+) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    await create_test_automation(session, api_key.id)
+
+    response = await client.get("/automations", headers={"X-API-Key": raw_key})
+    etag = response.headers["ETag"]
+
+    response = await client.get(
+        "/automations",
+        headers={"X-API-Key": raw_key, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+
+    await create_test_automation(session, api_key.id, "Another")
+
+    response = await client.get(
+        "/automations",
+        headers={"X-API-Key": raw_key, "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+
+async def test_response_compression(client: AsyncClient) -> None:
+    async with client.stream(
+        "GET", "/openapi.json", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+    assert gzip.decompress(raw).startswith(b"{")
+
+    response = await client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+
+
+def test_negotiate_encoding() -> None:
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip, br, zstd") == "zstd"
+    assert negotiate_encoding("gzip, br") == "br"
+    assert negotiate_encoding("gzip;q=0, identity") is None
+    assert negotiate_encoding("") is None
+
+
+def test_etag_matches_uses_weak_comparison() -> None:
+    etag = weak_etag("run", "success")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"other"', etag)
+    assert not etag_matches(None, etag)
@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+from httpx import AsyncClient
+
+from prodapi.observability.loop_monitor import LagHistogram, LoopMonitor, tag_current_task
+
+
+def test_lag_histogram_is_cumulative() -> None:
+    histogram = LagHistogram()
+    for lag in (0.5, 3, 3, 80, 7000):
+        histogram.observe(lag)
+
+    buckets = histogram.cumulative()
+
+    assert buckets["1"] == 1
+    assert buckets["5"] == 3
+    assert buckets["100"] == 4
+    assert buckets["5000"] == 4
+    assert buckets["+Inf"] == 5
+    assert histogram.max_ms == 7000
+
+
+async def test_loop_monitor_samples_blocking_task() -> None:
+    monitor = LoopMonitor(interval_ms=10, slow_threshold_ms=50)
+    monitor.start()
+    await asyncio.sleep(0.03)
+
+    tag_current_task("run:blocking-test")
+    time.sleep(0.2)
+    await asyncio.sleep(0.03)
+    monitor.stop()
+
+    assert monitor.histogram.count > 0
+    spike = monitor.spikes[-1]
+    assert spike.lag_ms >= 100
+    assert spike.activity == "run:blocking-test"
+    assert any("time.sleep(0.2)" in line for line in spike.stack)
+
+
+async def test_loop_health_endpoint(client: AsyncClient) -> None:
+    response = await client.get("/health/loop")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is False
+    assert "+Inf" in data["buckets_ms"]
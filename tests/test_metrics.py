@@ -0,0 +1,62 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from httpx import AsyncClient
+
+from prodapi.observability.metrics import (
+    SCHEDULER_FIRE_LAG,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from prodapi.services.scheduler_backends import HeapSchedulerBackend
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("jobs_total", "Jobs", ("status",)))
+    gauge = registry.register(Gauge("pool_in_use", "In use"))
+    histogram = registry.register(Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0)))
+
+    counter.inc("ok")
+    counter.inc("ok")
+    gauge.set_function(lambda: 3)
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+
+    text = registry.render()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{status="ok"} 2' in text
+    assert "pool_in_use 3" in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "latency_seconds_count 2" in text
+
+
+async def test_metrics_endpoint_reports_route_latency(client: AsyncClient) -> None:
+    await client.get("/health")
+    await client.get("/does-not-exist")
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'prodapi_http_request_duration_seconds_count{method="GET",route="/health",status="200"}'
+        in response.text
+    )
+    assert 'route="unmatched",status="404"' in response.text
+
+
+def test_heap_backend_records_fire_lag() -> None:
+    backend = HeapSchedulerBackend(on_fire=AsyncMock())
+    backend.add(uuid4(), uuid4(), "* * * * *", "UTC")
+    before = SCHEDULER_FIRE_LAG.count("heap")
+
+    backend.pop_due(datetime.now(UTC) + timedelta(minutes=2))
+
+    assert SCHEDULER_FIRE_LAG.count("heap") > before
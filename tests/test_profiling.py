@@ -0,0 +1,101 @@
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prodapi.automations import REGISTRY
+from prodapi.models import AutomationType
+from prodapi.observability.profiling import RunProfile, current_profile, profile_engine, profiled
+from prodapi.observability.tracing import TracingTransport
+from prodapi.services.blob_store import blob_store
+from prodapi.services.runner import execute_run
+from tests.factories import create_test_api_key, create_test_automation, create_test_run
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+async def test_profile_records_stacks_sql_and_http(engine: Any) -> None:
+    profile_engine(engine)
+    transport = TracingTransport(httpx.MockTransport(lambda request: httpx.Response(204)))
+    profile = RunProfile(sample_interval_ms=1.0)
+
+    with profiled(profile):
+        assert current_profile() is profile
+        _spin(0.05)
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("https://api.example.com/repos/octo/repo?page=2")
+
+    assert current_profile() is None
+    artifact = profile.to_dict()
+    assert artifact["samples"] > 0
+    assert any(entry["function"].startswith("_spin ") for entry in artifact["functions"])
+    assert artifact["sql_count"] == 1
+    assert artifact["sql_statements"][0]["statement"] == "SELECT 1"
+    assert artifact["http_calls"] == [
+        {
+            "method": "GET",
+            "url": "https://api.example.com/repos/octo/repo",
+            "status": 204,
+            "elapsed_ms": artifact["http_calls"][0]["elapsed_ms"],
+        }
+    ]
+
+
+async def test_profiled_run_serves_profile(
+    engine: Any,
+    session: AsyncSession,
+    client: AsyncClient,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(blob_store, "root", tmp_path)
+    profile_engine(engine)
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+
+    async def execute(config: dict[str, Any]) -> dict[str, Any]:
+        _spin(0.02)
+        return {"rendered": True}
+
+    monkeypatch.setattr(REGISTRY[AutomationType.DAILY_DIGEST], "execute", execute)
+
+    with patch("prodapi.services.runner.execute_run_background", new_callable=AsyncMock):
+        response = await client.post(
+            f"/automations/{automation.id}/run",
+            headers={"X-API-Key": raw_key},
+            json={"profile": True},
+        )
+    run_id = response.json()["id"]
+    assert response.json()["trigger_meta"]["profile"] is True
+
+    await execute_run(session, UUID(run_id))
+
+    response = await client.get(f"/runs/{run_id}/profile", headers={"X-API-Key": raw_key})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["run_id"] == run_id
+    assert data["samples"] > 0
+    assert data["sql_count"] > 0
+
+    response = await client.get(
+        f"/runs/{run_id}/profile", headers={"X-API-Key": raw_key}, params={"format": "folded"}
+    )
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "_spin (test_profiling.py" in response.text
+
+    unprofiled = await create_test_run(session, automation.id)
+    response = await client.get(f"/runs/{unprofiled.id}/profile", headers={"X-API-Key": raw_key})
+    assert response.status_code == 404
@@ -1,7 +1,14 @@
+import os
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from prodapi.models import RunStatus
-from prodapi.services.runner import execute_run
+from prodapi.automations import REGISTRY
+from prodapi.models import AutomationType, Run, RunStatus, TriggerType
+from prodapi.services.process_pool import ExecutorPool
+from prodapi.services.runner import enqueue_runs_batch, execute_run
 from tests.factories import create_test_api_key, create_test_automation, create_test_run
 
 
@@ -34,3 +41,56 @@ async def test_execute_run_with_invalid_config(session: AsyncSession) -> None:
     await session.refresh(run)
     assert run.status == RunStatus.FAILED
     assert run.error_text is not None
+
+
+async def test_enqueue_runs_batch_skips_disabled(session: AsyncSession) -> None:
+    api_key, _ = await create_test_api_key(session)
+    first = await create_test_automation(session, api_key.id, "First")
+    second = await create_test_automation(session, api_key.id, "Second")
+    disabled = await create_test_automation(session, api_key.id, "Disabled")
+    disabled.enabled = False
+    await session.commit()
+
+    with patch("prodapi.services.runner.execute_run_background", new_callable=AsyncMock):
+        run_ids = await enqueue_runs_batch(
+            session,
+            [first.id, second.id, disabled.id],
+            triggered_by=TriggerType.SCHEDULE,
+            trigger_meta={"scheduled": True},
+        )
+
+    assert len(run_ids) == 2
+
+    result = await session.execute(select(Run).where(Run.id.in_(run_ids)))
+    runs = result.scalars().all()
+    assert {r.automation_id for r in runs} == {first.id, second.id}
+    assert all(r.status == RunStatus.QUEUED for r in runs)
+    assert all(r.trigger_meta == {"scheduled": True} for r in runs)
+
+
+async def test_cpu_executor_runs_in_process_pool(
+    session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    api_key, _ = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    run = await create_test_run(session, automation.id)
+
+    executor = REGISTRY[AutomationType.DAILY_DIGEST]
+    monkeypatch.setattr(executor, "execution_hint", "cpu")
+    pool_run = AsyncMock(return_value={"rendered": True})
+
+    with patch("prodapi.services.runner.executor_pool.run", pool_run):
+        await execute_run(session, run.id)
+
+    await session.refresh(run)
+    assert run.status == RunStatus.SUCCESS
+    assert run.summary_json == {"rendered": True}
+    assert pool_run.await_args.args[1:] == (automation.type, automation.config_json)
+
+
+async def test_executor_pool_uses_worker_processes() -> None:
+    pool = ExecutorPool(max_workers=1)
+    try:
+        assert await pool.run(os.getpid) != os.getpid()
+    finally:
+        pool.shutdown()
@@ -2,6 +2,7 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prodapi.models import RunStatus
+from prodapi.schemas.run import RunResponse
 from tests.factories import create_test_api_key, create_test_automation, create_test_run
 
 
@@ -74,6 +75,52 @@ async def test_list_runs_with_filter(session: AsyncSession, client: AsyncClient)
     assert data[0]["status"] == "failed"
 
 
+async def test_list_runs_sparse_fields(session: AsyncSession, client: AsyncClient) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    await create_test_run(session, automation.id, RunStatus.SUCCESS)
+
+    response = await client.get(
+        "/runs",
+        headers={"X-API-Key": raw_key},
+        params={"fields": "status,duration_ms"},
+    )
+    assert response.status_code == 200
+    assert set(response.json()[0]) == {"id", "status", "duration_ms"}
+
+    response = await client.get(
+        "/runs",
+        headers={"X-API-Key": raw_key},
+        params={"include_summary": "false"},
+    )
+    assert response.status_code == 200
+    data = response.json()[0]
+    assert "summary_json" not in data
+    assert "trigger_meta" not in data
+    assert data["status"] == "success"
+
+
+async def test_list_runs_schema_allows_sparse_items(client: AsyncClient) -> None:
+    schema = (await client.get("/openapi.json")).json()
+
+    items = schema["paths"]["/runs"]["get"]["responses"]["200"]["content"]["application/json"]
+    assert items["schema"]["items"]["$ref"] == "#/components/schemas/PartialRunResponse"
+    partial = schema["components"]["schemas"]["PartialRunResponse"]
+    assert partial["required"] == ["id"]
+    assert set(partial["properties"]) == set(RunResponse.model_fields)
+
+
+async def test_list_runs_unknown_field(session: AsyncSession, client: AsyncClient) -> None:
+    _, raw_key = await create_test_api_key(session)
+
+    response = await client.get(
+        "/runs",
+        headers={"X-API-Key": raw_key},
+        params={"fields": "status,owner_secret"},
+    )
+    assert response.status_code == 422
+
+
 async def test_get_run(session: AsyncSession, client: AsyncClient) -> None:
     api_key, raw_key = await create_test_api_key(session)
     automation = await create_test_automation(session, api_key.id)
@@ -0,0 +1,230 @@
+import asyncio
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prodapi.config import settings
+from prodapi.models import MisfirePolicy
+from prodapi.observability.sql_budget import StatementBudget
+from prodapi.services.cron import build_trigger, compile_cron, jitter_offset, missed_fire_times
+from prodapi.services.scheduler import FireBatcher, SchedulerService
+from prodapi.services.scheduler_backends import HeapSchedulerBackend
+from tests.factories import create_test_api_key, create_test_automation, create_test_schedule
+
+MaxStatements = Callable[[int], AbstractContextManager[StatementBudget]]
+
+
+async def test_restore_schedules(session: AsyncSession) -> None:
+    api_key, _ = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    schedule = await create_test_schedule(session, automation.id)
+
+    service = SchedulerService()
+    report = await service.restore_schedules(session)
+
+    assert report.full is True
+    assert report.added == 1
+    assert service.has_schedule(schedule.id)
+
+
+async def test_sync_schedules_is_incremental(session: AsyncSession) -> None:
+    api_key, _ = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    schedule = await create_test_schedule(session, automation.id)
+
+    service = SchedulerService()
+    await service.restore_schedules(session)
+
+    report = await service.sync_schedules(session)
+    assert report.full is False
+    assert not report.changed
+
+    schedule.cron = "30 1 * * *"
+    await session.commit()
+
+    report = await service.sync_schedules(session)
+    assert report.updated == 1
+    assert report.added == 0
+
+
+async def test_sync_schedules_removes_deleted(session: AsyncSession) -> None:
+    api_key, _ = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    schedule = await create_test_schedule(session, automation.id)
+
+    service = SchedulerService()
+    await service.restore_schedules(session)
+
+    await session.delete(schedule)
+    await session.commit()
+
+    report = await service.sync_schedules(session)
+    assert report.removed == 1
+    assert not service.has_schedule(schedule.id)
+
+
+async def test_sync_schedules_records_invalid_crons(
+    session: AsyncSession, max_statements: MaxStatements
+) -> None:
+    api_key, _ = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    other = await create_test_automation(session, api_key.id, "Other")
+    await create_test_schedule(session, automation.id)
+    invalid = await create_test_schedule(session, other.id, cron="not a cron")
+
+    service = SchedulerService()
+    report = await service.restore_schedules(session)
+    assert report.added == 1
+    assert not service.has_schedule(invalid.id)
+
+    # The changed-rows select and the enabled count match: no fallback id scan.
+    with max_statements(2):
+        report = await service.sync_schedules(session)
+    assert not report.changed
+
+
+async def test_sync_schedules_stays_incremental_after_empty_first_sync(
+    session: AsyncSession,
+) -> None:
+    service = SchedulerService()
+    report = await service.restore_schedules(session)
+    assert report.full is True
+
+    api_key, _ = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    schedule = await create_test_schedule(session, automation.id)
+
+    report = await service.sync_schedules(session)
+    assert report.full is False
+    assert report.added == 1
+    assert service.has_schedule(schedule.id)
+
+
+def test_heap_backend_groups_identical_crons() -> None:
+    backend = HeapSchedulerBackend(on_fire=AsyncMock())
+    hourly = [uuid4(), uuid4()]
+    half_past = uuid4()
+
+    backend.add(uuid4(), hourly[0], "0 * * * *", "UTC")
+    backend.add(uuid4(), hourly[1], "0 * * * *", "UTC")
+    backend.add(uuid4(), half_past, "30 * * * *", "UTC")
+
+    assert backend.job_count() == 3
+    assert backend.group_count() == 2
+
+    batches = backend.pop_due(datetime.now(UTC) + timedelta(hours=1, minutes=1))
+
+    assert sorted(len(batch) for batch in batches) == [1, 2]
+    assert set(hourly) in [set(batch) for batch in batches]
+
+
+def test_heap_backend_remove_drops_empty_group() -> None:
+    backend = HeapSchedulerBackend(on_fire=AsyncMock())
+    schedule_id = uuid4()
+
+    backend.add(schedule_id, uuid4(), "0 * * * *", "UTC")
+    backend.remove(schedule_id)
+
+    assert not backend.has(schedule_id)
+    assert backend.group_count() == 0
+    assert backend.pop_due(datetime.now(UTC) + timedelta(days=1)) == []
+
+
+async def test_fire_batcher_coalesces_within_window() -> None:
+    flush = AsyncMock()
+    batcher = FireBatcher(flush=flush, window_seconds=0.01, max_size=100)
+    first, second = uuid4(), uuid4()
+
+    batcher.submit([first])
+    batcher.submit([second])
+    await asyncio.sleep(0.05)
+
+    flush.assert_awaited_once_with([first, second])
+
+
+async def test_fire_batcher_splits_large_batches() -> None:
+    flush = AsyncMock()
+    batcher = FireBatcher(flush=flush, window_seconds=60, max_size=2)
+
+    batcher.submit([uuid4() for _ in range(5)])
+    await asyncio.sleep(0)
+
+    assert sorted(len(call.args[0]) for call in flush.await_args_list) == [1, 2, 2]
+
+
+def test_jitter_offset_is_stable_and_bounded() -> None:
+    schedule_id = uuid4()
+
+    assert jitter_offset(schedule_id, 0) == 0
+    assert jitter_offset(schedule_id, 300) == jitter_offset(schedule_id, 300)
+    assert all(0 <= jitter_offset(uuid4(), 60) < 60 for _ in range(100))
+
+
+def test_offset_trigger_shifts_fire_times() -> None:
+    now = datetime(2026, 1, 1, 10, 15, tzinfo=UTC)
+
+    plain = build_trigger("0 * * * *", "UTC")
+    shifted = build_trigger("0 * * * *", "UTC", offset_seconds=42)
+
+    assert plain.get_next_fire_time(None, now) == datetime(2026, 1, 1, 11, 0, tzinfo=UTC)
+    assert shifted.get_next_fire_time(None, now) == datetime(2026, 1, 1, 11, 0, 42, tzinfo=UTC)
+
+
+async def test_plan_catchup_applies_misfire_policy(
+    session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    api_key, _ = await create_test_api_key(session)
+    now = datetime(2026, 1, 1, 12, 30, tzinfo=UTC)
+    last_fired_at = datetime(2026, 1, 1, 7, 0, tzinfo=UTC)
+
+    schedules = {}
+    for policy in MisfirePolicy:
+        automation = await create_test_automation(session, api_key.id, policy.value)
+        schedule = await create_test_schedule(session, automation.id, cron="0 * * * *")
+        schedule.misfire_policy = policy
+        schedule.last_fired_at = last_fired_at
+        schedules[policy] = schedule
+    await session.commit()
+
+    plan = await SchedulerService().plan_catchup(session, now)
+
+    by_schedule: dict[UUID, list[datetime]] = {}
+    for item in plan:
+        by_schedule.setdefault(item.schedule_id, []).append(item.scheduled_for)
+
+    assert schedules[MisfirePolicy.SKIP].id not in by_schedule
+    assert by_schedule[schedules[MisfirePolicy.RUN_ONCE].id] == [
+        datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+    ]
+    assert by_schedule[schedules[MisfirePolicy.RUN_ALL_BOUNDED].id] == [
+        datetime(2026, 1, 1, hour, 0, tzinfo=UTC) for hour in range(8, 13)
+    ]
+
+    # Below the number of missed ticks, the cap keeps the latest ones.
+    monkeypatch.setattr(settings, "schedule_catchup_max_runs", 2)
+    plan = await SchedulerService().plan_catchup(session, now)
+    assert [
+        item.scheduled_for
+        for item in plan
+        if item.schedule_id == schedules[MisfirePolicy.RUN_ALL_BOUNDED].id
+    ] == [datetime(2026, 1, 1, hour, 0, tzinfo=UTC) for hour in (11, 12)]
+
+
+def test_missed_fire_times_is_bounded() -> None:
+    trigger = build_trigger("*/5 * * * *", "UTC")
+    since = datetime(2026, 1, 1, 0, 0, tzinfo=UTC)
+    now = datetime(2026, 1, 2, 0, 0, tzinfo=UTC)
+
+    missed = missed_fire_times(trigger, since, now, limit=3)
+
+    assert missed == [datetime(2026, 1, 1, 23, minute, tzinfo=UTC) for minute in (50, 55)] + [now]
+
+
+def test_compile_cron_is_cached() -> None:
+    assert compile_cron("0 9 * * 1-5", "UTC") is compile_cron("0 9 * * 1-5", "UTC")
+    assert compile_cron("0 9 * * 1-5", "UTC") is not compile_cron("0 9 * * 1-5", "Europe/Berlin")
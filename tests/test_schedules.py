@@ -33,6 +33,62 @@ async def test_create_schedule_invalid_cron(
     assert response.status_code == 422
 
 
+async def test_create_schedule_with_jitter(session: AsyncSession, client: AsyncClient) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+
+    response = await client.put(
+        f"/automations/{automation.id}/schedule",
+        headers={"X-API-Key": raw_key},
+        json={"cron": "0 * * * *", "jitter_seconds": 300},
+    )
+    assert response.status_code == 200
+    assert response.json()["jitter_seconds"] == 300
+
+    response = await client.patch(
+        f"/automations/{automation.id}/schedule",
+        headers={"X-API-Key": raw_key},
+        json={"jitter_seconds": None},
+    )
+    assert response.status_code == 200
+    assert response.json()["jitter_seconds"] is None
+
+
+async def test_create_schedule_invalid_timezone(
+    session: AsyncSession, client: AsyncClient
+) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+
+    response = await client.put(
+        f"/automations/{automation.id}/schedule",
+        headers={"X-API-Key": raw_key},
+        json={"cron": "0 0 * * *", "timezone": "Mars/Olympus_Mons"},
+    )
+    assert response.status_code == 422
+
+
+async def test_preview_next_fire_times(session: AsyncSession, client: AsyncClient) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+
+    await client.put(
+        f"/automations/{automation.id}/schedule",
+        headers={"X-API-Key": raw_key},
+        json={"cron": "*/15 * * * *"},
+    )
+
+    response = await client.get(
+        f"/automations/{automation.id}/schedule/next",
+        headers={"X-API-Key": raw_key},
+        params={"n": 5},
+    )
+    assert response.status_code == 200
+    fire_times = response.json()["fire_times"]
+    assert len(fire_times) == 5
+    assert fire_times == sorted(fire_times)
+
+
 async def test_update_schedule(session: AsyncSession, client: AsyncClient) -> None:
     api_key, raw_key = await create_test_api_key(session)
     automation = await create_test_automation(session, api_key.id)
@@ -0,0 +1,87 @@
+import logging
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from prodapi.config import Settings, settings
+from prodapi.observability.slow_queries import (
+    QueryStatsRegistry,
+    fingerprint,
+    log_slow_queries,
+    query_stats,
+    redact_parameters,
+)
+from prodapi.observability.sql_budget import statement_budget
+
+
+def test_fingerprint_collapses_literals_and_lists() -> None:
+    first = fingerprint("SELECT * FROM runs WHERE id IN (?, ?, ?) AND status = 'failed' LIMIT 50")
+    second = fingerprint("SELECT *\n  FROM runs WHERE id IN ($1, $2) AND status = $3 LIMIT 10")
+
+    assert first == second == "SELECT * FROM runs WHERE id IN (...) AND status = ? LIMIT ?"
+    assert fingerprint("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)") == (
+        "INSERT INTO t (a, b) VALUES (...), ..."
+    )
+
+
+def test_redact_parameters_keeps_only_shapes() -> None:
+    assert redact_parameters(("secret-token", 42, None)) == ["<str:12>", "<int>", None]
+    assert redact_parameters({"key": b"abc"}) == {"key": "<bytes:3>"}
+    assert redact_parameters([("a",), ("bb",)], executemany=True) == {
+        "rows": 2,
+        "first": ["<str:1>"],
+    }
+
+
+async def test_slow_statements_are_aggregated_and_logged(
+    engine: Any, caplog: pytest.LogCaptureFixture
+) -> None:
+    registry = QueryStatsRegistry()
+    log_slow_queries(engine, registry, Settings(slow_query_threshold_ms=0.000001))
+
+    with caplog.at_level(logging.WARNING, logger="prodapi.observability.slow_queries"):
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT :name AS name"), {"name": "alice"})
+            with statement_budget(lambda: "GET /runs", report=False):
+                await conn.execute(text("SELECT :name AS name"), {"name": "bob"})
+
+    [stats] = registry.top()
+    assert stats.fingerprint == "SELECT ? AS name"
+    assert stats.calls == stats.slow_calls == 2
+    assert stats.sources == {"unknown": 1, "GET /runs": 1}
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 2
+    assert "alice" not in messages[0]
+    assert "params=['<str:5>']" in messages[0]
+
+
+async def test_admin_queries_requires_admin_key(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert (await client.get("/admin/queries")).status_code == 404
+
+    monkeypatch.setattr(settings, "admin_api_key", "admin-secret")
+    monkeypatch.setattr(query_stats, "stats", {})
+    query_stats.record("SELECT ? FROM runs", 30.0, False, "GET /runs")
+    query_stats.record("SELECT ? FROM automations", 5.0, False, "GET /automations")
+    query_stats.record("SELECT ? FROM runs", 250.0, True, "GET /runs")
+
+    response = await client.get("/admin/queries", headers={"X-Admin-Key": "wrong"})
+    assert response.status_code == 401
+
+    response = await client.get(
+        "/admin/queries", headers={"X-Admin-Key": "admin-secret"}, params={"limit": 1}
+    )
+    assert response.status_code == 200
+    [top] = response.json()["queries"]
+    assert top["fingerprint"] == "SELECT ? FROM runs"
+    assert top["calls"] == 2
+    assert top["total_ms"] == 280.0
+    assert top["slow_calls"] == 1
+    assert top["sources"] == {"GET /runs": 2}
+
+    response = await client.delete("/admin/queries", headers={"X-Admin-Key": "admin-secret"})
+    assert response.status_code == 204
+    assert query_stats.stats == {}
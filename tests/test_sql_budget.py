@@ -0,0 +1,113 @@
+import logging
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from typing import Any
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from prodapi.automations import REGISTRY
+from prodapi.models import AutomationType, RunStatus
+from prodapi.observability.metrics import SQL_BUDGET_EXCEEDED
+from prodapi.observability.sql_budget import StatementBudget, statement_budget
+from prodapi.services.runner import execute_run
+from tests.factories import create_test_api_key, create_test_automation, create_test_run
+
+MaxStatements = Callable[[int], AbstractContextManager[StatementBudget]]
+
+
+async def test_endpoint_statement_budgets(
+    session: AsyncSession, client: AsyncClient, max_statements: MaxStatements
+) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    run = await create_test_run(session, automation.id, RunStatus.SUCCESS)
+    session.expunge_all()
+    headers = {"X-API-Key": raw_key}
+
+    # Auth is one SELECT; last_used_at is only written on the first request.
+    with max_statements(4):
+        await client.get("/automations", headers=headers)
+    with max_statements(3):
+        await client.get("/automations", headers=headers)
+    with max_statements(2):
+        await client.get(f"/automations/{automation.id}", headers=headers)
+    with max_statements(3):
+        await client.patch(f"/automations/{automation.id}", headers=headers, json={"name": "New"})
+    with max_statements(3):
+        await client.post(
+            "/automations",
+            headers=headers,
+            json={
+                "name": "Digest",
+                "type": "daily_digest",
+                "config_json": {"webhook_url": "https://example.com/hook"},
+            },
+        )
+    with max_statements(2):
+        await client.get("/runs", headers=headers)
+    with max_statements(3):
+        await client.get(f"/runs/{run.id}", headers=headers)
+    with max_statements(2):
+        await client.get(f"/runs/{run.id}/items", headers=headers)
+    with (
+        patch("prodapi.services.runner.execute_run_background", new_callable=AsyncMock),
+        max_statements(3),
+    ):
+        await client.post(f"/automations/{automation.id}/run", headers=headers, json={})
+
+
+async def test_run_statement_budget(
+    session: AsyncSession, max_statements: MaxStatements, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    api_key, _ = await create_test_api_key(session)
+    automation = await create_test_automation(session, api_key.id)
+    run = await create_test_run(session, automation.id)
+    monkeypatch.setattr(
+        REGISTRY[AutomationType.DAILY_DIGEST], "execute", AsyncMock(return_value={"count": 0})
+    )
+
+    with max_statements(4) as budget:
+        await execute_run(session, run.id)
+
+    assert not any("api_keys" in statement for statement in budget.statements)
+
+
+async def test_api_key_last_used_is_written_once_per_window(
+    session: AsyncSession, client: AsyncClient, max_statements: MaxStatements
+) -> None:
+    api_key, raw_key = await create_test_api_key(session)
+
+    with max_statements(10) as budget:
+        for _ in range(3):
+            await client.get(f"/automations/{uuid4()}", headers={"X-API-Key": raw_key})
+
+    updates = [s for s in budget.statements.elements() if s.startswith("UPDATE api_keys")]
+    assert len(updates) == 1
+    assert api_key.last_used_at is not None
+
+
+async def test_budget_overrun_and_repeats_are_logged(
+    engine: Any, max_statements: MaxStatements, caplog: pytest.LogCaptureFixture
+) -> None:
+    before = SQL_BUDGET_EXCEEDED.value("unit")
+
+    with (
+        caplog.at_level(logging.WARNING, logger="prodapi.observability.sql_budget"),
+        statement_budget("unit", limit=2, repeat_threshold=3) as budget,
+    ):
+        async with engine.connect() as conn:
+            for _ in range(3):
+                await conn.execute(select(1))
+            await conn.execute(text("SELECT 2"))
+
+    assert budget.count == 4
+    assert budget.exceeded
+    assert SQL_BUDGET_EXCEEDED.value("unit") == before + 1
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("SQL budget exceeded: 4 statements (budget 2" in m for m in messages)
+    assert any(m.startswith("Possible N+1: 3x in unit") for m in messages)
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from prodapi.observability import tracing
+from prodapi.observability.tracing import (
+    FileSpanExporter,
+    OTLPHttpSpanExporter,
+    Span,
+    Tracer,
+    parse_traceparent,
+    traced,
+)
+
+
+class MemoryExporter:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+
+async def test_spans_nest_and_propagate_into_tasks() -> None:
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter)
+
+    async def background() -> None:
+        with tracer.span("background"):
+            await asyncio.sleep(0)
+
+    with tracer.span("request", kind="server") as root:
+        with tracer.span("child"):
+            pass
+        await asyncio.create_task(background())
+
+    await tracer.flush()
+
+    by_name = {span.name: span for span in exporter.spans}
+    assert by_name["child"].parent_id == root.span_id
+    assert by_name["background"].parent_id == root.span_id
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+    assert tracing.current_span() is None
+
+
+async def test_span_records_errors() -> None:
+    exporter = MemoryExporter()
+    tracer = Tracer(exporter)
+
+    with pytest.raises(RuntimeError), tracer.span("failing"):
+        raise RuntimeError("boom")
+
+    await tracer.flush()
+
+    assert exporter.spans[0].status == "error"
+    assert "boom" in exporter.spans[0].attributes["error"]
+
+
+async def test_disabled_tracer_does_not_record() -> None:
+    tracer = Tracer(None)
+
+    with tracer.span("ignored") as span:
+        assert tracing.current_span() is None
+
+    assert not span.recording
+
+
+async def test_traced_continues_remote_parent(monkeypatch: pytest.MonkeyPatch) -> None:
+    exporter = MemoryExporter()
+    monkeypatch.setattr(tracing, "tracer", Tracer(exporter))
+
+    @traced("work")
+    async def work() -> int:
+        return 42
+
+    remote = parse_traceparent("00-" + "a" * 32 + "-" + "b" * 16 + "-01")
+    with tracing.tracer.span("incoming", remote_parent=remote):
+        assert await work() == 42
+
+    await tracing.tracer.flush()
+
+    incoming = next(span for span in exporter.spans if span.name == "incoming")
+    assert incoming.trace_id == "a" * 32
+    assert incoming.parent_id == "b" * 16
+    assert {span.name for span in exporter.spans} == {"incoming", "work"}
+
+
+def test_parse_traceparent_rejects_malformed_headers() -> None:
+    assert parse_traceparent(None) is None
+    assert parse_traceparent("garbage") is None
+    assert parse_traceparent("00-abc-def-01") is None
+
+
+def test_file_exporter_writes_jsonl(tmp_path: Path) -> None:
+    path = tmp_path / "traces.jsonl"
+    span = Span(name="op", trace_id="a" * 32, span_id="b" * 16, parent_id=None)
+
+    FileSpanExporter(path).export([span, span])
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["name"] == "op"
+
+
+def test_otlp_payload_shape() -> None:
+    span = Span(
+        name="op",
+        trace_id="a" * 32,
+        span_id="b" * 16,
+        parent_id="c" * 16,
+        kind="client",
+        attributes={"http.status_code": 200, "cached": False},
+    )
+
+    payload = OTLPHttpSpanExporter("http://collector").payload([span])
+    otlp_span = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+
+    assert otlp_span["parentSpanId"] == "c" * 16
+    assert otlp_span["kind"] == 3
+    assert {"key": "http.status_code", "value": {"intValue": "200"}} in otlp_span["attributes"]
+    assert {"key": "cached", "value": {"boolValue": False}} in otlp_span["attributes"]